@@ -5,11 +5,13 @@ import pytorch_lightning as pl
 
 # make core features and version number accessible
 from ._version import __version__  # noqa: F401
+from .crossvalidation import cross_validate  # noqa: F401
 from .df_utils import add_quarter_condition, add_weekday_condition, split_df  # noqa: F401
 from .forecaster import NeuralProphet  # noqa: F401
+from .plot_export import export_figures  # noqa: F401
 from .torch_prophet import TorchProphet  # noqa: F401
 from .uncertainty import uncertainty_evaluate  # noqa: F401
-from .utils import load, save, set_log_level, set_random_seed  # noqa: F401
+from .utils import convert, load, save, set_log_level, set_random_seed  # noqa: F401
 
 # Reduce lightning logs
 warnings.simplefilter(action="ignore", category=pl.utilities.warnings.PossibleUserWarning)
@@ -1,3 +1,5 @@
+import itertools
+
 import numpy as np
 import torch
 import torch.nn as nn
@@ -53,6 +55,44 @@ class PiecewiseLinearTrend(Trend):
     def forward(self, t, meta):
         """Computes trend based on model configuration.
 
+        Parameters
+        ----------
+            t : torch.Tensor float
+                normalized time, dim: (batch, n_forecasts)
+            meta: dict
+                Metadata about the all the samples of the model input batch. Contains the following:
+                    * ``df_name`` (list, str), time series ID corresponding to each sample of the input batch.
+        Returns
+        -------
+            torch.Tensor
+                Trend component, same dimensions as input t
+
+        """
+        # Variables identifying, for t, the corresponding trend segment (for each sample of the batch).
+        # dimensions - batch_size, n_forecasts
+        segment_id = self.compute_segment_id(t)
+
+        # Slope and offset of every segment.
+        # dimensions - num_trends_modelled, segments (+ 1), quantiles_size
+        k_table, m_table = self.get_segment_tables()
+
+        # Gather the slope and offset of the current segment for each sample of the batch.
+        # dimensions - batch_size, n_forecasts, quantiles_size
+        k_t = self.gather_segments(k_table, segment_id, meta)
+        m_t = self.gather_segments(m_table, segment_id, meta)
+
+        # Computing trend value at time(t) for each batch sample.
+        # dimensions - batch_size, n_forecasts, quantiles_size
+        trend = k_t * t.unsqueeze(dim=2) + m_t
+
+        return self.bias.unsqueeze(dim=0).unsqueeze(dim=0) + trend
+
+    def forward_one_hot(self, t, meta):
+        """Computes trend based on model configuration, using a one-hot encoding of the trend segments.
+
+        Reference implementation of ``forward``. Materializes tensors of dims (batch, n_forecasts, segments),
+        which makes it considerably more memory-hungry for large numbers of changepoints.
+
         Parameters
         ----------
             t : torch.Tensor float
@@ -93,6 +133,96 @@ class PiecewiseLinearTrend(Trend):
 
         return self.bias.unsqueeze(dim=0).unsqueeze(dim=0) + trend
 
+    def compute_segment_id(self, t):
+        """Identifies the trend segment of each time t.
+
+        Parameters
+        ----------
+            t : torch.Tensor float
+                normalized time, dim: (batch, n_forecasts)
+        Returns
+        -------
+            torch.Tensor, int
+                segment id (number of changepoints <= t), dim: (batch, n_forecasts)
+        """
+        # Changepoints are sorted; equivalent to summing ``t >= changepoints``.
+        changepoints_t = self.trend_changepoints_t[1:].to(dtype=t.dtype)
+        return torch.searchsorted(changepoints_t, t.contiguous(), right=True)
+
+    def compute_segment_tables(self):
+        """Computes the trend slope and offset of every segment.
+
+        The trend at time t in segment i is ``k_table[i] * t + m_table[i]``.
+
+        Returns
+        -------
+            torch.Tensor, torch.Tensor
+                k_table, m_table, each of dims (num_trends_modelled, segments (+ 1), quantiles_size)
+        """
+        # dimensions - quantiles, num_trends_modelled, segments
+        if self.segmentwise_trend:
+            k_table = self.trend_deltas
+        else:
+            # The slope of a segment is the sum of the slope differences of all previous segments.
+            k_table = torch.cumsum(self.trend_deltas, dim=2)
+        k_table = self.trend_k0 + k_table
+
+        if self.config_trend.growth != "discontinuous":
+            if self.segmentwise_trend:
+                deltas = self.trend_deltas[:, :, :] - torch.cat((self.trend_k0, self.trend_deltas[:, :, 0:-1]), dim=2)
+            else:
+                deltas = self.trend_deltas
+            # dimensions - quantiles, num_trends_modelled, segments
+            gammas = -self.trend_changepoints_t[1:] * deltas[:, :, 1:]
+            m_table = torch.cat((torch.zeros_like(gammas[:, :, :1]), torch.cumsum(gammas, dim=2)), dim=2)
+            if not self.segmentwise_trend:
+                m_table = m_table.detach()
+        else:
+            m_table = self.trend_m
+
+        return k_table.permute(1, 2, 0), m_table.permute(1, 2, 0)
+
+    def get_segment_tables(self):
+        """Returns the trend slope and offset of every segment, see ``compute_segment_tables``.
+
+        When no gradients are required (e.g. in predict mode), the tables are computed once and reused until
+        any of the trend parameters or changepoints are modified.
+
+        Returns
+        -------
+            torch.Tensor, torch.Tensor
+                k_table, m_table, each of dims (num_trends_modelled, segments (+ 1), quantiles_size)
+        """
+        if torch.is_grad_enabled() or torch._dynamo.is_compiling():
+            return self.compute_segment_tables()
+        # Parameters are updated in-place by the optimizer, which bumps their version counter.
+        key = tuple((x.data_ptr(), x._version) for x in itertools.chain(self.parameters(), self.buffers()))
+        if getattr(self, "_segment_tables_key", None) != key:
+            self._segment_tables = self.compute_segment_tables()
+            self._segment_tables_key = key
+        return self._segment_tables
+
+    def gather_segments(self, table, segment_id, meta):
+        """Looks up per-segment values for each sample of the batch.
+
+        Parameters
+        ----------
+            table : torch.Tensor, float
+                values per segment, dims (num_trends_modelled, segments (+ 1), quantiles_size)
+            segment_id : torch.Tensor, int
+                segment corresponding to time t (batch_size, n_forecasts)
+            meta : torch.Tensor, int
+                time series ID index of each sample of the batch, dims (batch_size)
+        Returns
+        -------
+            torch.Tensor
+                values of the current segment, dims (batch_size, n_forecasts, quantiles_size)
+        """
+        if self.config_trend.trend_global_local == "local":
+            # Flatten the trend and segment dimensions to look up both at once
+            segment_id = meta.unsqueeze(dim=1) * table.shape[1] + segment_id
+        return nn.functional.embedding(segment_id, table.reshape(-1, table.shape[-1]))
+
     @property
     def get_trend_deltas(self):
         """trend deltas for regularization.
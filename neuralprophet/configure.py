@@ -9,7 +9,7 @@ from typing import Callable, Dict, List, Optional, Type, Union
 import numpy as np
 import torch
 
-from neuralprophet import configure_components, df_utils
+from neuralprophet import configure_components, df_utils, np_types
 from neuralprophet.custom_loss_metrics import PinballLoss
 
 log = logging.getLogger("NP.config")
@@ -20,6 +20,7 @@ class Model:
     n_forecasts: int
     quantiles: Optional[List[float]] = None
     prediction_frequency: Optional[Dict[str]] = None
+    sparse_events: bool = False
     max_lags: Optional[int] = field(init=False)
 
     def setup_quantiles(self):
@@ -147,17 +148,37 @@ class Train:
     n_data: int = field(init=False)
     loss_func_name: str = field(init=False)
     pl_trainer_config: dict = field(default_factory=dict)
+    precision: np_types.PrecisionMode = "32-true"
+    compile: bool = False
 
     def __post_init__(self):
         assert self.newer_samples_weight >= 1.0
         assert self.newer_samples_start >= 0.0
         assert self.newer_samples_start < 1.0
+        self.set_precision(self.precision)
         # self.set_loss_func(self.quantiles)
 
         # called in TimeNet configure_optimizers:
         # self.set_optimizer()
         # self.set_scheduler()
 
+    def set_precision(self, precision: np_types.PrecisionMode):
+        """
+        Set the numerical precision used for training and prediction.
+
+        Parameters
+            ----------
+                precision : str
+                    ``32`` for full float32 precision, ``bf16`` for bfloat16 autocast with float32 weights.
+        """
+        precision = str(precision).lower()
+        if precision in ["32", "32-true"]:
+            self.precision = "32-true"
+        elif precision in ["bf16", "bf16-mixed"]:
+            self.precision = "bf16-mixed"
+        else:
+            raise ValueError(f"Precision {precision} is not supported. Options: '32', 'bf16'.")
+
     def set_loss_func(self, quantiles: List[float]):
         if isinstance(self.loss_func, str):
             if self.loss_func.lower() in ["smoothl1", "smoothl1loss", "huber"]:
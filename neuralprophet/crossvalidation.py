@@ -0,0 +1,209 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import torch
+
+log = logging.getLogger("NP.crossvalidation")
+
+# Base dataframe and fit arguments of a worker process, set by the pool initializer
+_worker_state = {}
+
+
+def cross_validate(
+    model_factory: Callable,
+    df: pd.DataFrame,
+    k: int = 5,
+    fold_pct: float = 0.1,
+    fold_overlap_pct: float = 0.5,
+    freq: str = "auto",
+    global_model_cv_type: str = "global-time",
+    num_workers: Optional[int] = None,
+    num_threads: Optional[int] = None,
+    fit_kwargs: Optional[dict] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Crossvalidates a model over k folds, fitting the folds in parallel processes.
+
+    The data is checked once, see :meth:`NeuralProphet.crossvalidation_fold_ranges`. The resulting base
+    dataframe is placed in shared memory, from which each worker process fits its folds given as row ranges.
+    Folds cover the same dates as the folds of :meth:`NeuralProphet.crossvalidation_split_df`. Imputation and
+    normalization are fitted per fold, as part of fitting the model.
+
+    Parameters
+    ----------
+        model_factory : callable
+            function without arguments, returning a new (not fitted) ``NeuralProphet`` model.
+
+            Note
+            ----
+            Worker processes are spawned, the factory therefore needs to be importable, e.g. a module level function.
+        df : pd.DataFrame
+            dataframe containing column ``ds``, ``y``, and optionally``ID`` with all data
+        k : int
+            number of CV folds
+        fold_pct : float
+            percentage of overall samples to be in each fold
+        fold_overlap_pct : float
+            percentage of overlap between the validation folds.
+        freq : str
+            data step sizes. Frequency of data recording, ``auto`` (default) to automatically set frequency.
+        global_model_cv_type : str
+            Type of crossvalidation to apply to a dataframe with many time series,
+            see :meth:`NeuralProphet.crossvalidation_split_df`.
+        num_workers : int
+            number of worker processes. Defaults to the number of folds, limited by the number of CPUs.
+            With ``0`` or ``1`` worker, the folds are fitted sequentially in the current process.
+        num_threads : int
+            number of torch threads of each worker process.
+            Defaults to the number of CPUs divided by the number of workers.
+        fit_kwargs : dict
+            additional arguments passed to ``fit`` of each fold model, e.g. ``{"epochs": 10, "progress": None}``.
+
+    Returns
+    -------
+        pd.DataFrame
+            metrics of the last training epoch of each fold, one row per fold,
+            validation metrics are suffixed with ``_val``
+        pd.DataFrame
+            mean and standard deviation of each metric over all folds
+
+    Examples
+    --------
+        >>> from neuralprophet import NeuralProphet, cross_validate
+        >>> def model_factory():
+        ...     return NeuralProphet(n_lags=7, n_forecasts=3, epochs=20)
+        >>> fold_metrics, summary = cross_validate(model_factory, df, k=5, num_workers=5)
+    """
+    df_base, folds, freq = model_factory().crossvalidation_fold_ranges(
+        df,
+        freq=freq,
+        k=k,
+        fold_pct=fold_pct,
+        fold_overlap_pct=fold_overlap_pct,
+        global_model_cv_type=global_model_cv_type,
+    )
+    fit_kwargs = dict({} if fit_kwargs is None else fit_kwargs, freq=freq)
+
+    cpu_count = os.cpu_count() or 1
+    if num_workers is None:
+        num_workers = min(len(folds), cpu_count)
+    if num_threads is None:
+        num_threads = max(1, cpu_count // max(1, num_workers))
+
+    if num_workers <= 1:
+        _worker_state.update(df=df_base, model_factory=model_factory, fit_kwargs=fit_kwargs)
+        try:
+            results = [_fit_fold(i, train_rows, val_rows) for i, (train_rows, val_rows) in enumerate(folds)]
+        finally:
+            _worker_state.clear()
+    else:
+        shms, spec = share_dataframe(df_base)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(spec, model_factory, fit_kwargs, num_threads),
+            ) as pool:
+                futures = [
+                    pool.submit(_fit_fold, i, train_rows, val_rows) for i, (train_rows, val_rows) in enumerate(folds)
+                ]
+                results = [future.result() for future in futures]
+        finally:
+            for shm in shms:
+                shm.close()
+                shm.unlink()
+
+    fold_metrics = pd.DataFrame(results).set_index("fold")
+    summary = fold_metrics.agg(["mean", "std"])
+    return fold_metrics, summary
+
+
+def share_dataframe(df: pd.DataFrame) -> Tuple[List[shared_memory.SharedMemory], dict]:
+    """Copies the columns of a dataframe into shared memory blocks.
+
+    Text columns (e.g. ``ID``) are stored as integer codes of their categories.
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            dataframe to share
+
+    Returns
+    -------
+        list of SharedMemory
+            shared memory blocks, to be closed and unlinked by the caller when no longer needed
+        dict
+            specification of the blocks, to attach to them with :func:`attach_dataframe`
+    """
+    shms = []
+    columns = []
+    for name in df.columns:
+        values = df[name]
+        categories = None
+        if values.dtype == object or isinstance(values.dtype, pd.CategoricalDtype):
+            # Missing values get a category of their own, instead of the sentinel code -1
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            values, categories = codes.astype(np.int32), list(uniques)
+        array = np.ascontiguousarray(values.to_numpy() if isinstance(values, pd.Series) else values)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+        shms.append(shm)
+        columns.append({"name": name, "shm": shm.name, "dtype": array.dtype.str, "categories": categories})
+    return shms, {"n_rows": len(df), "columns": columns}
+
+
+def attach_dataframe(spec: dict) -> Tuple[pd.DataFrame, List[shared_memory.SharedMemory]]:
+    """Rebuilds a dataframe from shared memory blocks created by :func:`share_dataframe`.
+
+    Meant to be called in the creating process or in processes spawned by it.
+
+    Parameters
+    ----------
+        spec : dict
+            specification of the shared memory blocks
+
+    Returns
+    -------
+        pd.DataFrame
+            shared dataframe
+        list of SharedMemory
+            attached blocks, which need to stay referenced while the dataframe is in use
+    """
+    shms = []
+    data = {}
+    for column in spec["columns"]:
+        # Spawned workers share the resource tracker of the creating process, which owns and unlinks the block.
+        # Attaching registers the block again with that tracker, which is harmless, while unregistering it here
+        # would drop the registration of the creating process.
+        shm = shared_memory.SharedMemory(name=column["shm"])
+        shms.append(shm)
+        values = np.ndarray((spec["n_rows"],), dtype=np.dtype(column["dtype"]), buffer=shm.buf)
+        if column["categories"] is not None:
+            values = np.asarray(column["categories"], dtype=object)[values]
+        data[column["name"]] = values
+    return pd.DataFrame(data, copy=False), shms
+
+
+def _init_worker(spec: dict, model_factory: Callable, fit_kwargs: dict, num_threads: int):
+    torch.set_num_threads(num_threads)
+    df, shms = attach_dataframe(spec)
+    _worker_state.update(df=df, shms=shms, model_factory=model_factory, fit_kwargs=fit_kwargs)
+
+
+def _fit_fold(fold: int, train_rows: List[Tuple[int, int]], val_rows: List[Tuple[int, int]]) -> dict:
+    m = _worker_state["model_factory"]()
+    metrics = m.fit(_worker_state["df"], rows=train_rows, validation_rows=val_rows, **_worker_state["fit_kwargs"])
+    result = {
+        "fold": fold,
+        "n_train": sum(stop - start for start, stop in train_rows),
+        "n_val": sum(stop - start for start, stop in val_rows),
+    }
+    if metrics is not None and len(metrics) > 0:
+        result.update(metrics.iloc[-1].drop("epoch", errors="ignore").to_dict())
+    return result
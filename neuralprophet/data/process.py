@@ -408,6 +408,20 @@ def _check_dataframe(
         future=True if future else None,
     )
 
+    _remove_regressors(model, regressors_to_remove, lag_regressors_to_remove)
+    return df
+
+
+def _remove_regressors(model, regressors_to_remove: list, lag_regressors_to_remove: list):
+    """Removes regressors from the model configuration, e.g. if they are not present in the data.
+
+    Parameters
+    ----------
+        regressors_to_remove : list
+            names of future regressors to remove
+        lag_regressors_to_remove : list
+            names of lagged regressors to remove
+    """
     if model.config_regressors.regressors is not None:
         for reg in regressors_to_remove:
             log.warning(f"Removing regressor {reg} because it is not present in the data.")
@@ -420,7 +434,6 @@ def _check_dataframe(
             model.config_lagged_regressors.regressors.pop(reg)
         if len(model.config_lagged_regressors.regressors) == 0:
             model.config_lagged_regressors.regressors = None
-    return df
 
 
 def _handle_missing_data(
@@ -1,6 +1,7 @@
 import logging
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from neuralprophet import configure_components, df_utils
@@ -129,27 +130,32 @@ def _make_future_dataframe(
     events_df: Optional[pd.DataFrame],
     regressors_df: Optional[pd.DataFrame],
     periods: Optional[int],
-    n_historic_predictions: int,
+    n_historic_predictions: Union[bool, int],
     n_forecasts: int,
     max_lags: int,
     freq: Optional[str],
 ) -> pd.DataFrame:
     """
-    Generate a future dataframe by extending the input dataframe into the future.
+    Generate a future dataframe by extending each time series of the input dataframe into the future.
+
+    All time series are extended at once: the last dates are taken from a single groupby, the future dates of all
+    time series are generated together, and future events and regressors are joined by merges.
 
     Parameters
     ----------
     model : NeuralProphet
         The model object used for prediction.
     df : pd.DataFrame
-        The input dataframe with a single ID column and a 'ds' column containing timestamps.
+        The input dataframe with an 'ID' column and a 'ds' column containing timestamps.
     events_df : pd.DataFrame, optional
         The dataframe containing information about external events.
+        Events of a single time series are identified by an 'ID' column, without it they apply to all time series.
     regressors_df : pd.DataFrame, optional
         The dataframe containing information about external regressors.
+        Regressors of a single time series are identified by an 'ID' column, without it they apply to all time series.
     periods : int
         The number of steps to extend the DataFrame into the future.
-    n_historic_predictions : int
+    n_historic_predictions : bool, int
         The number of historic predictions to include in the output dataframe.
     n_forecasts : int
         identical to NeuralProphet
@@ -161,81 +167,102 @@ def _make_future_dataframe(
     Returns
     -------
     pd.DataFrame
-        The extended dataframe with additional rows for future periods.
+        The extended dataframe with additional rows for future periods, ordered by ID.
 
     Raises
     ------
     ValueError
         If future values of all user specified regressors not provided.
     """
-    # Receives df with single ID column
-    assert len(df["ID"].unique()) == 1
+    # Receives df with ID column
     if periods == 0 and n_historic_predictions is True:
         log.warning(
             "Not extending df into future as no periods specified. You can skip this and predict directly instead."
         )
-    _ = df_utils.infer_frequency(df, n_lags=max_lags, freq=freq)
-    last_date = pd.to_datetime(df["ds"].copy(deep=True).dropna()).sort_values().max()
-    if events_df is not None:
-        events_df = events_df.reset_index(drop=True)
-    if regressors_df is not None:
-        regressors_df = regressors_df.reset_index(drop=True)
+    for other_df, other_df_name in [(events_df, "events"), (regressors_df, "regressors")]:
+        if other_df is not None and "ID" in other_df.columns:
+            missing_names = sorted(set(other_df["ID"].unique()) - set(df["ID"].unique()))
+            if len(missing_names) > 0:
+                raise ValueError(
+                    f"ID(s) {missing_names} from {other_df_name} df is not valid - missing from original df ID column"
+                )
+
+    # Time series are ordered by ID, each keeping the order of its rows
+    codes, df_names = pd.factorize(df["ID"], sort=True)
+    order = np.argsort(codes, kind="stable")
+    df = df.iloc[order]
+    codes = codes[order]
+    sizes = np.bincount(codes, minlength=len(df_names))
+    last_dates = pd.to_datetime(df["ds"]).groupby(codes).max()
+
     if periods is None:
         periods = 1 if max_lags == 0 else n_forecasts
     else:
         assert periods >= 0
 
     if isinstance(n_historic_predictions, bool):
-        if n_historic_predictions:
-            n_historic_predictions = len(df) - max_lags
-        else:
-            n_historic_predictions = 0
-    elif not isinstance(n_historic_predictions, int):
+        n_historic = sizes - max_lags if n_historic_predictions else np.zeros_like(sizes)
+    elif isinstance(n_historic_predictions, int):
+        n_historic = np.full_like(sizes, n_historic_predictions)
+    else:
         log.error("non-integer value for n_historic_predictions set to zero.")
-        n_historic_predictions = 0
+        n_historic = np.zeros_like(sizes)
 
-    if periods == 0 and n_historic_predictions == 0:
+    if periods == 0 and (n_historic == 0).any():
         raise ValueError("Set either history or future to contain more than zero values.")
 
     # check for external regressors known in future
     if model.config_regressors.regressors is not None and periods > 0:
-        if regressors_df is None:
+        if regressors_df is None or (
+            "ID" in regressors_df.columns and len(set(df_names) - set(regressors_df["ID"].unique())) > 0
+        ):
             raise ValueError("Future values of all user specified regressors not provided")
         else:
             for regressor in model.config_regressors.regressors.keys():
                 if regressor not in regressors_df.columns:
                     raise ValueError(f"Future values of user specified regressor {regressor} not provided")
 
-    if len(df) < max_lags:
+    if (sizes < max_lags).any():
         raise ValueError(
             "Insufficient input data for a prediction."
             "Please supply historic observations (number of rows) of at least max_lags (max of number of n_lags)."
         )
-    elif len(df) < max_lags + n_historic_predictions:
+    insufficient = sizes < max_lags + n_historic
+    if insufficient.any():
         log.warning(
-            f"Insufficient data for {n_historic_predictions} historic forecasts, reduced to {len(df) - max_lags}."
+            f"Insufficient data for {n_historic[insufficient].max()} historic forecasts of {insufficient.sum()} time "
+            "series, reduced to their available history."
         )
-        n_historic_predictions = len(df) - max_lags
-    if (n_historic_predictions + max_lags) == 0:
-        df = pd.DataFrame(columns=df.columns)
-    else:
-        df = df[-(max_lags + n_historic_predictions) :]
-        nan_at_end = 0
-        while len(df) > nan_at_end and df["y"].isnull().iloc[-(1 + nan_at_end)]:
-            nan_at_end += 1
-        if nan_at_end > 0:
-            if max_lags > 0 and (nan_at_end + 1) >= max_lags:
+        n_historic = np.minimum(n_historic, sizes - max_lags)
+
+    # Keep the last max_lags + n_historic rows of each time series
+    ends = np.cumsum(sizes)
+    keep = ends[codes] - np.arange(len(df)) <= (max_lags + n_historic)[codes]
+    df = df.iloc[np.flatnonzero(keep)].copy()
+    codes = codes[keep]
+    if len(df) > 0:
+        sizes = np.bincount(codes, minlength=len(df_names))
+        ends = np.cumsum(sizes)
+        observed = df["y"].notnull().to_numpy()
+        last_observed = ends - sizes - 1
+        np.maximum.at(last_observed, codes[observed], np.flatnonzero(observed))
+        nan_at_end = ends - 1 - last_observed
+        if nan_at_end.max() > 0:
+            if max_lags > 0 and (nan_at_end.max() + 1) >= max_lags:
                 raise ValueError(
-                    f"{nan_at_end + 1} missing values were detected at the end of df before df was extended into "
+                    f"{nan_at_end.max() + 1} missing values were detected at the end of df before df was extended into "
                     "the future. Please make sure there are no NaN values at the end of df."
                 )
-            df["y"].iloc[-(nan_at_end + 1) :].ffill(inplace=True)
+            fill = np.flatnonzero(~observed & (np.arange(len(df)) > last_observed[codes]))
+            fill = fill[last_observed[codes[fill]] >= (ends - sizes)[codes[fill]]]
+            y = df["y"].to_numpy(copy=True)
+            y[fill] = y[last_observed[codes[fill]]]
+            df["y"] = y
             log.warning(
-                f"{nan_at_end + 1} missing values were forward-filled at the end of df before df was extended into the "
-                "future. Please make sure there are no NaN values at the end of df."
+                f"{nan_at_end.max() + 1} missing values were forward-filled at the end of df before df was extended "
+                "into the future. Please make sure there are no NaN values at the end of df."
             )
 
-    if len(df) > 0:
         if len(df.columns) == 1 and "ds" in df:
             assert max_lags == 0
             df = _check_dataframe(model, df, check_y=False, exogenous=False)
@@ -243,7 +270,13 @@ def _make_future_dataframe(
             df = _check_dataframe(model, df, check_y=max_lags > 0, exogenous=True, future=True)
     # future data
     # check for external events known in future
-    if model.config_events is not None and periods > 0 and events_df is None:
+    if (
+        model.config_events is not None
+        and periods > 0
+        and (
+            events_df is None or ("ID" in events_df.columns and len(set(df_names) - set(events_df["ID"].unique())) > 0)
+        )
+    ):
         log.warning(
             "Future values not supplied for user specified events. "
             "All events being treated as not occurring in future"
@@ -255,9 +288,10 @@ def _make_future_dataframe(
             log.warning(f"Number of forecast steps is defined by n_forecasts. Adjusted to {n_forecasts}.")
 
     if periods > 0:
-        future_df = df_utils.make_future_df(
+        future_df = df_utils.make_future_panel_df(
             df_columns=df.columns,
-            last_date=last_date,
+            df_names=df_names,
+            last_dates=last_dates,
             periods=periods,
             freq=freq,
             config_events=model.config_events,
@@ -266,7 +300,9 @@ def _make_future_dataframe(
             regressors_df=regressors_df,
         )
         if len(df) > 0:
-            df = pd.concat([df, future_df])
+            # Each time series is followed by its future
+            codes = np.concatenate((codes, np.repeat(np.arange(len(df_names)), periods)))
+            df = pd.concat([df, future_df]).iloc[np.argsort(codes, kind="stable")]
         else:
             df = future_df
     df = df.reset_index(drop=True)
@@ -431,7 +431,7 @@ def check_dataframe(
         raise ValueError("Found NaN in column ds.")
     if not np.issubdtype(df["ds"].to_numpy().dtype, np.datetime64):
         df["ds"] = pd.to_datetime(df.loc[:, "ds"], utc=True).dt.tz_convert(None)
-    if df.groupby("ID").apply(lambda x: x.duplicated("ds").any()).any():
+    if df.duplicated(["ID", "ds"]).any():
         raise ValueError("Column ds has duplicate values. Please remove duplicates.")
 
     regressors_to_remove = []
@@ -526,21 +526,56 @@ def _crossvalidation_split_df(df, n_lags, n_forecasts, k, fold_pct, fold_overlap
     """
     # Receives df with single ID column
     assert len(df["ID"].unique()) == 1
+    folds = _crossvalidation_fold_ranges_single(len(df), 0, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct)
+    return [(select_rows(df, train_rows), select_rows(df, val_rows)) for train_rows, val_rows in folds]
+
+
+def _crossvalidation_fold_ranges_single(n_rows, start, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct=0.0):
+    """Computes the k crossvalidation folds of a single time series as row ranges.
+
+    Parameters
+    ----------
+        n_rows : int
+            number of rows of the time series
+        start : int
+            row position of the first row of the time series
+        n_lags : int
+            identical to NeuralProphet
+        n_forecasts : int
+            identical to NeuralProphet
+        k : int
+            number of CV folds
+        fold_pct : float
+            percentage of overall samples to be in each fold
+        fold_overlap_pct : float
+            percentage of overlap between the validation folds (default: 0.0)
+
+    Returns
+    -------
+        list of k tuples [(train_rows, val_rows), ...]
+
+            training rows ``[(start, stop)]``
+
+            validation rows ``[(start, stop)]``
+    """
     if n_lags == 0:
         assert n_forecasts == 1
-    total_samples = len(df) - n_lags + 2 - (2 * n_forecasts)
+    total_samples = n_rows - n_lags + 2 - (2 * n_forecasts)
     samples_fold = max(1, int(fold_pct * total_samples))
     samples_overlap = int(fold_overlap_pct * samples_fold)
     assert samples_overlap < samples_fold
     min_train = total_samples - samples_fold - (k - 1) * (samples_fold - samples_overlap)
     assert min_train >= samples_fold
     folds = []
-    df_fold = df
+    n_fold = n_rows
     for i in range(k, 0, -1):
-        df_train, df_val = split_df(df_fold, n_lags, n_forecasts, valid_p=samples_fold, inputs_overbleed=True)
-        folds.append((df_train, df_val))
-        split_idx = len(df_fold) - samples_fold + samples_overlap
-        df_fold = df_fold.iloc[:split_idx].reset_index(drop=True)
+        # identical to split_df with valid_p=samples_fold and inputs_overbleed=True, applied to the first n_fold rows
+        n_train = n_fold - n_lags + 2 - (2 * n_forecasts) - samples_fold
+        assert n_train > 1
+        split_idx_train = min(n_train + n_lags + n_forecasts - 1, n_fold)
+        split_idx_val = split_idx_train - n_lags
+        folds.append(([(start, start + split_idx_train)], [(start + split_idx_val, start + n_fold)]))
+        n_fold = n_fold - samples_fold + samples_overlap
     folds = folds[::-1]
     return folds
 
@@ -628,8 +663,46 @@ def _crossvalidation_with_time_threshold(df, n_lags, n_forecasts, k, fold_pct, f
 
             validation data
     """
-    df_merged = merge_dataframes(df.copy(deep=True))
-    total_samples = len(df_merged) - n_lags + 2 - (2 * n_forecasts)
+    df = _group_rows_by_id(df)
+    folds = _crossvalidation_fold_ranges_time_threshold(df, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct)
+    return [(select_rows(df, train_rows), select_rows(df, val_rows)) for train_rows, val_rows in folds]
+
+
+def _crossvalidation_fold_ranges_time_threshold(df, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct=0.0):
+    """Computes the k crossvalidation folds according to time thresholds as row ranges.
+
+    Equivalent to splitting with :func:`find_time_threshold` and :func:`split_considering_timestamp`, but operates on
+    the ``ds`` values of each time series instead of copying the data of each fold.
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            data with column ``ds``, ``y``, and ``ID``, with the rows of each ``ID`` being contiguous
+        n_lags : int
+            identical to NeuralProphet
+        n_forecasts : int
+            identical to NeuralProphet
+        k : int
+            number of CV folds
+        fold_pct : float
+            percentage of overall samples to be in each fold
+        fold_overlap_pct : float
+            percentage of overlap between the validation folds (default: 0.0)
+
+    Returns
+    -------
+        list of k tuples [(train_rows, val_rows), ...]
+
+            training rows ``[(start, stop), ...]``
+
+            validation rows ``[(start, stop), ...]``
+    """
+    id_ranges = _id_row_ranges(df)
+    starts = [start for start, _ in id_ranges]
+    ds = [df["ds"].to_numpy()[start:stop] for start, stop in id_ranges]
+    # sorted, unique ds of all time series, as in merge_dataframes
+    ds_merged = np.unique(np.concatenate(ds))
+    total_samples = len(ds_merged) - n_lags + 2 - (2 * n_forecasts)
     samples_fold = max(1, int(fold_pct * total_samples))
     samples_overlap = int(fold_overlap_pct * samples_fold)
     assert samples_overlap < samples_fold
@@ -637,21 +710,28 @@ def _crossvalidation_with_time_threshold(df, n_lags, n_forecasts, k, fold_pct, f
     assert min_train >= samples_fold
     folds = []
     for i in range(k, 0, -1):
-        threshold_time_stamp = find_time_threshold(df, n_lags, n_forecasts, samples_fold, inputs_overbleed=True)
-        df_train, df_val = split_considering_timestamp(
-            df, n_lags, n_forecasts, inputs_overbleed=True, threshold_time_stamp=threshold_time_stamp
-        )
-        folds.append((df_train, df_val))
-        split_idx = len(df_merged) - samples_fold + samples_overlap
-        df_merged = df_merged[:split_idx].reset_index(drop=True)
-        threshold_time_stamp = df_merged["ds"].iloc[-1]
-        df_fold_aux = pd.DataFrame()
-        for df_name, df_i in df.groupby("ID"):
-            # df_i = df_i.copy(deep=True)
-            df_aux = df_i.iloc[: len(df_i[df_i["ds"] < threshold_time_stamp]) + 1].reset_index(drop=True)
-            df_fold_aux = pd.concat((df_fold_aux, df_aux), ignore_index=True)
-        df = df_fold_aux
-        # df = df.copy(deep=True)
+        # time threshold of the current fold, as in find_time_threshold with valid_p=samples_fold
+        ds_fold = np.unique(np.concatenate(ds))
+        n_train = len(ds_fold) - n_lags + 2 - (2 * n_forecasts) - samples_fold
+        threshold_time_stamp = ds_fold[n_train]
+        train_rows = []
+        val_rows = []
+        for start, ds_i in zip(starts, ds):
+            if ds_i.max() < threshold_time_stamp:
+                train_rows.append((start, start + len(ds_i)))
+            elif ds_i.min() > threshold_time_stamp:
+                val_rows.append((start, start + len(ds_i)))
+            else:
+                n_train_i = int((ds_i < threshold_time_stamp).sum())
+                split_idx_train = n_train_i + n_lags + n_forecasts - 1
+                split_idx_val = split_idx_train - n_lags
+                train_rows.append((start, start + min(split_idx_train, len(ds_i))))
+                val_rows.append((start + min(split_idx_val, len(ds_i)), start + len(ds_i)))
+        folds.append(([r for r in train_rows if r[1] > r[0]], [r for r in val_rows if r[1] > r[0]]))
+        # the next fold keeps the data of each time series up to and including the new time threshold
+        ds_merged = ds_merged[: len(ds_merged) - samples_fold + samples_overlap]
+        threshold_time_stamp = ds_merged[-1]
+        ds = [ds_i[: int((ds_i < threshold_time_stamp).sum()) + 1] for ds_i in ds]
     folds = folds[::-1]
     return folds
 
@@ -698,40 +778,129 @@ def crossvalidation_split_df(
             validation data
     """
     df, _, _, _ = check_multiple_series_id(df)
-    folds = []
-    if len(df["ID"].unique()) == 1:
-        for df_name, df_i in df.groupby("ID"):
-            folds = _crossvalidation_split_df(df_i, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct)
-    else:
-        if global_model_cv_type == "global-time" or global_model_cv_type is None:
-            # Use time threshold to perform crossvalidation
-            # (the distribution of data of different episodes may not be equivalent)
-            folds = _crossvalidation_with_time_threshold(df, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct)
-        elif global_model_cv_type == "local":
-            # Crossvalidate time series locally (time leakage may be a problem)
-            folds_dict = {}
-            for df_name, df_i in df.groupby("ID"):
-                folds_dict[df_name] = _crossvalidation_split_df(
-                    df_i, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct
-                )
-            folds = unfold_dict_of_folds(folds_dict, k)
-        elif global_model_cv_type == "intersect":
-            # Use data only from the time period of intersection among time series
-            folds_dict = {}
-            # Check for intersection of time so time leakage does not occur among different time series
-            start_date, end_date = find_valid_time_interval_for_cv(df)
-            for df_name, df_i in df.groupby("ID"):
-                mask = (df_i["ds"] >= start_date) & (df_i["ds"] <= end_date)
-                df_i = df_i[mask]
-                folds_dict[df_name] = _crossvalidation_split_df(
-                    df_i, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct
+    df = _group_rows_by_id(df)
+    folds = crossvalidation_fold_ranges(
+        df, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct, global_model_cv_type=global_model_cv_type
+    )
+    return [(select_rows(df, train_rows), select_rows(df, val_rows)) for train_rows, val_rows in folds]
+
+
+def crossvalidation_fold_ranges(
+    df, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct=0.0, global_model_cv_type="global-time"
+):
+    """Computes k folds for crossvalidation as row ranges of a single dataframe.
+
+    The folds select the same rows of ``df`` as the folds of :func:`crossvalidation_split_df`, but are described by
+    the row positions ``[(start, stop), ...]`` of their data in ``df``, so that no data is copied. Select the data of a
+    fold with :func:`select_rows`.
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            data with column ``ID``, with the rows of each ``ID`` being contiguous
+        n_lags : int
+            identical to NeuralProphet
+        n_forecasts : int
+            identical to NeuralProphet
+        k : int
+            number of CV folds
+        fold_pct : float
+            percentage of overall samples to be in each fold
+        fold_overlap_pct : float
+            percentage of overlap between the validation folds (default: 0.0)
+        global_model_cv_type : str
+            Type of crossvalidation to apply to the time series, see :func:`crossvalidation_split_df`.
+
+    Returns
+    -------
+        list of k tuples [(train_rows, val_rows), ...]
+
+            training rows ``[(start, stop), ...]``
+
+            validation rows ``[(start, stop), ...]``
+    """
+    id_ranges = _id_row_ranges(df)
+    if len(id_ranges) == 1:
+        start, stop = id_ranges[0]
+        return _crossvalidation_fold_ranges_single(
+            stop - start, start, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct
+        )
+    if global_model_cv_type == "global-time" or global_model_cv_type is None:
+        # Use time threshold to perform crossvalidation
+        # (the distribution of data of different episodes may not be equivalent)
+        return _crossvalidation_fold_ranges_time_threshold(df, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct)
+    if global_model_cv_type == "local":
+        # Crossvalidate time series locally (time leakage may be a problem)
+        folds_per_id = [
+            _crossvalidation_fold_ranges_single(stop - start, start, n_lags, n_forecasts, k, fold_pct, fold_overlap_pct)
+            for start, stop in id_ranges
+        ]
+    elif global_model_cv_type == "intersect":
+        # Use data only from the time period of intersection among time series
+        # Check for intersection of time so time leakage does not occur among different time series
+        start_date, end_date = find_valid_time_interval_for_cv(df)
+        ds = df["ds"].to_numpy()
+        folds_per_id = []
+        for start, stop in id_ranges:
+            in_interval = np.flatnonzero((ds[start:stop] >= start_date) & (ds[start:stop] <= end_date))
+            folds_per_id.append(
+                _crossvalidation_fold_ranges_single(
+                    len(in_interval), start + in_interval[0], n_lags, n_forecasts, k, fold_pct, fold_overlap_pct
                 )
-            folds = unfold_dict_of_folds(folds_dict, k)
-        else:
-            raise ValueError(
-                "Please choose a valid type of global model crossvalidation (i.e. global-time, local, or intersect)"
             )
-    return folds
+    else:
+        raise ValueError(
+            "Please choose a valid type of global model crossvalidation (i.e. global-time, local, or intersect)"
+        )
+    # Combine the folds of all time series, as done by unfold_dict_of_folds
+    return [
+        (
+            [rows for folds in folds_per_id for rows in folds[j][0]],
+            [rows for folds in folds_per_id for rows in folds[j][1]],
+        )
+        for j in range(k)
+    ]
+
+
+def select_rows(df, rows):
+    """Selects the data of row ranges, e.g. of a fold of :func:`crossvalidation_fold_ranges`.
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            data
+        rows : list of tuples
+            row positions ``[(start, stop), ...]`` of the data to select
+
+    Returns
+    -------
+        pd.DataFrame
+            copy of the selected data, with reset index
+    """
+    if len(rows) == 1:
+        start, stop = rows[0]
+        return df.iloc[start:stop].reset_index(drop=True)
+    positions = np.concatenate([np.arange(start, stop, dtype=np.int64) for start, stop in rows] or [[]])
+    return df.iloc[positions].reset_index(drop=True)
+
+
+def _id_row_ranges(df):
+    """Row ranges ``[(start, stop), ...]`` of each time series, sorted by ``ID``. Requires contiguous ``ID`` rows."""
+    codes, _ = pd.factorize(df["ID"], sort=True)
+    starts = np.flatnonzero(np.diff(codes, prepend=-1))
+    stops = np.append(starts[1:], len(codes))
+    if len(starts) != codes.max(initial=-1) + 1:
+        raise ValueError("Rows of each time series ID need to be contiguous.")
+    order = np.argsort(codes[starts], kind="stable")
+    return [(int(starts[i]), int(stops[i])) for i in order]
+
+
+def _group_rows_by_id(df):
+    """Reorders the rows of df to be contiguous per ``ID``, keeping their order within each time series."""
+    codes, _ = pd.factorize(df["ID"])
+    if np.count_nonzero(np.diff(codes)) == codes.max(initial=0):
+        return df
+    return df.iloc[np.argsort(codes, kind="stable")]
 
 
 def double_crossvalidation_split_df(df, n_lags, n_forecasts, k, valid_pct, test_pct):
@@ -968,6 +1137,109 @@ def make_future_df(
     return future_df
 
 
+def make_future_panel_df(
+    df_columns,
+    df_names,
+    last_dates,
+    periods,
+    freq,
+    config_events: configure_components.Events,
+    config_regressors: configure_components.FutureRegressors,
+    events_df=None,
+    regressors_df=None,
+):
+    """Extends many time series periods number steps into future, identical to ``make_future_df`` of each of them.
+
+    Parameters
+    ----------
+        df_columns : pd.DataFrame
+            Dataframe columns
+        df_names : list, np.array
+            IDs of the time series
+        last_dates : pd.Series, pd.DatetimeIndex
+            last history date of each time series
+        periods : int
+            number of future steps to predict
+        freq : str
+            Data step sizes. Frequency of data recording, any valid frequency
+            for pd.date_range, such as ``D`` or ``M``
+        config_events : configure_components.Events
+            User specified events configs
+        events_df : pd.DataFrame
+            containing column ``ds`` and ``event``, and optionally ``ID`` if the events are specific to a time series
+        config_regressors : configure_components.FutureRegressors
+            configuration for user specified regressors,
+        regressors_df : pd.DataFrame
+            containing column ``ds`` and one column for each of the external regressors, and optionally ``ID`` if the
+            regressors are specific to a time series
+
+    Returns
+    -------
+        pd.DataFrame
+            future dataframe of all time series, ordered by ``df_names``, with ``y`` set to None
+    """
+    last_dates = pd.DatetimeIndex(last_dates)
+    offset = pd.tseries.frequencies.to_offset(freq)
+    if isinstance(offset, pd.offsets.Tick) and last_dates.tz is None:
+        # Fixed frequencies: future dates are the last dates plus multiples of the step
+        last = last_dates.values.astype("datetime64[ns]").view(np.int64)
+        future_dates = last[:, None] + offset.nanos * np.arange(1, periods + 1)[None, :]
+        future_dates = future_dates.reshape(-1).view("datetime64[ns]")
+    else:
+        # Calendar frequencies: the future dates are generated once per distinct last date
+        inverse, unique_dates = pd.factorize(last_dates)
+        table = []
+        for last_date in unique_dates:
+            dates = pd.date_range(start=last_date, periods=periods + 1, freq=freq)
+            table.append(dates[dates > last_date][:periods])
+        future_dates = pd.DatetimeIndex(
+            np.concatenate(table)[(inverse[:, None] * periods + np.arange(periods)).ravel()]
+        )
+    future_df = pd.DataFrame(
+        {
+            "ID": np.repeat(np.asarray(df_names, dtype=object), periods),
+            "ds": future_dates,
+            "step": np.tile(np.arange(periods), len(df_names)),
+        }
+    )
+    columns = {"ds": future_df["ds"]}
+    # set the events features
+    if config_events is not None:
+        features = pd.DataFrame(index=future_df.index)
+        if events_df is not None:
+            keys = ["ID", "ds"] if "ID" in events_df.columns else ["ds"]
+            events = events_df.loc[events_df["event"].isin(list(config_events.keys())), keys + ["event"]]
+            events = events.assign(ds=pd.to_datetime(events["ds"]), value=1.0)
+            events = events.pivot_table(index=keys, columns="event", values="value", aggfunc="max").reset_index()
+            features = future_df[keys].merge(events, how="left", on=keys)
+        for event in config_events.keys():
+            if event in features.columns:
+                columns[event] = features[event].fillna(0).to_numpy(dtype=np.float32)
+            else:
+                columns[event] = np.zeros(len(future_df), dtype=np.float32)
+    # set the regressors features, matched by position to the future steps
+    if config_regressors is not None and config_regressors.regressors is not None and regressors_df is not None:
+        regressor_names = list(config_regressors.regressors.keys())
+        for regressor in regressor_names:
+            assert regressor in regressors_df.columns, f"Regressor {regressor} not found in regressors_df"
+        if "ID" in regressors_df.columns:
+            keys = ["ID", "step"]
+            regressors = regressors_df.assign(step=regressors_df.groupby("ID").cumcount())
+        else:
+            keys = ["step"]
+            regressors = regressors_df.assign(step=np.arange(len(regressors_df)))
+        features = future_df[keys].merge(regressors[keys + regressor_names], how="left", on=keys)
+        for regressor in regressor_names:
+            columns[regressor] = features[regressor].to_numpy()
+    for column in df_columns:
+        if column not in columns:
+            if column == "ID":
+                columns[column] = future_df["ID"]
+            elif column != "t" and column != "y_scaled":
+                columns[column] = None
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(future_df)))
+
+
 def convert_events_to_features(df, config_events: configure_components.Events, events_df):
     """
     Converts events information into binary features of the df
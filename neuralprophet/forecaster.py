@@ -1,3 +1,5 @@
+import contextlib
+import dataclasses
 import logging
 import os
 import time
@@ -11,13 +13,14 @@ import pytorch_lightning as pl
 import torch
 from matplotlib import pyplot
 from matplotlib.axes import Axes
-from torch.utils.data import DataLoader
+from torch.utils.data import DataLoader, Subset
 
 from neuralprophet import (
     configure,
     configure_components,
     df_utils,
     np_types,
+    profiling,
     time_dataset,
     time_net,
     utils,
@@ -30,6 +33,7 @@ from neuralprophet.data.process import (
     _convert_raw_predictions_to_raw_df,
     _handle_missing_data,
     _prepare_dataframe_to_predict,
+    _remove_regressors,
     _reshape_raw_predictions_to_forecst_df,
     _validate_column_name,
 )
@@ -42,8 +46,22 @@ from neuralprophet.plot_forecast_plotly import plot as plot_plotly
 from neuralprophet.plot_forecast_plotly import plot_components as plot_components_plotly
 from neuralprophet.plot_model_parameters_matplotlib import plot_parameters
 from neuralprophet.plot_model_parameters_plotly import plot_parameters as plot_parameters_plotly
-from neuralprophet.plot_utils import get_valid_configuration, log_warning_deprecation_plotly, select_plotting_backend
-from neuralprophet.uncertainty import Conformal
+from neuralprophet.plot_utils import (
+    downsample_fcst,
+    fourier_series_numpy_numeric,
+    get_component_cache,
+    get_components_plot_columns,
+    get_forecast_plot_columns,
+    get_season_dates,
+    get_trend_dates,
+    get_valid_configuration,
+    log_warning_deprecation_plotly,
+    predict_season_curves,
+    predict_seasons_from_dates,
+    select_plotting_backend,
+)
+from neuralprophet.streaming import StreamingSession
+from neuralprophet.uncertainty import Conformal, OnlineConformal
 
 log = logging.getLogger("NP.forecaster")
 
@@ -386,6 +404,30 @@ class NeuralProphet:
             Provide `None` to deactivate the use of accelerators.
         trainer_config: dict
             Dictionary of additional Pytorch Lighning Trainer configuration parameters.
+        precision: str
+            Numerical precision used for training and prediction.
+
+            Options
+                * (default) ``32``: float32 precision
+                * ``bf16``: bfloat16 autocast of the forward pass with float32 weights. Roughly doubles the
+                  throughput of the AR-Net and lagged regressor layers on CPUs with bfloat16 support, at a small
+                  loss of accuracy.
+        compile: bool
+            Whether to compile the model forward pass with ``torch.compile`` for training and prediction.
+
+            Note
+            ----
+            Compilation adds a one-time overhead on the first batches of each mode (train, validation, predict)
+            and pays off for longer trainings and repeated predictions.
+        sparse_events: bool
+            Whether to store event and holiday features in a sparse format, holding only the active events of each
+            time step instead of one column per event and offset, and to compute their effect with an embedding-bag
+            lookup of the active events.
+
+            Note
+            ----
+            Reduces the memory and compute of models with many events or holidays with wide windows, e.g. the
+            holidays of many countries. The forecasts match those of the dense format up to floating point rounding.
         prediction_frequency: dict
             Set a periodic interval in which forecasts should be made.
 
@@ -472,6 +514,9 @@ class NeuralProphet:
         accelerator: Optional[str] = None,
         trainer_config: Optional[dict] = None,
         prediction_frequency: Optional[dict] = None,
+        precision: np_types.PrecisionMode = "32",
+        compile: bool = False,
+        sparse_events: bool = False,
     ):
         self.config = locals()
         self.config.pop("self")
@@ -484,6 +529,7 @@ class NeuralProphet:
             n_forecasts=n_forecasts,
             quantiles=quantiles,
             prediction_frequency=prediction_frequency,
+            sparse_events=sparse_events,
         )
         self.config_model.setup_quantiles()
         # self.n_forecasts = self.config_model.n_forecasts
@@ -541,6 +587,8 @@ class NeuralProphet:
             newer_samples_start=newer_samples_start,
             early_stopping=False,
             pl_trainer_config=trainer_config,
+            precision=precision,
+            compile=compile,
         )
 
         # Seasonality
@@ -578,13 +626,20 @@ class NeuralProphet:
 
         # set during fit()
         self.data_freq = None
+        # last training date of each time series, set during fit() and update()
+        self.train_end_ds = None
+        # predicted component curves for plotting, cleared during fit() and update()
+        self.component_curves = {}
+        # profiler of the fit and predict calls, set by profile()
+        self.profiler = None
 
         # Set during _train()
         self.fitted = False
         self.data_params = None
 
-        # Pytorch Lightning Trainer
+        # Pytorch Lightning Trainer, set during fit() or restored when first needed
         self.accelerator = accelerator
+        self.trainer = None
 
         # set during prediction
         self.future_periods = None
@@ -967,6 +1022,7 @@ class NeuralProphet:
         )
         return self
 
+    @profiling.profiled
     def fit(
         self,
         df: pd.DataFrame,
@@ -986,6 +1042,9 @@ class NeuralProphet:
         scheduler: Optional[Union[str, Type[torch.optim.lr_scheduler.LRScheduler]]] = None,
         scheduler_args: Optional[dict] = None,
         trainer_config: Optional[dict] = None,
+        precision: Optional[np_types.PrecisionMode] = None,
+        rows: Optional[List[Tuple[int, int]]] = None,
+        validation_rows: Optional[List[Tuple[int, int]]] = None,
     ):
         """Train, and potentially evaluate model.
 
@@ -1042,12 +1101,30 @@ class NeuralProphet:
                 * ``StepLR``: Step Learning Rate scheduler
                 * ``ExponentialLR``: Exponential Learning Rate scheduler
                 * ``CosineAnnealingLR``: Cosine Annealing Learning Rate scheduler
+            precision : str
+                Numerical precision used for training and prediction. If None, uses the precision specified in the
+                model config.
+
+                Options
+                * ``32``: float32 precision
+                * ``bf16``: bfloat16 autocast of the forward pass with float32 weights
+            rows : list of tuples
+                Row ranges ``[(start, stop), ...]`` of ``df`` to train on, e.g. of a fold of
+                :meth:`crossvalidation_fold_ranges`. If provided, ``df`` is the base dataframe returned by
+                :meth:`crossvalidation_fold_ranges`, which is already checked, and only the missing data of the selected
+                rows is imputed, so that no data of other folds is used.
+            validation_rows : list of tuples
+                Row ranges ``[(start, stop), ...]`` of ``df`` to evaluate on, instead of a ``validation_df``.
+                Requires ``rows``.
 
         Returns
         -------
             pd.DataFrame
                 metrics with training and potentially evaluation metrics
         """
+        if validation_rows is not None and (rows is None or validation_df is not None):
+            raise ValueError("validation_rows requires rows and can not be combined with a validation_df.")
+
         if minimal:
             # overrides these settings:
             checkpointing = False
@@ -1070,13 +1147,27 @@ class NeuralProphet:
                 "computed for any future time, independent of lagged values"
             )
 
-        # Copy df and save list of unique time series IDs (the latter for global-local modelling if enabled)
-        df = df.copy(deep=True)
-        df, _, _, self.id_list = df_utils.check_multiple_series_id(df)
-        df = _check_dataframe(self, df, check_y=True, exogenous=True)
+        with profiling.stage(self, "check_dataframe"):
+            if rows is None:
+                # Copy df and save list of unique time series IDs (the latter for global-local modelling if enabled)
+                df = df.copy(deep=True)
+                df, _, _, self.id_list = df_utils.check_multiple_series_id(df)
+                df = _check_dataframe(self, df, check_y=True, exogenous=True)
+            else:
+                # Copy only the rows to train on from the checked base dataframe
+                df_base = df
+                df = df_utils.select_rows(df_base, rows)
+                self.id_list = list(df["ID"].unique())
+                # Remove the regressors which were removed from the base dataframe when checking it
+                _remove_regressors(
+                    self,
+                    [reg for reg in self.config_regressors.regressors or {} if reg not in df_base.columns],
+                    [reg for reg in self.config_lagged_regressors.regressors or {} if reg not in df_base.columns],
+                )
 
         # Infer frequency from data
-        self.data_freq = df_utils.infer_frequency(df, n_lags=self.config_model.max_lags, freq=freq)
+        with profiling.stage(self, "infer_frequency"):
+            self.data_freq = df_utils.infer_frequency(df, n_lags=self.config_model.max_lags, freq=freq)
 
         # Setup Metrics
         if metrics is not None:
@@ -1135,6 +1226,8 @@ class NeuralProphet:
             self.config_train.pl_trainer_config = trainer_config
         if early_stopping is not None:
             self.config_train.early_stopping = early_stopping
+        if precision is not None:
+            self.config_train.set_precision(precision)
         self.config_train.set_loss_func(quantiles=self.config_model.quantiles)
 
         # Warning if early stopping and regularizing
@@ -1158,31 +1251,37 @@ class NeuralProphet:
 
         # Set up training dataframe and data dependent configurations
         # Missing Data
-        df = _handle_missing_data(
-            df=df,
-            freq=self.data_freq,
-            n_lags=self.config_ar.n_lags,
-            n_forecasts=self.config_model.n_forecasts,
-            config_missing=self.config_missing,
-            config_regressors=self.config_regressors,
-            config_lagged_regressors=self.config_lagged_regressors,
-            config_events=self.config_events,
-            config_seasonality=self.config_seasonality,
-            predicting=False,
-        )
-
-        # Initialize data normalization parameters
-        if not self.fitted:
-            self.config_normalization.init_data_params(
+        with profiling.stage(self, "handle_missing_data"):
+            df = _handle_missing_data(
                 df=df,
-                config_lagged_regressors=self.config_lagged_regressors,
+                freq=self.data_freq,
+                n_lags=self.config_ar.n_lags,
+                n_forecasts=self.config_model.n_forecasts,
+                config_missing=self.config_missing,
                 config_regressors=self.config_regressors,
+                config_lagged_regressors=self.config_lagged_regressors,
                 config_events=self.config_events,
                 config_seasonality=self.config_seasonality,
+                predicting=False,
             )
 
+        self.train_end_ds = df.groupby("ID")["ds"].max().to_dict()
+        self.component_curves = {}
+
+        # Initialize data normalization parameters
+        if not self.fitted:
+            with profiling.stage(self, "init_data_params"):
+                self.config_normalization.init_data_params(
+                    df=df,
+                    config_lagged_regressors=self.config_lagged_regressors,
+                    config_regressors=self.config_regressors,
+                    config_events=self.config_events,
+                    config_seasonality=self.config_seasonality,
+                )
+
         # Apply normalization to data
-        df = _normalize(df=df, config_normalization=self.config_normalization)
+        with profiling.stage(self, "normalize"):
+            df = _normalize(df=df, config_normalization=self.config_normalization)
 
         # Trend config: scale user-specified changepoint times
         if not self.fitted:
@@ -1194,25 +1293,27 @@ class NeuralProphet:
 
         # Configure auto-seasoanlities and country-holidays
         if not self.fitted:
-            # Temporarily merge df
-            df_merged = df_utils.merge_dataframes(df.copy(deep=True))
-            self.config_seasonality = utils.set_auto_seasonalities(
-                df_merged, config_seasonality=self.config_seasonality
-            )
-            if self.config_country_holidays is not None:
-                self.config_country_holidays.init_holidays(df_merged)
+            with profiling.stage(self, "set_auto_seasonalities"):
+                # Temporarily merge df
+                df_merged = df_utils.merge_dataframes(df.copy(deep=True))
+                self.config_seasonality = utils.set_auto_seasonalities(
+                    df_merged, config_seasonality=self.config_seasonality
+                )
+                if self.config_country_holidays is not None:
+                    self.config_country_holidays.init_holidays(df_merged)
 
         # Set up  DataLoaders: Train
         # Create TimeDataset
         # Note: _create_dataset() needs to be called after set_auto_seasonalities()
-        train_components_stacker = utils_time_dataset.ComponentStacker(
-            n_lags=self.config_ar.n_lags,
-            n_forecasts=self.config_model.n_forecasts,
-            max_lags=self.config_model.max_lags,
-            config_seasonality=self.config_seasonality,
-            lagged_regressor_config=self.config_lagged_regressors,
-        )
-        dataset = self._create_dataset(df, predict_mode=False, components_stacker=train_components_stacker)
+        with profiling.stage(self, "create_dataset"):
+            train_components_stacker = utils_time_dataset.ComponentStacker(
+                n_lags=self.config_ar.n_lags,
+                n_forecasts=self.config_model.n_forecasts,
+                max_lags=self.config_model.max_lags,
+                config_seasonality=self.config_seasonality,
+                lagged_regressor_config=self.config_lagged_regressors,
+            )
+            dataset = self._create_dataset(df, predict_mode=False, components_stacker=train_components_stacker)
         # Determine the max_number of epochs
         self.config_train.set_auto_batch_epoch(n_data=len(dataset))
         # Create Train DataLoader
@@ -1228,50 +1329,62 @@ class NeuralProphet:
         log.info(f"Number of batches per training epoch: {len(loader)}")
 
         # Set up  DataLoaders: Validation
-        validation_enabled = validation_df is not None and isinstance(validation_df, pd.DataFrame)
-        if validation_enabled:
-            df_val = validation_df.copy(deep=True)
-            df_val, _, _, _ = df_utils.check_multiple_series_id(df_val)
-            df_val = _check_dataframe(self, df_val, check_y=False, exogenous=False)
-            df_val = _handle_missing_data(
-                df=df_val,
-                freq=self.data_freq,
-                n_lags=self.config_ar.n_lags,
-                n_forecasts=self.config_model.n_forecasts,
-                config_missing=self.config_missing,
-                config_regressors=self.config_regressors,
-                config_lagged_regressors=self.config_lagged_regressors,
-                config_events=self.config_events,
-                config_seasonality=self.config_seasonality,
-                predicting=False,
-            )
-            df_val = _normalize(df=df_val, config_normalization=self.config_normalization)
-            val_components_stacker = utils_time_dataset.ComponentStacker(
-                n_lags=self.config_ar.n_lags,
-                max_lags=self.config_model.max_lags,
-                n_forecasts=self.config_model.n_forecasts,
-                config_seasonality=self.config_seasonality,
-                lagged_regressor_config=self.config_lagged_regressors,
-            )
-            dataset_val = self._create_dataset(df_val, predict_mode=False, components_stacker=val_components_stacker)
-            loader_val = DataLoader(dataset_val, batch_size=min(1024, len(dataset_val)), shuffle=False, drop_last=False)
+        validation_enabled = validation_rows is not None or (
+            validation_df is not None and isinstance(validation_df, pd.DataFrame)
+        )
+        with profiling.stage(self, "validation_dataset"):
+            if validation_rows is not None:
+                df_val = df_utils.select_rows(df_base, validation_rows)
+            elif validation_enabled:
+                df_val = validation_df.copy(deep=True)
+                df_val, _, _, _ = df_utils.check_multiple_series_id(df_val)
+                df_val = _check_dataframe(self, df_val, check_y=False, exogenous=False)
+            if validation_enabled:
+                df_val = _handle_missing_data(
+                    df=df_val,
+                    freq=self.data_freq,
+                    n_lags=self.config_ar.n_lags,
+                    n_forecasts=self.config_model.n_forecasts,
+                    config_missing=self.config_missing,
+                    config_regressors=self.config_regressors,
+                    config_lagged_regressors=self.config_lagged_regressors,
+                    config_events=self.config_events,
+                    config_seasonality=self.config_seasonality,
+                    predicting=False,
+                )
+                df_val = _normalize(df=df_val, config_normalization=self.config_normalization)
+                val_components_stacker = utils_time_dataset.ComponentStacker(
+                    n_lags=self.config_ar.n_lags,
+                    max_lags=self.config_model.max_lags,
+                    n_forecasts=self.config_model.n_forecasts,
+                    config_seasonality=self.config_seasonality,
+                    lagged_regressor_config=self.config_lagged_regressors,
+                )
+                dataset_val = self._create_dataset(
+                    df_val, predict_mode=False, components_stacker=val_components_stacker
+                )
+                loader_val = DataLoader(
+                    dataset_val, batch_size=min(1024, len(dataset_val)), shuffle=False, drop_last=False
+                )
 
         # Init the Trainer
-        self.trainer, checkpoint_callback = utils_lightning.configure_trainer(
-            config_train=self.config_train,
-            metrics_logger=self.metrics_logger,
-            early_stopping_target="Loss_val" if validation_enabled else "Loss",
-            accelerator=self.accelerator,
-            progress_bar_enabled=bool(progress),
-            metrics_enabled=bool(self.metrics),
-            checkpointing_enabled=checkpointing,
-            num_batches_per_epoch=len(loader),
-            deterministic=deterministic,
-        )
+        with profiling.stage(self, "configure_trainer"):
+            self.trainer, checkpoint_callback = utils_lightning.configure_trainer(
+                config_train=self.config_train,
+                metrics_logger=self.metrics_logger,
+                early_stopping_target="Loss_val" if validation_enabled else "Loss",
+                accelerator=self.accelerator,
+                progress_bar_enabled=bool(progress),
+                metrics_enabled=bool(self.metrics),
+                checkpointing_enabled=checkpointing,
+                num_batches_per_epoch=len(loader),
+                deterministic=deterministic,
+            )
 
         # # Set up the model for training
         if not self.fitted:
-            self.model = self._init_model()
+            with profiling.stage(self, "init_model"):
+                self.model = self._init_model()
 
         self.model.set_components_stacker(stacker=train_components_stacker, mode="train")
         if validation_enabled:
@@ -1303,15 +1416,16 @@ class NeuralProphet:
             # )
 
             # Setup and execute LR finder
-            suggested_lr = utils_lightning.find_learning_rate(
-                model=self.model,
-                # model=model_lr_finder,
-                loader=loader,
-                # loader=loader_lr_finder,
-                trainer=self.trainer,
-                # trainer=trainer_lr_finder,
-                train_epochs=self.config_train.epochs,
-            )
+            with profiling.stage(self, "lr_finder"):
+                suggested_lr = utils_lightning.find_learning_rate(
+                    model=self.model,
+                    # model=model_lr_finder,
+                    loader=loader,
+                    # loader=loader_lr_finder,
+                    trainer=self.trainer,
+                    # trainer=trainer_lr_finder,
+                    train_epochs=self.config_train.epochs,
+                )
             # Clean up the LR finder copies of Model, Loader and Trainer
             # del model_lr_finder, loader_lr_finder, trainer_lr_finder
 
@@ -1324,11 +1438,12 @@ class NeuralProphet:
 
         # Execute Training Loop
         start = time.time()
-        self.trainer.fit(
-            model=self.model,
-            train_dataloaders=loader,
-            val_dataloaders=loader_val if validation_enabled else None,
-        )
+        with profiling.stage(self, "train"):
+            self.trainer.fit(
+                model=self.model,
+                train_dataloaders=loader,
+                val_dataloaders=loader_val if validation_enabled else None,
+            )
         log.info("Train Time: {:8.3f}".format(time.time() - start))
         self.fitted = True
 
@@ -1360,6 +1475,270 @@ class NeuralProphet:
 
         return metrics_df
 
+    @profiling.profiled
+    def update(
+        self,
+        df: pd.DataFrame,
+        epochs: Optional[int] = None,
+        learning_rate: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        replay: int = 0,
+        progress: Optional[str] = "bar",
+        num_workers: int = 0,
+        deterministic: bool = False,
+    ):
+        """Fine-tune a fitted model on newly arrived data, starting from its current weights.
+
+        Only the data after the last training date of each time series is trained on, together with the preceding
+        rows needed as lags. The normalization parameters, changepoints and seasonalities of the fitted model are
+        kept unchanged.
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+                dataframe containing column ``ds``, ``y``, and optionally``ID`` with the new data. For models with lags,
+                it also needs to contain the ``max_lags`` rows before the new data, e.g. the full history with the new
+                data appended, of which only the required tail is used.
+            epochs : int
+                Number of epochs to train for. If None, uses the number of epochs specified in the model config.
+            learning_rate : float
+                Learning rate for training. If None, uses the learning rate of the fitted model.
+            batch_size : int
+                Batch size for training. If None, uses the batch size specified in the model config.
+            replay : int
+                Number of samples per time series drawn at random from the history before the new data, trained on
+                together with the new samples to counteract forgetting when fine-tuning on few new samples. The full
+                history needs to be contained in ``df``. Samples are drawn with the random generator of torch, see
+                :func:`set_random_seed`.
+            progress : str
+                Flag whether to show a progress bar during training.
+
+                Options
+                * (default) ``bar``
+                * `None`
+            num_workers : int
+                Number of workers for data loading. If 0, data will be loaded in the main process.
+            deterministic : bool
+                Flag whether to use deterministic algorithms for training.
+
+        Returns
+        -------
+            pd.DataFrame
+                metrics of the fine-tuning, None if metrics are disabled or if there is no new data
+
+        Examples
+        --------
+            >>> m.fit(df_history)
+            >>> df_history = pd.concat((df_history, df_new_day))
+            >>> m.update(df_history, epochs=10)
+            >>> forecast = m.predict(m.make_future_dataframe(df_history))
+        """
+        if not self.fitted:
+            raise RuntimeError("Model has not been fitted yet. Use fit to train it first.")
+        if getattr(self, "train_end_ds", None) is None:
+            raise RuntimeError("The last training dates of the model are unknown, it can not be updated.")
+
+        df, _, _, _ = df_utils.check_multiple_series_id(df.copy(deep=False))
+        unknown_ids = set(df["ID"].unique()) - set(self.train_end_ds)
+        if len(unknown_ids) > 0:
+            raise ValueError(f"Time series {sorted(unknown_ids)} were not part of the training data.")
+
+        # Keep the new rows of each time series, preceded by the rows of its first lags. Replay samples are drawn
+        # from the whole history.
+        n_context = self.config_model.max_lags + self.config_model.n_forecasts - 1
+        tails = []
+        for df_name, df_i in df.groupby("ID", sort=False):
+            df_i = df_i.assign(ds=pd.to_datetime(df_i["ds"])).sort_values("ds")
+            n_new = int((df_i["ds"] > self.train_end_ds[df_name]).sum())
+            if n_new > 0:
+                tails.append(df_i if replay > 0 else df_i.iloc[max(0, len(df_i) - n_new - n_context) :])
+        if len(tails) == 0:
+            log.warning("No data after the last training date, the model is not updated.")
+            return None
+        df = pd.concat(tails, ignore_index=True)
+        df = _check_dataframe(self, df, check_y=True, exogenous=True)
+        df = _handle_missing_data(
+            df=df,
+            freq=self.data_freq,
+            n_lags=self.config_ar.n_lags,
+            n_forecasts=self.config_model.n_forecasts,
+            config_missing=self.config_missing,
+            config_regressors=self.config_regressors,
+            config_lagged_regressors=self.config_lagged_regressors,
+            config_events=self.config_events,
+            config_seasonality=self.config_seasonality,
+            predicting=False,
+        )
+        train_end_ds = df.groupby("ID")["ds"].max().to_dict()
+        df = _normalize(df=df, config_normalization=self.config_normalization)
+
+        if epochs is not None:
+            self.config_train.epochs = epochs
+        if batch_size is not None:
+            self.config_train.batch_size = batch_size
+        if learning_rate is not None:
+            self.config_train.learning_rate = learning_rate
+            self.model.learning_rate = learning_rate
+
+        with profiling.stage(self, "create_dataset"):
+            components_stacker = utils_time_dataset.ComponentStacker(
+                n_lags=self.config_ar.n_lags,
+                n_forecasts=self.config_model.n_forecasts,
+                max_lags=self.config_model.max_lags,
+                config_seasonality=self.config_seasonality,
+                lagged_regressor_config=self.config_lagged_regressors,
+            )
+            dataset = self._create_dataset(df, predict_mode=False, components_stacker=components_stacker)
+            if replay > 0:
+                dataset = Subset(dataset, self._replay_sample_indices(dataset, replay))
+        self.config_train.set_auto_batch_epoch(n_data=len(dataset))
+        loader = DataLoader(
+            dataset,
+            batch_size=min(self.config_train.batch_size, len(dataset)),
+            shuffle=True,
+            num_workers=num_workers,
+        )
+        self.config_train.set_batches_per_epoch(len(loader))
+        log.info(f"Update Dataset size: {len(dataset)}")
+
+        if self.metrics:
+            save_dir = self.metrics_logger.save_dir if self.metrics_logger is not None else os.getcwd()
+            self.metrics_logger = MetricsLogger(save_dir=save_dir)
+        self.trainer, _ = utils_lightning.configure_trainer(
+            config_train=self.config_train,
+            metrics_logger=self.metrics_logger,
+            accelerator=self.accelerator,
+            progress_bar_enabled=bool(progress),
+            metrics_enabled=bool(self.metrics),
+            num_batches_per_epoch=len(loader),
+            deterministic=deterministic,
+        )
+        self.model.set_components_stacker(stacker=components_stacker, mode="train")
+
+        start = time.time()
+        with profiling.stage(self, "train"):
+            self.trainer.fit(model=self.model, train_dataloaders=loader)
+        log.info("Update Time: {:8.3f}".format(time.time() - start))
+        self.train_end_ds.update(train_end_ds)
+        self.component_curves = {}
+
+        return pd.DataFrame(self.metrics_logger.history) if bool(self.metrics) else None
+
+    def _replay_sample_indices(self, dataset, replay):
+        """Selects the samples of a dataset to train on when updating the model.
+
+        Parameters
+        ----------
+            dataset : GlobalTimeDataset
+                dataset of the history and the new data of each time series
+            replay : int
+                number of samples per time series drawn at random from its history
+
+        Returns
+        -------
+            list
+                indices of the new samples, which have targets after the last training date, and of the replay samples
+        """
+        # Last row of the window of each sample, without lags a sample is the row of its target
+        offset_last_row = self.config_model.n_forecasts if self.config_model.max_lags > 0 else 0
+        indices = []
+        start = 0
+        for df_name, dataset_i in dataset.datasets.items():
+            last_ds = dataset_i.df_tensors["ds"][dataset_i.sample2index_map + offset_last_row]
+            is_new = last_ds > int(self.train_end_ds[df_name].timestamp())
+            history = torch.nonzero(~is_new).flatten()
+            history = history[torch.randperm(len(history))[:replay]]
+            indices.append(start + torch.cat((torch.nonzero(is_new).flatten(), history)))
+            start += dataset_i.length
+        return torch.cat(indices).tolist()
+
+    def streaming_session(self, df: Optional[pd.DataFrame] = None) -> StreamingSession:
+        """Create a stateful session for fast forecasts of an auto-regressive model from streamed observations.
+
+        The session keeps the normalized last ``max_lags`` observations of each time series. New observations are
+        added with ``session.update`` and the next ``n_forecasts`` steps are forecasted with ``session.forecast``,
+        without preparing a dataframe and dataset for each forecast, see :class:`streaming.StreamingSession`.
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+                dataframe containing column ``ds``, ``y``, optionally ``ID`` and lagged regressors with the history,
+                of which the last ``max_lags`` rows of each time series initialize the session
+
+        Returns
+        -------
+            StreamingSession
+                session initialized with the history
+
+        Examples
+        --------
+            >>> session = m.streaming_session(df)
+            >>> session.update(ds=np.datetime64("2024-01-01"), y=3.2)
+            >>> ds, yhat = session.forecast()
+        """
+        session = StreamingSession(self)
+        if df is not None:
+            df, _, _, _ = df_utils.check_multiple_series_id(df.copy(deep=True))
+            df = _check_dataframe(self, df, check_y=True, exogenous=True)
+            df = _handle_missing_data(
+                df=df,
+                freq=self.data_freq,
+                n_lags=self.config_ar.n_lags,
+                n_forecasts=self.config_model.n_forecasts,
+                config_missing=self.config_missing,
+                config_regressors=self.config_regressors,
+                config_lagged_regressors=self.config_lagged_regressors,
+                config_events=self.config_events,
+                config_seasonality=self.config_seasonality,
+                predicting=False,
+            )
+            for df_name, df_i in df.groupby("ID", sort=False):
+                df_i = df_i.iloc[-self.config_model.max_lags :]
+                session.update(
+                    ds=df_i["ds"].to_numpy(),
+                    y=df_i["y"].to_numpy(),
+                    df_name=df_name,
+                    lagged_regressors={name: df_i[name].to_numpy() for name in session.lagged_regressor_names},
+                )
+        return session
+
+    @contextlib.contextmanager
+    def profile(self, memory: bool = False, torch_profiler: bool = False, trace_dir: Optional[str] = None):
+        """Context manager profiling the stages of all ``fit``, ``update`` and ``predict`` calls within it.
+
+        Each call is timed per stage, e.g. checking the dataframe, normalizing, creating the dataset, training or
+        running the model, see :class:`profiling.Profiler`. Without an active profiler, the stages are not timed.
+
+        Parameters
+        ----------
+            memory : bool
+                whether to trace the peak memory of each stage with ``tracemalloc``, which slows down the calls
+            torch_profiler : bool
+                whether to additionally capture each call with ``torch.profiler``
+            trace_dir : str
+                directory to write a chrome trace of each call captured with ``torch.profiler`` to
+
+        Returns
+        -------
+            Profiler
+                profiler collecting the stages, of which ``report()`` returns the per-stage time and memory
+
+        Examples
+        --------
+            >>> with m.profile(memory=True) as profiler:
+            ...     m.fit(df)
+            ...     forecast = m.predict(df)
+            >>> profiler.report()
+        """
+        profiler = profiling.Profiler(memory=memory, torch_profiler=torch_profiler, trace_dir=trace_dir)
+        self.profiler = profiler
+        try:
+            with profiler:
+                yield profiler
+        finally:
+            self.profiler = None
+
+    @profiling.profiled
     def predict(self, df: pd.DataFrame, decompose: bool = True, raw: bool = False, auto_extend=True):
         """Runs the model to make predictions.
 
@@ -1400,54 +1779,63 @@ class NeuralProphet:
             log.warning("Raw forecasts are incompatible with plotting utilities")
         if self.fitted is False:
             raise ValueError("Model has not been fitted. Predictions will be random.")
-        df = df.copy(deep=True)
-        df, received_ID_col, received_single_time_series, _ = df_utils.check_multiple_series_id(df)
+        with profiling.stage(self, "check_dataframe"):
+            df = df.copy(deep=True)
+            df, received_ID_col, received_single_time_series, _ = df_utils.check_multiple_series_id(df)
         # to get all forecasteable values with df given, maybe extend into future:
-        df, periods_added = _maybe_extend_df(
-            df=df,
-            n_forecasts=self.config_model.n_forecasts,
-            max_lags=self.config_model.max_lags,
-            freq=self.data_freq,
-            config_regressors=self.config_regressors,
-            config_events=self.config_events,
-        )
-        df = _prepare_dataframe_to_predict(model=self, df=df, max_lags=self.config_model.max_lags, freq=self.data_freq)
+        with profiling.stage(self, "prepare_dataframe"):
+            df, periods_added = _maybe_extend_df(
+                df=df,
+                n_forecasts=self.config_model.n_forecasts,
+                max_lags=self.config_model.max_lags,
+                freq=self.data_freq,
+                config_regressors=self.config_regressors,
+                config_events=self.config_events,
+            )
+            df = _prepare_dataframe_to_predict(
+                model=self, df=df, max_lags=self.config_model.max_lags, freq=self.data_freq
+            )
         # normalize
-        df = _normalize(df=df, config_normalization=self.config_normalization)
+        with profiling.stage(self, "normalize"):
+            df = _normalize(df=df, config_normalization=self.config_normalization)
         forecast = pd.DataFrame()
         for df_name, df_i in df.groupby("ID"):
-            dates, predicted, components = self._predict_raw(df_i, df_name, include_components=decompose)
+            with profiling.stage(self, "predict_raw"):
+                dates, predicted, components = self._predict_raw(df_i, df_name, include_components=decompose)
             df_i = df_utils.drop_missing_from_df(
                 df_i, self.config_missing.drop_missing, self.predict_steps, self.config_ar.n_lags
             )
-            if raw:
-                fcst = _convert_raw_predictions_to_raw_df(
-                    dates=dates,
-                    predicted=predicted,
-                    n_forecasts=self.config_model.n_forecasts,
-                    quantiles=self.config_model.quantiles,
-                    components=components,
-                )
-                if auto_extend and periods_added[df_name] > 0:
-                    fcst = fcst[:-1]
-            else:
-                fcst = _reshape_raw_predictions_to_forecst_df(
-                    df=df_i,
-                    predicted=predicted,
-                    components=components,
-                    prediction_frequency=self.config_model.prediction_frequency,
-                    dates=dates,
-                    n_forecasts=self.config_model.n_forecasts,
-                    max_lags=self.config_model.max_lags,
-                    freq=self.data_freq,
-                    quantiles=self.config_model.quantiles,
-                    config_lagged_regressors=self.config_lagged_regressors,
-                )
-                if auto_extend and periods_added[df_name] > 0:
-                    fcst = fcst[: -periods_added[df_name]]
-            forecast = pd.concat((forecast, fcst), ignore_index=True)
+            with profiling.stage(self, "reshape"):
+                if raw:
+                    fcst = _convert_raw_predictions_to_raw_df(
+                        dates=dates,
+                        predicted=predicted,
+                        n_forecasts=self.config_model.n_forecasts,
+                        quantiles=self.config_model.quantiles,
+                        components=components,
+                    )
+                    if auto_extend and periods_added[df_name] > 0:
+                        fcst = fcst[:-1]
+                else:
+                    fcst = _reshape_raw_predictions_to_forecst_df(
+                        df=df_i,
+                        predicted=predicted,
+                        components=components,
+                        prediction_frequency=self.config_model.prediction_frequency,
+                        dates=dates,
+                        n_forecasts=self.config_model.n_forecasts,
+                        max_lags=self.config_model.max_lags,
+                        freq=self.data_freq,
+                        quantiles=self.config_model.quantiles,
+                        config_lagged_regressors=self.config_lagged_regressors,
+                    )
+                    if auto_extend and periods_added[df_name] > 0:
+                        fcst = fcst[: -periods_added[df_name]]
+            with profiling.stage(self, "concat"):
+                forecast = pd.concat((forecast, fcst), ignore_index=True)
 
-        df = df_utils.return_df_in_original_format(forecast, received_ID_col, received_single_time_series)
+        with profiling.stage(self, "concat"):
+            df = df_utils.return_df_in_original_format(forecast, received_ID_col, received_single_time_series)
         self.predict_steps = self.config_model.n_forecasts
         return df
 
@@ -1465,6 +1853,86 @@ class NeuralProphet:
             pd.DataFrame
                 evaluation metrics
         """
+        dataset = self._prepare_test_dataset(df)
+        test_loader = DataLoader(dataset, batch_size=min(1024, len(dataset)), shuffle=False, drop_last=False)
+        # Use Lightning to calculate metrics
+        if self.trainer is None:
+            self.restore_trainer()
+        val_metrics = self.trainer.test(self.model, dataloaders=test_loader, verbose=verbose)
+        val_metrics_df = pd.DataFrame(val_metrics)
+        # TODO Check whether supported by Lightning
+        if not self.config_normalization.global_normalization:
+            log.info(
+                "Note that the metrics are displayed in normalized scale because of local normalization. "
+                "Use evaluate for denormalized metrics per time series."
+            )
+        return val_metrics_df
+
+    def evaluate(self, df: pd.DataFrame, batch_size: int = 1024):
+        """Evaluate model on holdout data per time series and forecast step.
+
+        Runs the model directly on the holdout data, without a Lightning trainer, and accumulates the errors of
+        the denormalized forecasts batch by batch, also under local normalization.
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+                dataframe containing column ``ds``, ``y``, and optionally``ID`` with with holdout data
+            batch_size : int
+                number of samples per forward pass
+        Returns
+        -------
+            pd.DataFrame
+                evaluation metrics with one row per ``ID`` and forecast ``step``,
+                see :meth:`utils_metrics.ForecastMetricsAccumulator.compute`
+
+        Examples
+        --------
+            >>> metrics = m.evaluate(df_test)
+            >>> metrics.groupby("step")[["MAE", "RMSE"]].mean()
+        """
+        dataset = self._prepare_test_dataset(df)
+        loader = DataLoader(dataset, batch_size=min(batch_size, len(dataset)), shuffle=False, drop_last=False)
+        id_codes = {df_name: code for code, df_name in enumerate(dataset.df_names)}
+        data_params = [self.config_normalization.get_data_params(df_name)["y"] for df_name in dataset.df_names]
+        scale_y = np.array([params.scale for params in data_params], dtype=np.float64)
+        shift_y = np.array([params.shift for params in data_params], dtype=np.float64)
+        metrics = utils_metrics.ForecastMetricsAccumulator(
+            dataset.df_names, self.config_model.n_forecasts, self.config_model.quantiles
+        )
+        components_stacker = self.model.components_stacker["test"]
+        with self._inference():
+            for inputs_tensor, meta in loader:
+                inputs_tensor = inputs_tensor.to(self.model.device)
+                if self.model.meta_used_in_model:
+                    meta_name_tensor = torch.tensor(
+                        [self.model.id_dict[i] for i in meta["df_name"]], device=self.model.device
+                    )
+                else:
+                    meta_name_tensor = None
+                predicted, _ = self.model.forward(inputs_tensor, mode="test", meta=meta_name_tensor)
+                targets = components_stacker.unstack("targets", batch_tensor=inputs_tensor)
+                codes = np.array([id_codes[df_name] for df_name in meta["df_name"]])
+                scale, shift = scale_y[codes, np.newaxis], shift_y[codes, np.newaxis]
+                metrics.update(
+                    codes,
+                    predicted.float().cpu().numpy() * scale[:, :, np.newaxis] + shift[:, :, np.newaxis],
+                    targets[:, :, 0].float().cpu().numpy() * scale + shift,
+                )
+        return metrics.compute()
+
+    def _prepare_test_dataset(self, df: pd.DataFrame):
+        """Checks, imputes and normalizes holdout data and creates its dataset for evaluation.
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+                dataframe containing column ``ds``, ``y``, and optionally``ID`` with with holdout data
+        Returns
+        -------
+            GlobalTimeDataset
+                dataset of the holdout data, with the test components stacker set on the model
+        """
         if self.fitted is False:
             log.warning("Model has not been fitted. Test results will be random.")
         df = df.copy(deep=True)
@@ -1494,14 +1962,7 @@ class NeuralProphet:
         )
         dataset = self._create_dataset(df, predict_mode=False, components_stacker=components_stacker)
         self.model.set_components_stacker(components_stacker, mode="test")
-        test_loader = DataLoader(dataset, batch_size=min(1024, len(dataset)), shuffle=False, drop_last=False)
-        # Use Lightning to calculate metrics
-        val_metrics = self.trainer.test(self.model, dataloaders=test_loader, verbose=verbose)
-        val_metrics_df = pd.DataFrame(val_metrics)
-        # TODO Check whether supported by Lightning
-        if not self.config_normalization.global_normalization:
-            log.info("Note that the metrics are displayed in normalized scale because of local normalization.")
-        return val_metrics_df
+        return dataset
 
     def split_df(self, df: pd.DataFrame, freq: str = "auto", valid_p: float = 0.2, local_split: bool = False):
         """Splits timeseries df into train and validation sets.
@@ -1699,6 +2160,7 @@ class NeuralProphet:
         See Also
         --------
             split_df : Splits timeseries df into train and validation sets.
+            crossvalidation_fold_ranges : Splits timeseries data in k folds, given as row ranges of a single dataframe.
             double_crossvalidation_split_df : Splits timeseries data in two sets of k folds for crossvalidation on
             training and testing data.
 
@@ -1841,6 +2303,93 @@ class NeuralProphet:
                 del folds[i][1]["ID"]
         return folds
 
+    def crossvalidation_fold_ranges(
+        self,
+        df: pd.DataFrame,
+        freq: str = "auto",
+        k: int = 5,
+        fold_pct: float = 0.1,
+        fold_overlap_pct: float = 0.5,
+        global_model_cv_type: str = "global-time",
+    ) -> Tuple[pd.DataFrame, List[Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]], str]:
+        """Splits timeseries data in k folds for crossvalidation, given as row ranges of a single base dataframe.
+
+        The data is checked once, and missing dates are added, as done by :meth:`fit`. The folds cover the same dates
+        as the folds of :meth:`crossvalidation_split_df`, but are described by the row positions of their data in the
+        base dataframe, so that the data is not copied for each fold. Unlike :meth:`crossvalidation_split_df`, missing
+        values are not imputed in the base dataframe: fitting a model with the base dataframe and the row ranges of a
+        fold imputes the training and the validation rows of the fold each on their own, so that no values of other
+        folds are used.
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+                dataframe containing column ``ds``, ``y``, and optionally``ID`` with all data
+            freq : str
+                data step sizes. Frequency of data recording,
+
+                Note
+                ----
+                Any valid frequency for pd.date_range, such as ``5min``, ``D``, ``MS`` or ``auto`` (default) to
+                automatically set frequency.
+            k : int
+                number of CV folds
+            fold_pct : float
+                percentage of overall samples to be in each fold
+            fold_overlap_pct : float
+                percentage of overlap between the validation folds.
+            global_model_cv_type : str
+                Type of crossvalidation to apply to the dict of time series,
+                see :meth:`crossvalidation_split_df`.
+
+        Returns
+        -------
+            pd.DataFrame
+                base dataframe, checked and without imputed values, with the rows of each ``ID`` being contiguous
+            list of k tuples [(train_rows, val_rows), ...]
+
+                training rows ``[(start, stop), ...]`` of the base dataframe
+
+                validation rows ``[(start, stop), ...]`` of the base dataframe
+            str
+                data step sizes
+
+        Examples
+        --------
+            >>> df_base, folds, freq = m.crossvalidation_fold_ranges(df, k=5, fold_pct=0.1)
+            >>> for train_rows, val_rows in folds:
+            ...     m_fold = NeuralProphet(n_lags=7)
+            ...     metrics = m_fold.fit(df_base, freq=freq, rows=train_rows, validation_rows=val_rows)
+        """
+        df = df.copy(deep=True)
+        df, _, _, _ = df_utils.check_multiple_series_id(df)
+        df = _check_dataframe(self, df, check_y=True, exogenous=True)
+        freq = df_utils.infer_frequency(df, n_lags=self.config_model.max_lags, freq=freq)
+        # Add missing dates and drop rows as the imputation does, but leave the imputation of values to each fold
+        df = _handle_missing_data(
+            df=df,
+            freq=freq,
+            n_lags=self.config_ar.n_lags,
+            n_forecasts=self.config_model.n_forecasts,
+            config_missing=dataclasses.replace(self.config_missing, impute_missing=False),
+            config_regressors=self.config_regressors,
+            config_lagged_regressors=self.config_lagged_regressors,
+            config_events=self.config_events,
+            config_seasonality=self.config_seasonality,
+            predicting=False,
+        )
+        df = df.sort_values("ID", kind="stable").reset_index(drop=True)
+        folds = df_utils.crossvalidation_fold_ranges(
+            df,
+            n_lags=self.config_model.max_lags,
+            n_forecasts=self.config_model.n_forecasts,
+            k=k,
+            fold_pct=fold_pct,
+            fold_overlap_pct=fold_overlap_pct,
+            global_model_cv_type=global_model_cv_type,
+        )
+        return df, folds, freq
+
     def double_crossvalidation_split_df(
         self,
         df: pd.DataFrame,
@@ -2005,34 +2554,29 @@ class NeuralProphet:
         df = df.copy(deep=True)
         df, received_ID_col, received_single_time_series, _ = df_utils.check_multiple_series_id(df)
 
+        # Events and regressors without ID apply to all time series
         if events_df is not None:
             events_df = events_df.copy(deep=True)
             events_df, events_df_received_ID_col, _, _ = df_utils.check_multiple_series_id(events_df)
-            events_dict = df_utils.create_dict_for_events_or_regressors(
-                df, events_df, "events", events_df_received_ID_col
-            )
+            if not events_df_received_ID_col:
+                events_df = events_df.drop("ID", axis=1)
         if regressors_df is not None:
             regressors_df = regressors_df.copy(deep=True)
             regressors_df, regressors_df_received_ID_col, _, _ = df_utils.check_multiple_series_id(regressors_df)
-            regressors_dict = df_utils.create_dict_for_events_or_regressors(
-                df, regressors_df, "regressors", regressors_df_received_ID_col
-            )
+            if not regressors_df_received_ID_col:
+                regressors_df = regressors_df.drop("ID", axis=1)
 
-        df_future_dataframe = pd.DataFrame()
-        for df_name, df_i in df.groupby("ID"):
-            df_aux = _make_future_dataframe(
-                model=self,
-                df=df_i,
-                events_df=events_dict[df_name] if events_df is not None else None,
-                regressors_df=regressors_dict[df_name] if regressors_df is not None else None,
-                periods=periods,
-                n_historic_predictions=n_historic_predictions,
-                n_forecasts=self.config_model.n_forecasts,
-                max_lags=self.config_model.max_lags,
-                freq=self.data_freq,
-            )
-            df_aux["ID"] = df_name
-            df_future_dataframe = pd.concat((df_future_dataframe, df_aux), ignore_index=True)
+        df_future_dataframe = _make_future_dataframe(
+            model=self,
+            df=df,
+            events_df=events_df,
+            regressors_df=regressors_df,
+            periods=periods,
+            n_historic_predictions=n_historic_predictions,
+            n_forecasts=self.config_model.n_forecasts,
+            max_lags=self.config_model.max_lags,
+            freq=self.data_freq,
+        )
 
         df_future = df_utils.return_df_in_original_format(
             df_future_dataframe, received_ID_col, received_single_time_series
@@ -2114,7 +2658,8 @@ class NeuralProphet:
                 meta_name_tensor = None
 
             quantile_index = self.config_model.quantiles.index(quantile)
-            trend = self.model.trend(t, meta_name_tensor).detach().numpy()[:, :, quantile_index].squeeze()
+            with torch.no_grad():
+                trend = self.model.trend(t, meta_name_tensor).numpy()[:, :, quantile_index].squeeze()
 
             data_params = self.config_normalization.get_data_params(df_name)
             trend = trend * data_params["y"].scale + data_params["y"].shift
@@ -2149,79 +2694,199 @@ class NeuralProphet:
         prev_n_forecasts = self.config_model.n_forecasts
         prev_predict_components_stacker = self.model.components_stacker["predict"]
 
-        self.config_model.max_lags = 0
-        self.config_ar.n_lags = 0
-        self.config_model.n_forecasts = 1
+        try:
+            self.config_model.max_lags = 0
+            self.config_ar.n_lags = 0
+            self.config_model.n_forecasts = 1
 
-        df = df.copy(deep=True)
-        df, received_ID_col, received_single_time_series, _ = df_utils.check_multiple_series_id(df)
-        df = _check_dataframe(self, df, check_y=False, exogenous=False)
-        df = _normalize(df=df, config_normalization=self.config_normalization)
-        for df_name, df_i in df.groupby("ID"):
-            feature_unstackor = utils_time_dataset.ComponentStacker(
-                n_lags=0,
-                max_lags=0,
-                n_forecasts=1,
-                config_seasonality=self.config_seasonality,
-                lagged_regressor_config=None,
-            )
-            dataset = time_dataset.TimeDataset(
-                df=df_i,
-                components_stacker=feature_unstackor,
-                predict_mode=True,
-                config_model=self.config_model,
-                config_missing=self.config_missing,
-                config_ar=self.config_ar,
-                config_seasonality=self.config_seasonality,
-                config_events=None,
-                config_country_holidays=None,
-                config_regressors=None,
-                config_lagged_regressors=None,
-            )
-            self.model.set_components_stacker(feature_unstackor, mode="predict")
-            loader = DataLoader(dataset, batch_size=min(4096, len(df)), shuffle=False, drop_last=False)
-            predicted = {}
-            for name in self.config_seasonality.periods:
-                predicted[name] = list()
-            for inputs_tensor, meta in loader:
-                # Meta as a tensor for prediction
-                if self.model.config_seasonality is None:
-                    meta_name_tensor = None
-                elif self.model.config_seasonality.global_local in ["local", "glocal"]:
-                    meta = OrderedDict()
-                    time_input = feature_unstackor.unstack("time", inputs_tensor)
-                    meta["df_name"] = [df_name for _ in range(time_input.shape[0])]
-                    meta_name_tensor = torch.tensor([self.model.id_dict[i] for i in meta["df_name"]])  # type: ignore
-                else:
-                    meta_name_tensor = None
-                seasonalities_input = feature_unstackor.unstack("seasonalities", inputs_tensor)
+            df = df.copy(deep=True)
+            df, received_ID_col, received_single_time_series, _ = df_utils.check_multiple_series_id(df)
+            df = _check_dataframe(self, df, check_y=False, exogenous=False)
+            df = _normalize(df=df, config_normalization=self.config_normalization)
+            for df_name, df_i in df.groupby("ID"):
+                feature_unstackor = utils_time_dataset.ComponentStacker(
+                    n_lags=0,
+                    max_lags=0,
+                    n_forecasts=1,
+                    config_seasonality=self.config_seasonality,
+                    lagged_regressor_config=None,
+                )
+                dataset = time_dataset.TimeDataset(
+                    df=df_i,
+                    components_stacker=feature_unstackor,
+                    predict_mode=True,
+                    config_model=self.config_model,
+                    config_missing=self.config_missing,
+                    config_ar=self.config_ar,
+                    config_seasonality=self.config_seasonality,
+                    config_events=None,
+                    config_country_holidays=None,
+                    config_regressors=None,
+                    config_lagged_regressors=None,
+                )
+                self.model.set_components_stacker(feature_unstackor, mode="predict")
+                loader = DataLoader(dataset, batch_size=min(4096, len(df)), shuffle=False, drop_last=False)
+                predicted = {}
                 for name in self.config_seasonality.periods:
-                    features = seasonalities_input[name]
-                    quantile_index = self.config_model.quantiles.index(quantile)
-                    y_season = torch.squeeze(
-                        self.model.seasonality.compute_fourier(features=features, name=name, meta=meta_name_tensor)[
-                            :, :, quantile_index
-                        ]
-                    )
-                    predicted[name].append(y_season.data.numpy())
-
-            for name in self.config_seasonality.periods:
-                predicted[name] = np.concatenate(predicted[name])
-                if self.config_seasonality.mode == "additive":
-                    data_params = self.config_normalization.get_data_params(df_name)
-                    predicted[name] = predicted[name] * data_params["y"].scale
-            df_i = df_i[:: self.config_model.prediction_frequency].reset_index(drop=True)  # this may cause a bug
-            df_aux = pd.DataFrame({"ds": df_i["ds"], "ID": df_i["ID"], **predicted})
-            df_seasonal = pd.concat((df_seasonal, df_aux), ignore_index=True)
-        df = df_utils.return_df_in_original_format(df_seasonal, received_ID_col, received_single_time_series)
-        # reset possibly altered values
-        self.config_ar.n_lags = prev_n_lags
-        self.config_model.max_lags = prev_max_lags
-        self.config_model.n_forecasts = prev_n_forecasts
-        self.model.components_stacker["predict"] = prev_predict_components_stacker
+                    predicted[name] = list()
+                for inputs_tensor, meta in loader:
+                    # Meta as a tensor for prediction
+                    if self.model.config_seasonality is None:
+                        meta_name_tensor = None
+                    elif self.model.config_seasonality.global_local in ["local", "glocal"]:
+                        meta = OrderedDict()
+                        time_input = feature_unstackor.unstack("time", inputs_tensor)
+                        meta["df_name"] = [df_name for _ in range(time_input.shape[0])]
+                        meta_name_tensor = torch.tensor(
+                            [self.model.id_dict[i] for i in meta["df_name"]]  # type: ignore
+                        )
+                    else:
+                        meta_name_tensor = None
+                    seasonalities_input = feature_unstackor.unstack("seasonalities", inputs_tensor)
+                    for name in self.config_seasonality.periods:
+                        features = seasonalities_input[name]
+                        quantile_index = self.config_model.quantiles.index(quantile)
+                        y_season = torch.squeeze(
+                            self.model.seasonality.compute_fourier(features=features, name=name, meta=meta_name_tensor)[
+                                :, :, quantile_index
+                            ]
+                        )
+                        predicted[name].append(y_season.data.numpy())
+
+                for name in self.config_seasonality.periods:
+                    predicted[name] = np.concatenate(predicted[name])
+                    if self.config_seasonality.mode == "additive":
+                        data_params = self.config_normalization.get_data_params(df_name)
+                        predicted[name] = predicted[name] * data_params["y"].scale
+                df_i = df_i[:: self.config_model.prediction_frequency].reset_index(drop=True)  # this may cause a bug
+                df_aux = pd.DataFrame({"ds": df_i["ds"], "ID": df_i["ID"], **predicted})
+                df_seasonal = pd.concat((df_seasonal, df_aux), ignore_index=True)
+            df = df_utils.return_df_in_original_format(df_seasonal, received_ID_col, received_single_time_series)
+        finally:
+            # reset possibly altered values
+            self.config_ar.n_lags = prev_n_lags
+            self.config_model.max_lags = prev_max_lags
+            self.config_model.n_forecasts = prev_n_forecasts
+            if prev_predict_components_stacker is None:
+                self.model.components_stacker["predict"] = None
+                self.model.unstack_plans["predict"] = None
+            else:
+                self.model.set_components_stacker(prev_predict_components_stacker, mode="predict")
 
         return df
 
+    def predict_component_curves(
+        self,
+        df_names: Optional[List[str]] = None,
+        components: Optional[List[str]] = None,
+        weekly_start: int = 0,
+        yearly_start: int = 0,
+    ):
+        """Predicts the trend and seasonality curves shown by ``plot_parameters`` for many time series at once.
+
+        Each component is predicted for all time series and quantiles in a single forward pass. The curves are cached
+        on the model, so that subsequent plots of any time series or quantile reuse them until the model is fitted again.
+
+        Parameters
+        ----------
+            df_names : list of str
+                IDs of the time series, defaults to all time series of the training data
+            components : list of str
+                ``trend`` and/or names of seasonalities, defaults to the trend and all seasonalities
+            weekly_start : int
+                specifying the start day of the weekly seasonality, see :meth:`plot_parameters`
+            yearly_start : int
+                specifying the start day of the yearly seasonality, see :meth:`plot_parameters`
+
+        Returns
+        -------
+            dict
+                long dataframe with columns ``ID``, ``quantile``, ``ds`` (or ``t`` for seasonalities without dates) and
+                the component, for each component
+
+        Examples
+        --------
+            >>> curves = m.predict_component_curves()
+            >>> curves["weekly"].query("quantile == 0.5")
+        """
+        if not self.fitted:
+            raise ValueError("The model needs to be fitted before its components can be predicted.")
+        if df_names is None:
+            df_names = list(self.id_list)
+        season_names = [] if self.config_seasonality is None else list(self.config_seasonality.periods.keys())
+        if components is None:
+            components = ["trend"] + season_names
+        for component in components:
+            if component != "trend" and component not in season_names:
+                raise ValueError(f"Component {component} is not part of the model.")
+
+        curves = get_component_cache(self)
+        result = {}
+        for component in components:
+            if component == "trend":
+                result[component] = self._predict_trend_curves(df_names)
+                continue
+            dates = get_season_dates(self, component, weekly_start=weekly_start, yearly_start=yearly_start)
+            if dates is not None:
+                # Predicted and cached for all quantiles, the median is only used to fill the cache
+                predict_seasons_from_dates(self, dates, component, self.config_model.quantiles[0], df_names)
+                key_tail, x_name = (len(dates), pd.Timestamp(dates[0]), pd.Timestamp(dates[-1])), "ds"
+            else:
+                config = self.config_seasonality.periods[component]
+                t_i = np.arange(301) / 300.0 * config.period
+                missing = [
+                    df_name
+                    for df_name in df_names
+                    if (component, self.config_model.quantiles[0], df_name, len(t_i), None, None) not in curves
+                ]
+                if len(missing) > 0:
+                    features = fourier_series_numpy_numeric(t=t_i, period=config.period, series_order=config.resolution)
+                    predict_season_curves(self, component, features, t_i, missing)
+                key_tail, x_name = (len(t_i), None, None), "t"
+            frames = []
+            for df_name in df_names:
+                for quantile in self.config_model.quantiles:
+                    x, curve = curves[(component, quantile, df_name, *key_tail)]
+                    frames.append(pd.DataFrame({"ID": df_name, "quantile": quantile, x_name: x, component: curve}))
+            result[component] = pd.concat(frames, ignore_index=True)
+        return result
+
+    def _predict_trend_curves(self, df_names: List[str]) -> pd.DataFrame:
+        # Trend over the training period of each time series, predicted in one forward pass for all missing curves
+        curves = get_component_cache(self)
+        quantiles = self.config_model.quantiles
+        dates = {df_name: get_trend_dates(self, df_name) for df_name in df_names}
+        keys = {df_name: (len(dates[df_name]), dates[df_name][0], dates[df_name][-1]) for df_name in df_names}
+        missing = [df_name for df_name in df_names if ("trend", quantiles[0], df_name, *keys[df_name]) not in curves]
+        if len(missing) > 0:
+            df = pd.DataFrame(
+                {
+                    "ds": np.concatenate([dates[df_name] for df_name in missing]),
+                    "ID": np.repeat(np.asarray(missing, dtype=object), [len(dates[df_name]) for df_name in missing]),
+                }
+            )
+            df = _check_dataframe(self, df, check_y=False, exogenous=False)
+            df = _normalize(df=df, config_normalization=self.config_normalization)
+            t = torch.from_numpy(np.expand_dims(df["t"].values, 1))
+            meta_name_tensor = None
+            if self.meta_used_in_model:
+                meta_name_tensor = torch.tensor(df["ID"].map(self.model.id_dict).to_numpy())
+            with torch.no_grad():
+                trend = self.model.trend(t, meta_name_tensor).numpy()[:, 0, :]
+            ids = df["ID"].to_numpy()
+            for df_name in missing:
+                rows = ids == df_name
+                data_params = self.config_normalization.get_data_params(df_name)
+                for quantile_index, quantile in enumerate(quantiles):
+                    trend_i = trend[rows, quantile_index] * data_params["y"].scale + data_params["y"].shift
+                    curves[("trend", quantile, df_name, *keys[df_name])] = (df["ds"].to_numpy()[rows], trend_i)
+        frames = []
+        for df_name in df_names:
+            for quantile in quantiles:
+                ds, trend = curves[("trend", quantile, df_name, *keys[df_name])]
+                frames.append(pd.DataFrame({"ID": df_name, "quantile": quantile, "ds": ds, "trend": trend}))
+        return pd.concat(frames, ignore_index=True)
+
     def set_true_ar_for_eval(self, true_ar_weights: np.ndarray):
         """Configures model to evaluate closeness of AR weights to true weights.
 
@@ -2284,6 +2949,8 @@ class NeuralProphet:
         figsize: Tuple[int, int] = (10, 6),
         forecast_in_focus: Optional[int] = None,
         plotting_backend: Optional[str] = None,
+        max_points: Optional[int] = None,
+        downsample_method: str = "lttb",
     ):
         """Plot the NeuralProphet forecast, including history.
 
@@ -2321,6 +2988,18 @@ class NeuralProphet:
                 Note
                 ----
                 None (default): plot self.highlight_forecast_step_n by default
+            max_points : int
+                optional, target number of points of each line, to which long forecasts are downsampled.
+
+                Note
+                ----
+                None (default): plot all points
+            downsample_method : str
+                method to downsample with if ``max_points`` is set, see :func:`plot_utils.downsample_fcst`.
+
+                Options
+                * (default) ``lttb``: Largest-Triangle-Three-Buckets, keeps the visual shape of the lines
+                * ``minmax``: minimum and maximum of each bucket, keeps all extremes
         """
         fcst = fcst.copy(deep=True)
         fcst, received_ID_col, received_single_time_series, _ = df_utils.check_multiple_series_id(fcst)
@@ -2370,6 +3049,12 @@ class NeuralProphet:
                     plot_history_data=True,
                 )
 
+        if max_points is not None:
+            columns = get_forecast_plot_columns(
+                self.config_model.quantiles, self.config_model.n_forecasts, highlight_forecast=forecast_in_focus
+            )
+            fcst = downsample_fcst(fcst, max_points=max_points, method=downsample_method, columns=columns)
+
         plotting_backend = select_plotting_backend(model=self, plotting_backend=plotting_backend)
 
         log_warning_deprecation_plotly(plotting_backend)
@@ -2438,7 +3123,8 @@ class NeuralProphet:
         """
         if self.config_model.max_lags == 0:
             raise ValueError("Use the standard plot function for models without lags.")
-        fcst = fcst.copy(deep=True)
+        # The forecast is only read, a shallow copy protects it from the added ID column
+        fcst = fcst.copy(deep=False)
         fcst, received_ID_col, received_single_time_series, _ = df_utils.check_multiple_series_id(fcst)
         if not received_single_time_series:
             if df_name not in fcst["ID"].unique():
@@ -2596,6 +3282,8 @@ class NeuralProphet:
         plotting_backend: Optional[str] = None,
         components: Union[None, str, List[str]] = None,
         one_period_per_season: bool = False,
+        max_points: Optional[int] = None,
+        downsample_method: str = "lttb",
     ):
         """Plot the NeuralProphet forecast components.
 
@@ -2646,6 +3334,18 @@ class NeuralProphet:
                 * ``uncertainty``
             one_period_per_season : bool
                 Plot one period per season, instead of the true seasonal components of the forecast.
+            max_points : int
+                optional, target number of points of each component, to which long forecasts are downsampled.
+
+                Note
+                ----
+                None (default): plot all points
+            downsample_method : str
+                method to downsample with if ``max_points`` is set, see :func:`plot_utils.downsample_fcst`.
+
+                Options
+                * (default) ``lttb``: Largest-Triangle-Three-Buckets, keeps the visual shape of the lines
+                * ``minmax``: minimum and maximum of each bucket, keeps all extremes
 
         Returns
         -------
@@ -2708,6 +3408,10 @@ class NeuralProphet:
             forecast_in_focus=forecast_in_focus,
         )
 
+        if max_points is not None:
+            columns = get_components_plot_columns(valid_plot_configuration, one_period_per_season=one_period_per_season)
+            fcst = downsample_fcst(fcst, max_points=max_points, method=downsample_method, columns=columns)
+
         # Check whether a local or global plotting backend is set.
         plotting_backend = select_plotting_backend(model=self, plotting_backend=plotting_backend)
 
@@ -2951,6 +3655,47 @@ class NeuralProphet:
             metrics_enabled=bool(self.metrics),
         )
 
+    def _predict_batches(self, loader):
+        """Runs the prediction step of the model on all batches of the loader, without a Lightning trainer.
+
+        Parameters
+        ----------
+            loader : DataLoader
+                loader of the dataset to predict
+
+        Returns
+        -------
+            list
+                predictions and components of each batch on the CPU, as returned by ``trainer.predict``
+        """
+        result = []
+        with self._inference():
+            for batch_idx, (inputs_tensor, meta) in enumerate(loader):
+                inputs_tensor = inputs_tensor.to(self.model.device)
+                prediction, components = self.model.predict_step((inputs_tensor, meta), batch_idx)
+                if components is not None:
+                    components = {name: value.cpu() for name, value in components.items()}
+                result.append((prediction.cpu(), components))
+        return result
+
+    @contextlib.contextmanager
+    def _inference(self):
+        """Context manager running the model in evaluation and inference mode, without a Lightning trainer.
+
+        Applies the autocast of the configured training precision, and restores the training mode of the model on exit.
+        """
+        precision = getattr(self.config_train, "precision", "32-true")
+        autocast = contextlib.nullcontext()
+        if precision == "bf16-mixed":
+            autocast = torch.autocast(device_type=self.model.device.type, dtype=torch.bfloat16)
+        was_training = self.model.training
+        self.model.eval()
+        try:
+            with torch.inference_mode(), autocast:
+                yield
+        finally:
+            self.model.train(was_training)
+
     def _eval_true_ar(self):
         assert self.config_model.max_lags > 0
         if self.highlight_forecast_step_n is None:
@@ -3014,7 +3759,8 @@ class NeuralProphet:
             config_seasonality=self.config_seasonality,
             lagged_regressor_config=self.config_lagged_regressors,
         )
-        dataset = self._create_dataset(df, predict_mode=True, components_stacker=components_stacker)
+        with profiling.stage(self, "create_dataset"):
+            dataset = self._create_dataset(df, predict_mode=True, components_stacker=components_stacker)
         self.model.set_components_stacker(components_stacker, mode="predict")
         loader = DataLoader(dataset, batch_size=min(1024, len(df)), shuffle=False, drop_last=False)
         if self.config_model.n_forecasts > 1:
@@ -3027,7 +3773,12 @@ class NeuralProphet:
             self.model.set_compute_components(include_components)
             self.model.set_covar_weights(self.model.get_covar_weights())
         # Compute the predictions and components (if requested)
-        result = self.trainer.predict(self.model, loader)
+        with profiling.stage(self, "forward"):
+            if self.trainer is not None:
+                result = self.trainer.predict(self.model, loader)
+            else:
+                # e.g. a loaded model, for which setting up a trainer would dominate the prediction time
+                result = self._predict_batches(loader)
         # unstack the prediction and components
         predicted, component_vectors = zip(*result)
         predicted = np.concatenate(predicted)
@@ -3168,6 +3919,60 @@ class NeuralProphet:
 
         return df_forecast
 
+    def conformal_calibrator(
+        self,
+        calibration_df: pd.DataFrame,
+        alpha: Union[float, Tuple[float, float]],
+        method: str = "naive",
+        window: Optional[int] = None,
+    ) -> OnlineConformal:
+        """Create a conformal prediction calibrator, which can be updated incrementally with new calibration data.
+
+        Unlike :meth:`conformal_predict`, the calibration data is predicted and scored only once. Later calibration
+        data, e.g. recent forecasts for which the actual values became available, updates the q-hats with its own
+        nonconformity scores only.
+
+        Parameters
+        ----------
+            calibration_df : pd.DataFrame
+                holdout calibration dataframe for split conformal prediction
+            alpha : float or tuple
+                user-specified significance level of the prediction interval, float if coverage error spread arbitrarily
+                over left and right tails, tuple of two floats for different coverage error over left and right tails
+                respectively
+            method : str
+                name of conformal prediction technique used
+
+                Options
+                    * (default) ``naive``: Naive or Absolute Residual
+                    * ``cqr``: Conformalized Quantile Regression
+            window : int
+                number of most recent nonconformity scores per forecast step used for calibration,
+                all scores are used if None (default)
+
+        Returns
+        -------
+            OnlineConformal
+                calibrator with the q-hats of the calibration data
+
+        Examples
+        --------
+            >>> calibrator = m.conformal_calibrator(calibration_df, alpha=0.1, window=365)
+            >>> forecast = calibrator.predict(m.predict(future))
+        Once the actual values of new dates are known, the q-hats are updated with the forecasts of these dates.
+            >>> forecast_new = m.predict(df)
+            >>> calibrator.update(forecast_new[forecast_new["ds"] > last_calibration_date])
+        """
+        c = OnlineConformal(
+            alpha=alpha,
+            method=method,
+            n_forecasts=self.config_model.n_forecasts,
+            quantiles=self.config_model.quantiles,
+            window=window,
+        )
+        c.update(self.predict(calibration_df))
+        return c
+
     def conformal_plot(
         self,
         df: pd.DataFrame,
@@ -24,4 +24,8 @@ SeasonGlobalLocalMode = Literal["global", "local", "glocal"]
 
 FutureRegressorsModel = Literal["linear", "neural_nets", "shared_neural_nets"]
 
+PrecisionMode = Literal["32", "32-true", "bf16", "bf16-mixed"]
+
+SaveFormat = Literal["state", "torch"]
+
 Components = Dict[str, torch.Tensor]
@@ -0,0 +1,242 @@
+import io
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import matplotlib
+import pandas as pd
+import torch
+from matplotlib import pyplot as plt
+
+from neuralprophet.utils import load, save
+
+log = logging.getLogger("NP.plot_export")
+
+PLOTS = ["forecast", "components", "parameters"]
+MATPLOTLIB_FORMATS = ["png", "svg", "pdf", "jpg"]
+PLOTLY_FORMATS = ["html", "png", "svg", "pdf", "jpg", "webp"]
+
+# Export settings and reusable figures of a worker process, set by the pool initializer
+_worker_state = {}
+
+
+def export_figures(
+    jobs: Sequence[Tuple],
+    output_dir: str,
+    names: Optional[Sequence[str]] = None,
+    plots: Sequence[str] = ("forecast",),
+    plotting_backend: str = "matplotlib",
+    file_format: str = "png",
+    num_workers: Optional[int] = None,
+    figsize: Tuple[int, int] = (10, 6),
+    dpi: int = 100,
+    plot_kwargs: Optional[dict] = None,
+) -> Tuple[pd.DataFrame, dict]:
+    """Renders the plots of many (model, forecast) pairs to files, in parallel worker processes.
+
+    Figures are rendered headless and written directly to ``output_dir``, named ``<name>_<plot>.<file_format>``.
+    Forecasts of many time series are plotted per ID, named ``<name>_<ID>_<plot>.<file_format>``. With matplotlib,
+    each worker draws all forecast plots on the same figure, which is cleared between plots instead of being rebuilt.
+
+    Parameters
+    ----------
+        jobs : list of tuple
+            ``(model, forecast)`` pairs of a fitted ``NeuralProphet`` model and the output of its ``predict``
+        output_dir : str
+            directory to write the files to, created if needed
+        names : list of str
+            file name prefix of each job, defaults to its position in ``jobs``
+        plots : list of str
+            plots to render for each job
+
+            Options
+                * ``forecast``: :meth:`NeuralProphet.plot`
+                * ``components``: :meth:`NeuralProphet.plot_components`
+                * ``parameters``: :meth:`NeuralProphet.plot_parameters`
+        plotting_backend : str
+            ``matplotlib`` (rendered with Agg) or ``plotly`` (images rendered with kaleido)
+        file_format : str
+            file format, ``png``, ``svg``, ``pdf`` or ``jpg``, additionally ``html`` or ``webp`` for plotly
+        num_workers : int
+            number of worker processes. Defaults to the number of models, limited by the number of CPUs.
+            With ``0`` or ``1`` worker, the figures are rendered sequentially in the current process.
+        figsize : tuple
+            width, height in inches
+        dpi : int
+            resolution of raster images rendered with matplotlib
+        plot_kwargs : dict
+            additional arguments of each plot, e.g. ``{"forecast": {"max_points": 2000}}``
+
+    Returns
+    -------
+        pd.DataFrame
+            one row per written file, with its ``name``, ``ID``, ``plot``, ``path``, ``bytes`` and render ``seconds``
+        dict
+            throughput of the export: number of ``figures``, wall clock ``seconds``, ``figures_per_second``,
+            ``bytes`` written and number of ``workers``
+
+    Examples
+    --------
+        >>> from neuralprophet import export_figures
+        >>> files, throughput = export_figures(
+        ...     [(m1, forecast1), (m2, forecast2)], "plots", names=["store1", "store2"], plots=["forecast", "components"]
+        ... )
+    """
+    for plot_name in plots:
+        if plot_name not in PLOTS:
+            raise ValueError(f"Unknown plot {plot_name}, valid plots are {PLOTS}.")
+    if plotting_backend not in ["matplotlib", "plotly"]:
+        raise ValueError("Batch export supports the plotting backends matplotlib and plotly.")
+    valid_formats = MATPLOTLIB_FORMATS if plotting_backend == "matplotlib" else PLOTLY_FORMATS
+    if file_format not in valid_formats:
+        raise ValueError(
+            f"File format {file_format} is not supported by {plotting_backend}, use one of {valid_formats}."
+        )
+    jobs = list(jobs)
+    if names is None:
+        names = [str(i) for i in range(len(jobs))]
+    if len(names) != len(jobs):
+        raise ValueError("names needs to contain one name per job.")
+    os.makedirs(output_dir, exist_ok=True)
+    settings = {
+        "output_dir": output_dir,
+        "plots": list(plots),
+        "plotting_backend": plotting_backend,
+        "file_format": file_format,
+        "figsize": figsize,
+        "dpi": dpi,
+        "plot_kwargs": {} if plot_kwargs is None else plot_kwargs,
+    }
+
+    # Jobs sharing a model are rendered together, so that each model is transferred to a worker only once
+    tasks = {}
+    for name, (model, fcst) in zip(names, jobs):
+        tasks.setdefault(id(model), (model, []))[1].append((name, fcst))
+
+    if num_workers is None:
+        num_workers = min(len(tasks), os.cpu_count() or 1)
+    start = time.perf_counter()
+    if num_workers <= 1:
+        _worker_state.update(settings=settings)
+        try:
+            results = [_export_model(model, model_jobs) for model, model_jobs in tasks.values()]
+        finally:
+            _close_templates()
+            _worker_state.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(settings,),
+        ) as pool:
+            futures = [pool.submit(_export_model, _to_bytes(model), model_jobs) for model, model_jobs in tasks.values()]
+            results = [future.result() for future in futures]
+    seconds = time.perf_counter() - start
+
+    files = pd.DataFrame(
+        [row for rows in results for row in rows], columns=["name", "ID", "plot", "path", "bytes", "seconds"]
+    )
+    throughput = {
+        "figures": len(files),
+        "seconds": seconds,
+        "figures_per_second": len(files) / seconds if seconds > 0 else float("nan"),
+        "bytes": int(files["bytes"].sum()),
+        "workers": max(1, num_workers),
+    }
+    log.info(
+        f"Exported {throughput['figures']} figures in {seconds:.2f}s "
+        f"({throughput['figures_per_second']:.1f} figures/s, {throughput['workers']} workers)."
+    )
+    return files, throughput
+
+
+def _to_bytes(model) -> bytes:
+    buffer = io.BytesIO()
+    save(model, buffer)
+    return buffer.getvalue()
+
+
+def _init_worker(settings: dict):
+    matplotlib.use("Agg")
+    torch.set_num_threads(1)
+    _worker_state.update(settings=settings)
+
+
+def _close_templates():
+    for fig, _ in _worker_state.get("templates", {}).values():
+        plt.close(fig)
+
+
+def _get_template(figsize: Tuple[int, int]):
+    # Empty figure of the forecast plots, reused by all forecast plots of a worker
+    templates = _worker_state.setdefault("templates", {})
+    if figsize not in templates:
+        fig = plt.figure(facecolor="w", figsize=figsize)
+        templates[figsize] = (fig, fig.add_subplot(111))
+    fig, ax = templates[figsize]
+    ax.clear()
+    return fig, ax
+
+
+def _export_model(model, model_jobs: List[Tuple[str, pd.DataFrame]]) -> List[dict]:
+    if isinstance(model, bytes):
+        model = load(io.BytesIO(model))
+    settings = _worker_state["settings"]
+    rows = []
+    for name, fcst in model_jobs:
+        df_names = list(fcst["ID"].unique()) if "ID" in fcst.columns else ["__df__"]
+        for df_name in df_names:
+            stem = name if len(df_names) == 1 else f"{name}_{df_name}"
+            for plot_name in settings["plots"]:
+                path = os.path.join(settings["output_dir"], f"{stem}_{plot_name}.{settings['file_format']}")
+                tic = time.perf_counter()
+                _render(model, fcst, df_name, plot_name, path, settings)
+                rows.append(
+                    {
+                        "name": name,
+                        "ID": df_name,
+                        "plot": plot_name,
+                        "path": path,
+                        "bytes": os.path.getsize(path),
+                        "seconds": time.perf_counter() - tic,
+                    }
+                )
+    return rows
+
+
+def _render(model, fcst: pd.DataFrame, df_name: str, plot_name: str, path: str, settings: dict):
+    figsize = settings["figsize"]
+    kwargs = dict(settings["plot_kwargs"].get(plot_name, {}))
+    if df_name != "__df__":
+        kwargs["df_name"] = df_name
+
+    if settings["plotting_backend"] == "plotly":
+        if plot_name == "forecast":
+            fig = model.plot(fcst, figsize=figsize, plotting_backend="plotly", **kwargs)
+        elif plot_name == "components":
+            fig = model.plot_components(fcst, figsize=figsize, plotting_backend="plotly", **kwargs)
+        else:
+            fig = model.plot_parameters(figsize=figsize, plotting_backend="plotly", **kwargs)
+        if settings["file_format"] == "html":
+            fig.write_html(path, include_plotlyjs="cdn")
+        else:
+            fig.write_image(path, format=settings["file_format"])
+        return
+
+    if plot_name == "forecast":
+        fig, ax = _get_template(figsize)
+        model.plot(fcst, ax=ax, figsize=figsize, plotting_backend="matplotlib", **kwargs)
+        fig.savefig(path, format=settings["file_format"], dpi=settings["dpi"])
+        return
+    # Components and parameters are laid out on a new figure, which is the current figure after plotting
+    if plot_name == "components":
+        model.plot_components(fcst, figsize=figsize, plotting_backend="matplotlib", **kwargs)
+    else:
+        model.plot_parameters(figsize=figsize, plotting_backend="matplotlib", **kwargs)
+    fig = plt.gcf()
+    fig.savefig(path, format=settings["file_format"], dpi=settings["dpi"])
+    plt.close(fig)
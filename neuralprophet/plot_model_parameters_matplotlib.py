@@ -5,7 +5,13 @@ import logging
 import numpy as np
 import pandas as pd
 
-from neuralprophet.plot_utils import predict_one_season, predict_season_from_dates, set_y_as_percent
+from neuralprophet.plot_utils import (
+    predict_one_season,
+    predict_season_from_dates,
+    predict_seasons_from_dates,
+    predict_trend_curves,
+    set_y_as_percent,
+)
 
 log = logging.getLogger("NP.plotting")
 
@@ -284,24 +290,13 @@ def plot_trend(m, quantile, ax=None, plot_name="Trend", figsize=(10, 6), df_name
             df_name = [df_name]
             # if global df with no specified df_name: plot mean and std, otherwise: don't
             mean_std = False
-        df_y = pd.DataFrame()
-        for df_name_i in df_name:
-            data_params = m.config_normalization.get_data_params(df_name_i)
-            t_start = data_params["ds"].shift
-            t_end = t_start + data_params["ds"].scale
-            quantile_index = m.model.quantiles.index(quantile)
-
-            days = pd.date_range(start=t_start, end=t_end, freq=m.data_freq)
-            df_i = pd.DataFrame({"ds": days})
-            df_i["ID"] = df_name_i
-            df_y = pd.concat((df_y, df_i), ignore_index=True)
-
-        df_trend = m.predict_trend(df=df_y, quantile=quantile)
+        df_trend = predict_trend_curves(m, quantile=quantile, df_names=df_name)
+        df_y = df_trend[["ds", "ID"]]
 
         if mean_std:
-            df_trend_q90 = df_trend.groupby("ds")[["trend"]].apply(lambda x: x.quantile(0.9))
-            df_trend_q10 = df_trend.groupby("ds")[["trend"]].apply(lambda x: x.quantile(0.1))
-            df_trend = df_trend.groupby("ds")[["trend"]].apply(lambda x: x.mean())
+            df_trend_q90 = df_trend.groupby("ds")[["trend"]].quantile(0.9)
+            df_trend_q10 = df_trend.groupby("ds")[["trend"]].quantile(0.1)
+            df_trend = df_trend.groupby("ds")[["trend"]].mean()
             df_trend["ID"] = m.id_list[0]
             df_y = df_y[df_y["ID"] == m.id_list[0]]
 
@@ -546,14 +541,16 @@ def plot_yearly(
             df_y = pd.concat((df_y, df_i), ignore_index=True)
     if quick:
         predicted = predict_season_from_dates(m, dates=df_y["ds"], name=comp_name, quantile=quantile, df_name=df_name)
+    elif mean_std:
+        predicted = predict_seasons_from_dates(m, dates=days, name=comp_name, quantile=quantile, df_names=m.id_list)
     else:
         predicted = m.predict_seasonal_components(df_y, quantile=quantile)[["ds", "ID", comp_name]]
 
     if mean_std:
         # If more than on ID has been provided, and no df_name has been specified: plot median and quants across all IDs
-        predicted_q90 = predicted.groupby("ds")[[comp_name]].apply(lambda x: x.quantile(0.9))
-        predicted_q10 = predicted.groupby("ds")[[comp_name]].apply(lambda x: x.quantile(0.1))
-        predicted = predicted.groupby("ds")[[comp_name]].apply(lambda x: x.mean())
+        predicted_q90 = predicted.groupby("ds")[[comp_name]].quantile(0.9)
+        predicted_q10 = predicted.groupby("ds")[[comp_name]].quantile(0.1)
+        predicted = predicted.groupby("ds")[[comp_name]].mean()
         predicted["ID"] = m.id_list[0]
         df_y = df_y[df_y["ID"] == m.id_list[0]]
 
@@ -648,15 +645,17 @@ def plot_weekly(
             df_w = pd.concat((df_w, df_i), ignore_index=True)
     if quick:
         predicted = predict_season_from_dates(m, dates=df_w["ds"], name=comp_name, quantile=quantile, df_name=df_name)
+    elif mean_std:
+        predicted = predict_seasons_from_dates(m, dates=days_i, name=comp_name, quantile=quantile, df_names=m.id_list)
     else:
         predicted = m.predict_seasonal_components(df_w, quantile=quantile)[["ds", "ID", comp_name]]
     days = pd.date_range(start="2017-01-01", periods=week_days) + pd.Timedelta(days=weekly_start)
 
     if mean_std:
         # If more than on ID has been provided, and no df_name has been specified: plot median and quants across all IDs
-        predicted_q90 = predicted.groupby("ds")[[comp_name]].apply(lambda x: x.quantile(0.9))
-        predicted_q10 = predicted.groupby("ds")[[comp_name]].apply(lambda x: x.quantile(0.1))
-        predicted = predicted.groupby("ds")[[comp_name]].apply(lambda x: x.mean())
+        predicted_q90 = predicted.groupby("ds")[[comp_name]].quantile(0.9)
+        predicted_q10 = predicted.groupby("ds")[[comp_name]].quantile(0.1)
+        predicted = predicted.groupby("ds")[[comp_name]].mean()
         predicted["ID"] = m.id_list[0]
         df_w = df_w[df_w["ID"] == m.id_list[0]]
 
@@ -736,13 +735,15 @@ def plot_daily(m, quantile, comp_name="daily", quick=True, ax=None, figsize=(10,
             df_d = pd.concat((df_d, df_i), ignore_index=True)
     if quick:
         predicted = predict_season_from_dates(m, dates=df_d["ds"], name=comp_name, quantile=quantile, df_name=df_name)
+    elif mean_std:
+        predicted = predict_seasons_from_dates(m, dates=days, name=comp_name, quantile=quantile, df_names=m.id_list)
     else:
         predicted = m.predict_seasonal_components(df_d, quantile=quantile)[["ds", "ID", comp_name]]
     if mean_std:
         # If more than on ID has been provided, and no df_name has been specified: plot median and quants across all IDs
-        predicted_q90 = predicted.groupby("ds")[[comp_name]].apply(lambda x: x.quantile(0.9))
-        predicted_q10 = predicted.groupby("ds")[[comp_name]].apply(lambda x: x.quantile(0.1))
-        predicted = predicted.groupby("ds")[[comp_name]].apply(lambda x: x.mean())
+        predicted_q90 = predicted.groupby("ds")[[comp_name]].quantile(0.9)
+        predicted_q10 = predicted.groupby("ds")[[comp_name]].quantile(0.1)
+        predicted = predicted.groupby("ds")[[comp_name]].mean()
         predicted["ID"] = m.id_list[0]
         df_d = df_d[df_d["ID"] == m.id_list[0]]
 
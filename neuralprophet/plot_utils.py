@@ -1,10 +1,10 @@
 import logging
 import warnings
-from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 
 import numpy as np
+import pandas as pd
 import torch
 
 from neuralprophet import utils_torch
@@ -87,6 +87,240 @@ def set_y_as_percent(ax):
     return ax
 
 
+def lttb_indices(x, y, n_out):
+    """Selects points of a line with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last point are kept. The points in between are split into ``n_out - 2`` buckets, of which the point
+    forming the largest triangle with the previously selected point and the mean of the next bucket is kept.
+
+    Parameters
+    ----------
+        x : np.array
+            numeric x-values, increasing
+        y : np.array
+            y-values
+        n_out : int
+            number of points to keep
+
+    Returns
+    -------
+        np.array
+            indices of the kept points, increasing
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges = np.append(edges, n)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_x, next_y = x[end : edges[i + 2]].mean(), y[end : edges[i + 2]].mean()
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def minmax_indices(y, n_out):
+    """Selects the minimum and maximum of each of ``(n_out - 2) // 2`` equally sized buckets of a line.
+
+    Parameters
+    ----------
+        y : np.array
+            y-values
+        n_out : int
+            number of points to keep
+
+    Returns
+    -------
+        np.array
+            indices of the kept points, increasing, including the first and last point
+    """
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    # The first and last point are kept in addition to the two points of each bucket
+    bucket_size = int(np.ceil(n / max((n_out - 2) // 2, 1)))
+    n_buckets = int(np.ceil(n / bucket_size))
+    buckets = np.full(n_buckets * bucket_size, np.nan)
+    buckets[:n] = y
+    buckets = buckets.reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+    indices = np.concatenate(
+        ([0, n - 1], offsets + np.nanargmin(buckets, axis=1), offsets + np.nanargmax(buckets, axis=1))
+    )
+    return np.unique(indices)
+
+
+def downsample_fcst(fcst, max_points, method="lttb", columns=None):
+    """Reduces the rows of a forecast dataframe to the points needed to draw the given lines.
+
+    Each of the columns is decimated on its own, and the rows kept for any of them are returned. The result has at
+    most ``len(columns) * max_points`` rows, this bounds the size of the figures of long histories for every
+    plotting backend, as the traces are built from fewer rows. Only the columns that are drawn should be passed,
+    as every decimated column adds its own rows to all traces.
+
+    Parameters
+    ----------
+        fcst : pd.DataFrame
+            output of m.predict, of a single time series
+        max_points : int
+            target number of points per column, at least 4
+        method : str
+            decimation method
+
+            Options
+                * (default) ``lttb``: Largest-Triangle-Three-Buckets, keeps the visual shape of the lines
+                * ``minmax``: minimum and maximum of each bucket, keeps all extremes
+        columns : list of str
+            columns to decimate, columns missing in ``fcst`` are ignored. By default, all numeric columns
+
+    Returns
+    -------
+        pd.DataFrame
+            forecast dataframe with the kept rows
+    """
+    if method not in ["lttb", "minmax"]:
+        raise ValueError(f"Downsampling method {method} is not supported, use 'lttb' or 'minmax'.")
+    if len(fcst) <= max_points:
+        return fcst
+    if columns is None:
+        columns = [
+            name for name in fcst.columns if name not in ["ds", "ID"] and pd.api.types.is_numeric_dtype(fcst[name])
+        ]
+    x = pd.to_datetime(fcst["ds"]).to_numpy().view(np.int64)
+    x = (x - x[0]).astype(np.float64)
+    keep = np.zeros(len(fcst), dtype=bool)
+    for name in dict.fromkeys(columns):
+        if name not in fcst.columns:
+            continue
+        y = fcst[name].to_numpy(dtype=np.float64)
+        valid = np.flatnonzero(~np.isnan(y))
+        if method == "lttb":
+            indices = lttb_indices(x[valid], y[valid], max_points)
+        else:
+            indices = minmax_indices(y[valid], max_points)
+        keep[valid[indices]] = True
+    log.debug(f"Downsampled forecast from {len(fcst)} to {keep.sum()} rows.")
+    return fcst[keep]
+
+
+def get_forecast_plot_columns(quantiles, n_forecasts, highlight_forecast=None):
+    """Returns the forecast columns drawn by the forecast plot, see :meth:`NeuralProphet.plot`.
+
+    Parameters
+    ----------
+        quantiles : list
+            quantiles of the model, the median first
+        n_forecasts : int
+            number of forecast steps
+        highlight_forecast : int
+            forecast step in focus, by default all steps are drawn
+
+    Returns
+    -------
+        list of str
+            names of the drawn columns
+    """
+    steps = range(1, n_forecasts + 1) if highlight_forecast is None else [highlight_forecast]
+    quantile_step = 1 if highlight_forecast is None else highlight_forecast
+    columns = ["y"] + [f"yhat{i}" for i in steps]
+    columns += [f"yhat{quantile_step} {round(quantile * 100, 1)}%" for quantile in quantiles[1:]]
+    return columns
+
+
+def get_components_plot_columns(plot_configuration, one_period_per_season=False):
+    """Returns the forecast columns drawn by the components plot, see :meth:`NeuralProphet.plot_components`.
+
+    Parameters
+    ----------
+        plot_configuration : dict
+            valid plot configuration of the components, see ``get_valid_configuration``
+        one_period_per_season : bool
+            whether seasonalities are drawn for one period, instead of from the forecast
+
+    Returns
+    -------
+        list of str
+            names of the drawn columns
+    """
+    columns = []
+    for comp in plot_configuration["components_list"]:
+        name = comp["plot_name"].lower()
+        if "season" in name:
+            if not one_period_per_season:
+                columns.append(f"season_{comp['comp_name']}")
+        elif "num_overplot" in comp:
+            columns += [f"{comp['comp_name']}{i}" for i in range(1, comp["num_overplot"] + 1)]
+        else:
+            columns.append(comp["comp_name"])
+            if "uncertainty" in name:
+                # the uncertainty is drawn relative to the forecast
+                columns.append("yhat1")
+    return list(dict.fromkeys(columns))
+
+
+def get_component_cache(m):
+    """Returns the cache of component curves of a model, keyed by (component, quantile, df_name, n_steps, start, end).
+
+    The cache is cleared whenever the model is fitted.
+    """
+    if getattr(m, "component_curves", None) is None:
+        m.component_curves = {}
+    return m.component_curves
+
+
+def predict_season_curves(m, name, features, x, df_names, start=None, end=None):
+    """Predicts a seasonal component of all quantiles for many time series in one forward pass, and caches it.
+
+    Parameters
+    ----------
+        m : NeuralProphet
+            Fitted NeuralProphet model
+        name : str
+            Name of seasonality component
+        features : np.array
+            Fourier features of the seasonality, dims (n_steps, n_features)
+        x : np.array
+            time scale or dates of the features
+        df_names : list
+            Names of the time series to predict the seasonality for
+        start : pd.Timestamp
+            first date of the features, None for a time scale
+        end : pd.Timestamp
+            last date of the features, None for a time scale
+
+    Returns
+    -------
+        dict
+            time scale and predicted seasonal component, for each (name, quantile, df_name, n_steps, start, end)
+    """
+    n_steps = features.shape[0]
+    features = torch.from_numpy(np.expand_dims(np.tile(features, (len(df_names), 1)), 1))
+    if list(df_names) == ["__df__"]:
+        meta_name_tensor = None
+    else:
+        meta_name_tensor = torch.tensor([m.model.id_dict[df_name] for df_name in df_names]).repeat_interleave(n_steps)
+    with torch.no_grad():
+        predicted = m.model.seasonality.compute_fourier(features=features, name=name, meta=meta_name_tensor)
+    predicted = predicted[:, 0, :].numpy()
+
+    curves = {}
+    for i, df_name in enumerate(df_names):
+        if m.config_seasonality.mode == "additive":
+            scale = m.config_normalization.get_data_params(df_name)["y"].scale
+        for quantile_index, quantile in enumerate(m.model.quantiles):
+            predicted_i = predicted[i * n_steps : (i + 1) * n_steps, quantile_index]
+            if m.config_seasonality.mode == "additive":
+                predicted_i = predicted_i * scale
+            curves[(name, quantile, df_name, n_steps, start, end)] = (x, predicted_i)
+    get_component_cache(m).update(curves)
+    return curves
+
+
 def predict_one_season(m, quantile, name, n_steps=100, df_name="__df__"):
     """
      Predicts the seasonal component given a number of time steps.
@@ -112,27 +346,14 @@ def predict_one_season(m, quantile, name, n_steps=100, df_name="__df__"):
                  predicted seasonal component
 
     """
-    config = m.config_seasonality.periods[name]
-    t_i = np.arange(n_steps + 1) / float(n_steps) * config.period
-    features = fourier_series_numpy_numeric(t=t_i, period=config.period, series_order=config.resolution)
-    features = torch.from_numpy(np.expand_dims(features, 1))
-
-    if df_name == "__df__":
-        meta_name_tensor = None
-    else:
-        meta = OrderedDict()
-        meta["df_name"] = [df_name for _ in range(n_steps + 1)]
-        meta_name_tensor = torch.tensor([m.model.id_dict[i] for i in meta["df_name"]])
-
-    quantile_index = m.model.quantiles.index(quantile)
-    predicted = m.model.seasonality.compute_fourier(features=features, name=name, meta=meta_name_tensor)[
-        :, :, quantile_index
-    ]
-    predicted = predicted.squeeze().detach().numpy()
-    if m.config_seasonality.mode == "additive":
-        data_params = m.config_normalization.get_data_params(df_name)
-        scale = data_params["y"].scale
-        predicted = predicted * scale
+    key = (name, quantile, df_name, n_steps + 1, None, None)
+    curves = get_component_cache(m)
+    if key not in curves:
+        config = m.config_seasonality.periods[name]
+        t_i = np.arange(n_steps + 1) / float(n_steps) * config.period
+        features = fourier_series_numpy_numeric(t=t_i, period=config.period, series_order=config.resolution)
+        curves = predict_season_curves(m, name=name, features=features, x=t_i, df_names=[df_name])
+    t_i, predicted = curves[key]
     return t_i, predicted
 
 
@@ -158,30 +379,129 @@ def predict_season_from_dates(m, dates, name, quantile, df_name="__df__"):
         predicted: OrderedDict
              presdicted seasonal component
     """
-    config = m.config_seasonality.periods[name]
-    features = fourier_series_numpy(dates=dates, period=config.period, series_order=config.resolution)
-    features = torch.from_numpy(np.expand_dims(features, 1))
-    if df_name == "__df__":
-        meta_name_tensor = None
-    else:
-        meta = OrderedDict()
-        meta["df_name"] = [df_name for _ in range(len(dates))]
-        meta_name_tensor = torch.tensor([m.model.id_dict[i] for i in meta["df_name"]])
-
-    quantile_index = m.model.quantiles.index(quantile)
-    predicted = m.model.seasonality.compute_fourier(features=features, name=name, meta=meta_name_tensor)[
-        :, :, quantile_index
-    ]
-
-    predicted = predicted.squeeze().detach().numpy()
-    if m.config_seasonality.mode == "additive":
-        data_params = m.config_normalization.get_data_params(df_name)
-        scale = data_params["y"].scale
-        predicted = predicted * scale
-    predicted = {name: predicted}
+    predicted = predict_seasons_from_dates(m, dates=dates, name=name, quantile=quantile, df_names=[df_name])
+    predicted = {name: predicted[name].to_numpy()}
     return predicted
 
 
+def predict_seasons_from_dates(m, dates, name, quantile, df_names):
+    """
+     Predicts the seasonal component of many time series given a date range, in one forward pass.
+
+     Parameters
+     ----------
+         m : NeuralProphet
+             Fitted NeuralProphet model
+         dates: pd.Series
+             date range for prediction, identical for all time series
+         name: str
+             Name of seasonality component
+         quantile: float
+             The quantile for which the season is predicted
+         df_names: list
+             Names of the time series to predict the seasonal component for
+
+    Returns
+    -------
+        pd.DataFrame
+             predicted seasonal component, with columns ``ds``, ``ID`` and <seasonality component name>
+    """
+    dates = pd.Series(dates).reset_index(drop=True)
+    # the first and last date distinguish date ranges of the same length but of different frequencies
+    key_tail = (len(dates), pd.Timestamp(dates.iloc[0]), pd.Timestamp(dates.iloc[-1]))
+    curves = get_component_cache(m)
+    missing = [df_name for df_name in df_names if (name, quantile, df_name, *key_tail) not in curves]
+    if len(missing) > 0:
+        config = m.config_seasonality.periods[name]
+        features = fourier_series_numpy(dates=dates, period=config.period, series_order=config.resolution)
+        predict_season_curves(m, name, features, dates.to_numpy(), missing, start=key_tail[1], end=key_tail[2])
+    predicted = [curves[(name, quantile, df_name, *key_tail)][1] for df_name in df_names]
+    return pd.DataFrame(
+        {
+            "ds": np.tile(dates.to_numpy(), len(df_names)),
+            "ID": np.repeat(np.asarray(df_names, dtype=object), len(dates)),
+            name: np.concatenate(predicted),
+        }
+    )
+
+
+def predict_trend_curves(m, quantile, df_names):
+    """
+     Predicts the trend of many time series over their training periods, cached for all quantiles.
+
+     Parameters
+     ----------
+         m : NeuralProphet
+             Fitted NeuralProphet model
+         quantile: float
+             The quantile for which the trend is predicted
+         df_names: list
+             Names of the time series to predict the trend for
+
+    Returns
+    -------
+        pd.DataFrame
+             predicted trend, with columns ``ds``, ``trend`` and ``ID``
+    """
+    curves = get_component_cache(m)
+    keys = {}
+    for df_name in df_names:
+        dates = get_trend_dates(m, df_name)
+        keys[df_name] = ("trend", quantile, df_name, len(dates), dates[0], dates[-1])
+    missing = [df_name for df_name in df_names if keys[df_name] not in curves]
+    if len(missing) > 0:
+        m.predict_component_curves(df_names=missing, components=["trend"])
+    trends = [curves[keys[df_name]] for df_name in df_names]
+    return pd.DataFrame(
+        {
+            "ds": np.concatenate([ds for ds, _ in trends]),
+            "trend": np.concatenate([trend for _, trend in trends]),
+            "ID": np.repeat(np.asarray(df_names, dtype=object), [len(ds) for ds, _ in trends]),
+        }
+    )
+
+
+def get_trend_dates(m, df_name):
+    """Dates of the training period of a time series, on which its trend is plotted."""
+    data_params = m.config_normalization.get_data_params(df_name)
+    t_start = data_params["ds"].shift
+    t_end = t_start + data_params["ds"].scale
+    return pd.date_range(start=t_start, end=t_end, freq=m.data_freq)
+
+
+def get_season_dates(m, name, weekly_start=0, yearly_start=0):
+    """Dates on which a seasonality is plotted, None for seasonalities plotted on a time scale.
+
+    Parameters
+    ----------
+        m : NeuralProphet
+            Fitted NeuralProphet model
+        name : str
+            Name of seasonality component
+        weekly_start : int
+            specifying the start day of the weekly seasonality plot
+        yearly_start : int
+            specifying the start day of the yearly seasonality plot
+
+    Returns
+    -------
+        pd.DatetimeIndex
+            dates of the seasonality plot
+    """
+    period = m.config_seasonality.periods[name].period
+    if name.lower() == "weekly" or period == 7:
+        week_days = 7
+        if m.data_freq == "B":
+            week_days = 5
+            weekly_start = 1
+        return pd.date_range(start="2017-01-01", periods=week_days * 24, freq="H") + pd.Timedelta(days=weekly_start)
+    if name.lower() == "yearly" or period == 365.25:
+        return pd.date_range(start="2017-01-01", periods=365) + pd.Timedelta(days=yearly_start)
+    if name.lower() == "daily" or period == 1:
+        return pd.date_range(start="2017-01-01", periods=24 * 12, freq="5min")
+    return None
+
+
 def check_if_configured(m, components, error_flag=False):  # move to utils
     """Check if components were set in the model configuration by the user.
 
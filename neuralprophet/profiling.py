@@ -0,0 +1,205 @@
+import contextlib
+import functools
+import logging
+import os
+import time
+import tracemalloc
+from typing import Callable, List, Optional
+
+import pandas as pd
+import torch
+
+log = logging.getLogger("NP.profiling")
+
+
+class Profiler:
+    """Collects the time and peak memory of the stages of fit and predict calls.
+
+    Created by :meth:`NeuralProphet.profile`, which instruments all ``fit``, ``update`` and ``predict`` calls of the
+    model while active. Stages can be nested, and the same stage can run several times per call (e.g. once per time
+    series when predicting), in which case its times are summed up in the report.
+
+    Memory is traced with ``tracemalloc``, covering Python objects and numpy arrays (e.g. dataframes), but not torch
+    tensors on the CPU. Tracing slows down Python heavy stages, and is therefore opt-in. On CUDA, the peak memory
+    allocated by torch is reported as well.
+
+    Examples
+    --------
+        >>> with m.profile(memory=True) as profiler:
+        ...     m.fit(df)
+        ...     forecast = m.predict(df)
+        >>> profiler.report()
+    """
+
+    def __init__(self, memory: bool = False, torch_profiler: bool = False, trace_dir: Optional[str] = None):
+        """
+        Parameters
+        ----------
+            memory : bool
+                whether to trace the peak memory of each stage
+            torch_profiler : bool
+                whether to capture each call with ``torch.profiler``, the captured profiles are kept in
+                ``torch_profiles``, with each stage recorded as a labeled range
+            trace_dir : str
+                directory to write a chrome trace of each captured call to, named ``<call>_<method>.json``
+        """
+        self.memory = memory
+        self.torch_profiler = torch_profiler
+        self.trace_dir = trace_dir
+        self.cuda = torch.cuda.is_available()
+        self.records: List[dict] = []
+        self.torch_profiles: List[torch.profiler.profile] = []
+        self._stack: List[dict] = []
+        self._n_calls = 0
+        self._started_tracing = False
+
+    def __enter__(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextlib.contextmanager
+    def call(self, method: str):
+        """Profiles a call of a public method, e.g. ``fit``, as a new call of the report.
+
+        Calls made within another call (e.g. ``predict`` by ``test``) are profiled as a stage of the outer call.
+        """
+        if len(self._stack) > 0:
+            with self.stage(method):
+                yield
+            return
+        self._n_calls += 1
+        self._call = (self._n_calls, method)
+        if not self.torch_profiler:
+            with self.stage("total"):
+                yield
+            return
+        activities = [torch.profiler.ProfilerActivity.CPU]
+        if self.cuda:
+            activities.append(torch.profiler.ProfilerActivity.CUDA)
+        with torch.profiler.profile(activities=activities) as profile:
+            with self.stage("total"):
+                yield
+        self.torch_profiles.append(profile)
+        if self.trace_dir is not None:
+            os.makedirs(self.trace_dir, exist_ok=True)
+            profile.export_chrome_trace(os.path.join(self.trace_dir, f"{self._n_calls}_{method}.json"))
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Context manager timing a stage of the current call.
+
+        Parameters
+        ----------
+            name : str
+                name of the stage, nested stages are reported as ``<outer stage>/<stage>``
+        """
+        parent = self._stack[-1] if len(self._stack) > 0 else None
+        path = name if parent is None or parent["path"] == "total" else f"{parent['path']}/{name}"
+        frame = {"path": path, "order": len(self.records) + len(self._stack)}
+        self._start_memory(frame, parent)
+        self._stack.append(frame)
+        record_function = torch.profiler.record_function(path) if self.torch_profiler else contextlib.nullcontext()
+        tic = time.perf_counter()
+        try:
+            with record_function:
+                yield
+        finally:
+            seconds = time.perf_counter() - tic
+            self._stack.pop()
+            record = {"call": self._call[0], "method": self._call[1], "stage": path, "seconds": seconds}
+            record.update(self._stop_memory(frame, parent))
+            record["order"] = frame["order"]
+            self.records.append(record)
+
+    def report(self) -> pd.DataFrame:
+        """Per-stage report of all profiled calls.
+
+        Returns
+        -------
+            pd.DataFrame
+                one row per call and stage, in the order the stages started, with columns ``call``, ``method``,
+                ``stage``, ``count`` (number of times the stage ran), ``seconds`` (summed over all runs), ``share``
+                (of the duration of the call), and if traced, ``memory_peak_mb`` and ``cuda_memory_peak_mb``
+                (maximum over all runs, above the memory at the start of the stage)
+        """
+        columns = ["call", "method", "stage", "count", "seconds", "share"]
+        if self.memory:
+            columns.append("memory_peak_mb")
+        if self.memory and self.cuda:
+            columns.append("cuda_memory_peak_mb")
+        if len(self.records) == 0:
+            return pd.DataFrame(columns=columns)
+        records = pd.DataFrame(self.records)
+        aggregations = {"order": "min", "count": "size", "seconds": "sum"}
+        aggregations.update({column: "max" for column in columns[6:]})
+        report = (
+            records.assign(count=1)
+            .groupby(["call", "method", "stage"], sort=False)
+            .agg(aggregations)
+            .reset_index()
+            .sort_values(["call", "order"], kind="stable")
+        )
+        totals = report[report["stage"] == "total"].set_index("call")["seconds"]
+        report["share"] = report["seconds"] / report["call"].map(totals)
+        return report[columns].reset_index(drop=True)
+
+    def _meters(self):
+        # Functions returning (current, peak) bytes and resetting the peak, of each traced memory
+        meters = {}
+        if self.memory and tracemalloc.is_tracing():
+            meters["memory_peak_mb"] = (tracemalloc.get_traced_memory, tracemalloc.reset_peak)
+        if self.memory and self.cuda:
+            meters["cuda_memory_peak_mb"] = (
+                lambda: (torch.cuda.memory_allocated(), torch.cuda.max_memory_allocated()),
+                torch.cuda.reset_peak_memory_stats,
+            )
+        return meters
+
+    def _start_memory(self, frame: dict, parent: Optional[dict]):
+        # The peak is reset at the start and end of each stage, the peak of the parent stage being kept in its frame
+        for name, (get_memory, reset_peak) in self._meters().items():
+            current, peak = get_memory()
+            if parent is not None:
+                parent[name] = max(parent[name], peak)
+            reset_peak()
+            frame[f"start_{name}"] = current
+            frame[name] = current
+
+    def _stop_memory(self, frame: dict, parent: Optional[dict]) -> dict:
+        memory = {}
+        for name, (get_memory, reset_peak) in self._meters().items():
+            peak = max(frame[name], get_memory()[1])
+            memory[name] = (peak - frame[f"start_{name}"]) / 2**20
+            if parent is not None:
+                parent[name] = max(parent[name], peak)
+            reset_peak()
+        return memory
+
+
+def profiled(method: Callable) -> Callable:
+    """Decorator profiling each call of a method of ``NeuralProphet``, if a profiler is active on the model."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = getattr(self, "profiler", None)
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        with profiler.call(method.__name__):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def stage(forecaster, name: str):
+    """Context manager timing a stage of the current call, if a profiler is active on the model."""
+    profiler = getattr(forecaster, "profiler", None)
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(name)
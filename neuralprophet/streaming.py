@@ -0,0 +1,244 @@
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import torch
+
+from neuralprophet import utils_time_dataset
+
+log = logging.getLogger("NP.streaming")
+
+
+class StreamingSession:
+    """Stateful forecaster for streaming inference of an auto-regressive model.
+
+    Holds the normalized last ``max_lags`` observations of each time series (and of its lagged regressors) in ring
+    buffers, and forecasts the next ``n_forecasts`` steps from them with a single forward pass of the model, without
+    building a dataframe or dataset. Created by :meth:`NeuralProphet.streaming_session`.
+
+    Observations need to be passed in order and without gaps, at the data frequency of the model. Models with future
+    regressors, events, holidays or conditional seasonalities are not supported, as their future values are unknown.
+
+    Examples
+    --------
+        >>> session = m.streaming_session(df_history)
+        >>> session.update(np.datetime64("2024-01-01"), 3.2)
+        >>> ds, yhat = session.forecast()
+    """
+
+    def __init__(self, forecaster):
+        """
+        Parameters
+        ----------
+            forecaster : NeuralProphet
+                fitted model with lags
+        """
+        if not forecaster.fitted:
+            raise RuntimeError("Model has not been fitted yet.")
+        if forecaster.config_model.max_lags == 0:
+            raise ValueError("Streaming sessions require a model with lags.")
+        if (
+            forecaster.config_regressors.regressors is not None
+            or forecaster.config_events is not None
+            or forecaster.config_country_holidays is not None
+        ):
+            raise ValueError("Streaming sessions do not support future regressors, events or holidays.")
+        if forecaster.config_seasonality is not None and any(
+            period.condition_name is not None for period in forecaster.config_seasonality.periods.values()
+        ):
+            raise ValueError("Streaming sessions do not support conditional seasonalities.")
+        self.forecaster = forecaster
+        self.model = forecaster.model
+        self.config_normalization = forecaster.config_normalization
+        self.config_seasonality = forecaster.config_seasonality
+        self.max_lags = forecaster.config_model.max_lags
+        self.n_forecasts = forecaster.config_model.n_forecasts
+        self.lagged_regressor_names = list((forecaster.config_lagged_regressors.regressors or {}).keys())
+
+        # Fixed frequencies are forecasted without pandas, calendar frequencies (e.g. month starts) need its offsets
+        self.offset = pd.tseries.frequencies.to_offset(forecaster.data_freq)
+        self.step = np.int64(self.offset.nanos) if isinstance(self.offset, pd.offsets.Tick) else None
+
+        # Feature layout of the forecast window, identical to the stacked features of the dataset
+        self.components_stacker = utils_time_dataset.ComponentStacker(
+            n_lags=forecaster.config_ar.n_lags,
+            n_forecasts=self.n_forecasts,
+            max_lags=self.max_lags,
+            config_seasonality=self.config_seasonality,
+            lagged_regressor_config=forecaster.config_lagged_regressors,
+        )
+        # Resolved once for the session, and used in place of the predict plan of the model during a forecast
+        self._unstack_plan = self.model._resolve_unstack_plan(self.components_stacker)
+        # Fourier frequencies of all seasonalities, computed as by the dataset
+        self._epoch = torch.tensor(datetime(1900, 1, 1).timestamp())
+        self._frequencies = OrderedDict()
+        if self.config_seasonality is not None and self.config_seasonality.periods:
+            for name, period in self.config_seasonality.periods.items():
+                if period.resolution > 0:
+                    self._frequencies[name] = 2.0 * np.pi / period.period * torch.arange(1, period.resolution + 1)
+        window_len = self.max_lags + self.n_forecasts
+        df_tensors = {name: torch.zeros(window_len) for name in ["t", "y_scaled"] + self.lagged_regressor_names}
+        df_tensors["seasonalities"] = self._seasonality_features(torch.zeros(window_len, dtype=torch.int64))
+        self.window = self.components_stacker.stack_all_features(
+            df_tensors,
+            {
+                "time": {},
+                "targets": {},
+                "lags": {"n_lags": forecaster.config_ar.n_lags},
+                "lagged_regressors": {"config": forecaster.config_lagged_regressors},
+                "seasonalities": {"config": self.config_seasonality},
+            },
+        ).unsqueeze(0)
+        # The window is filled through a numpy view, column indices of the values of the ring buffers
+        indices = self.components_stacker.feature_indices
+        self._window = self.window[0].numpy()
+        self._time_col = indices["time"][0]
+        value_names = ["lags"] + [f"lagged_regressor_{name}" for name in self.lagged_regressor_names]
+        self._value_idx = np.array([i for i, name in enumerate(value_names) if name in indices])
+        self._value_cols = np.array([indices[name][0] for name in value_names if name in indices])
+        self._season_cols = [indices[f"seasonality_{name}"] for name in self._frequencies]
+        self._season_frequencies = torch.cat(list(self._frequencies.values())) if self._frequencies else None
+
+        # Ring buffers of each time series: timestamps (ns), normalized values and lagged regressors
+        self.df_names = []
+        self._codes = {}
+        self._ds = np.zeros((0, self.max_lags), dtype=np.int64)
+        self._values = np.zeros((0, self.max_lags, 1 + len(self.lagged_regressor_names)), dtype=np.float32)
+        self._head = np.zeros(0, dtype=np.int64)
+        self._count = np.zeros(0, dtype=np.int64)
+        self._shift = np.zeros((0, 1 + len(self.lagged_regressor_names)))
+        self._scale = np.ones((0, 1 + len(self.lagged_regressor_names)))
+        self._ds_shift_scale = []
+
+    def update(self, ds, y, df_name: str = "__df__", lagged_regressors: Optional[dict] = None):
+        """Adds one or several new observations of a time series.
+
+        Parameters
+        ----------
+            ds : np.datetime64, pd.Timestamp or array
+                timestamps of the observations
+            y : float or array
+                observed values
+            df_name : str
+                ID of the time series
+            lagged_regressors : dict
+                observed values of each lagged regressor, as float or array
+        """
+        ds = np.atleast_1d(np.asarray(ds, dtype="datetime64[ns]")).astype(np.int64)
+        values = np.empty((len(ds), 1 + len(self.lagged_regressor_names)))
+        values[:, 0] = y
+        for i, name in enumerate(self.lagged_regressor_names):
+            if lagged_regressors is None or name not in lagged_regressors:
+                raise ValueError(f"Missing value of lagged regressor {name}.")
+            values[:, 1 + i] = lagged_regressors[name]
+        if np.isnan(values).any():
+            raise ValueError("Observations must not contain missing values.")
+
+        code = self._codes.get(df_name)
+        if code is None:
+            code = self._add_series(df_name)
+        last = self._ds[code, self._head[code] - 1] if self._count[code] > 0 else None
+        if last is not None and ds[0] <= last:
+            raise ValueError("Observations must be passed in chronological order.")
+        if len(ds) > 1 and np.any(ds[1:] <= ds[:-1]):
+            raise ValueError("Observations must be passed in chronological order.")
+        # Gaps of calendar frequencies are not detected, their step sizes vary
+        if self.step is not None:
+            steps = np.diff(ds) if last is None else np.diff(ds, prepend=last)
+            if np.any(steps != self.step):
+                raise ValueError("Observations must be passed without gaps, at the data frequency of the model.")
+
+        # Only the last max_lags observations are kept, written into the ring buffer after the newest one
+        ds, values = ds[-self.max_lags :], values[-self.max_lags :]
+        positions = (self._head[code] + np.arange(len(ds))) % self.max_lags
+        self._ds[code, positions] = ds
+        self._values[code, positions] = (values - self._shift[code]) / self._scale[code]
+        self._head[code] = (self._head[code] + len(ds)) % self.max_lags
+        self._count[code] = min(self.max_lags, self._count[code] + len(ds))
+
+    def forecast(self, df_name: str = "__df__") -> Tuple[np.ndarray, np.ndarray]:
+        """Forecasts the next ``n_forecasts`` steps after the last observation of a time series.
+
+        Parameters
+        ----------
+            df_name : str
+                ID of the time series
+
+        Returns
+        -------
+            np.ndarray
+                timestamps of the forecast steps, dims (n_forecasts,)
+            np.ndarray
+                forecast of each step and quantile, dims (n_forecasts, n_quantiles)
+        """
+        code = self._codes.get(df_name)
+        if code is None or self._count[code] < self.max_lags:
+            raise ValueError(f"Time series {df_name!r} needs {self.max_lags} observations to be forecasted.")
+        order = (self._head[code] + np.arange(self.max_lags)) % self.max_lags
+        past_ds = self._ds[code, order]
+        if self.step is not None:
+            future_ds = past_ds[-1] + self.step * np.arange(1, self.n_forecasts + 1)
+        else:
+            last = pd.Timestamp(past_ds[-1])
+            future_ds = pd.date_range(last, periods=self.n_forecasts + 1, freq=self.offset)[1:].asi8
+        ds = np.concatenate((past_ds, future_ds))
+
+        window = self._window
+        ds_shift, ds_scale = self._ds_shift_scale[code]
+        window[:, self._time_col] = (ds - ds_shift) / ds_scale
+        window[: self.max_lags, self._value_cols] = self._values[code, order][:, self._value_idx]
+        if self._season_frequencies is not None:
+            t = (torch.from_numpy(ds // 10**9) - self._epoch).float() / (3600 * 24.0)
+            periodicities = self._season_frequencies * t[:, None]
+            sin, cos = torch.sin(periodicities).numpy(), torch.cos(periodicities).numpy()
+            offset = 0
+            for start, end in self._season_cols:
+                resolution = (end - start) // 2
+                window[:, start : start + resolution] = sin[:, offset : offset + resolution]
+                window[:, start + resolution : end] = cos[:, offset : offset + resolution]
+                offset += resolution
+
+        meta = None
+        if self.model.meta_used_in_model:
+            meta = torch.tensor([self.model.id_dict[df_name]], device=self.model.device)
+        unstack_plans = self.model.unstack_plans
+        predict_plan = unstack_plans["predict"]
+        unstack_plans["predict"] = self._unstack_plan
+        try:
+            with self.forecaster._inference():
+                predicted, _ = self.model.forward(self.window.to(self.model.device), mode="predict", meta=meta)
+        finally:
+            unstack_plans["predict"] = predict_plan
+        predicted = predicted[0].float().cpu().numpy()
+        return future_ds.astype("datetime64[ns]"), predicted * self._scale[code, 0] + self._shift[code, 0]
+
+    def _add_series(self, df_name: str) -> int:
+        data_params = self.config_normalization.get_data_params(df_name)
+        if self.model.meta_used_in_model and df_name not in self.model.id_dict:
+            raise ValueError(f"Time series {df_name!r} was not part of the training data.")
+        code = len(self.df_names)
+        self.df_names.append(df_name)
+        self._codes[df_name] = code
+        names = ["y"] + self.lagged_regressor_names
+        shift = np.array([[data_params[name].shift for name in names]])
+        scale = np.array([[data_params[name].scale for name in names]])
+        self._shift = np.concatenate((self._shift, shift))
+        self._scale = np.concatenate((self._scale, scale))
+        self._ds_shift_scale.append((data_params["ds"].shift.value, data_params["ds"].scale.value))
+        self._ds = np.concatenate((self._ds, np.zeros((1, self.max_lags), dtype=np.int64)))
+        self._values = np.concatenate((self._values, np.zeros((1,) + self._values.shape[1:], dtype=np.float32)))
+        self._head = np.append(self._head, 0)
+        self._count = np.append(self._count, 0)
+        return code
+
+    def _seasonality_features(self, dates: torch.Tensor) -> OrderedDict:
+        # Fourier features of timestamps in seconds, computed as by the dataset
+        t = (dates - self._epoch).float() / (3600 * 24.0)
+        seasonalities = OrderedDict()
+        for name, frequencies in self._frequencies.items():
+            periodicities = frequencies * t[:, None]
+            seasonalities[name] = torch.cat((torch.sin(periodicities), torch.cos(periodicities)), dim=1)
+        return seasonalities
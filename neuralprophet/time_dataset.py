@@ -126,8 +126,14 @@ class TimeDataset(Dataset):
             "targets": {},
             "lags": {"n_lags": self.config_ar.n_lags},
             "lagged_regressors": {"config": self.config_lagged_regressors},
-            "additive_events": {"names": self.additive_event_and_holiday_names},
-            "multiplicative_events": {"names": self.multiplicative_event_and_holiday_names},
+            "additive_events": {
+                "names": self.additive_event_and_holiday_names,
+                "sparse": self.config_model.sparse_events,
+            },
+            "multiplicative_events": {
+                "names": self.multiplicative_event_and_holiday_names,
+                "sparse": self.config_model.sparse_events,
+            },
             "additive_regressors": {"names": self.additive_regressors_names},
             "multiplicative_regressors": {"names": self.multiplicative_regressors_names},
             "seasonalities": {"config": self.config_seasonality},
@@ -602,6 +608,12 @@ class GlobalTimeDataset(TimeDataset):
                 config_model=config_model,
                 components_stacker=components_stacker,
             )
+        # Sparse events of all time series need the same number of slots, the maximum of all, which is only known
+        # after stacking the last one. Time series stacked with fewer slots are stacked again.
+        n_features = self.datasets[self.df_names[-1]].all_features.shape[1]
+        for dataset in self.datasets.values():
+            if dataset.all_features.shape[1] != n_features:
+                dataset.all_features = dataset.stack_all_features()
         self.length = sum(dataset.length for (name, dataset) in self.datasets.items())
         global_sample_to_local_ID = []
         global_sample_to_local_sample = []
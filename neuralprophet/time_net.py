@@ -1,7 +1,7 @@
 import logging
 from collections import OrderedDict
 from functools import reduce
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pytorch_lightning as pl
@@ -143,6 +143,13 @@ class TimeNet(pl.LightningModule):
             "test": None,
             "predict": None,
         }
+        # Unstacking functions of the components present in the input of each mode, see set_components_stacker
+        self.unstack_plans = {
+            "train": None,
+            "val": None,
+            "test": None,
+            "predict": None,
+        }
         # Lightning Config
         self.config_train = config_train
         self.config_normalization = config_normalization
@@ -152,6 +159,10 @@ class TimeNet(pl.LightningModule):
         # Manual optimization: we are responsible for calling .backward(), .step(), .zero_grad().
         self.automatic_optimization = False
 
+        # Optionally compiled forward pass, created lazily on first use
+        self.use_compile = self.config_train.compile
+        self.compiled_forward = None
+
         # Hyperparameters (can be tuned using trainer.tune())
         self.learning_rate = self.config_train.learning_rate
         self.batch_size = self.config_train.batch_size
@@ -193,6 +204,7 @@ class TimeNet(pl.LightningModule):
 
         # Quantiles
         self.quantiles = self.config_model.quantiles
+        self._register_quantile_crossing_buffers()
 
         # Trend
         self.config_trend = config_trend
@@ -312,6 +324,26 @@ class TimeNet(pl.LightningModule):
             if isinstance(layer, nn.Linear):
                 return layer.weight
 
+    def _register_quantile_crossing_buffers(self, device=None):
+        """Registers the index and sign tensors used by ``_compute_quantile_forecasts_from_diffs``.
+
+        Crossing quantiles are corrected outwards from the median (index 0), as a running maximum over two rows of
+        the lower and upper quantiles, each starting at a zero diff of the median and padded to the same length.
+        The buffers are not persistent, so state dicts do not depend on them.
+        """
+        divider = next((i for i, quantile in enumerate(self.quantiles) if quantile > 0.5), len(self.quantiles))
+        lower = list(range(divider - 1, 0, -1))
+        upper = list(range(divider, len(self.quantiles)))
+        n_steps = max(len(lower), len(upper))
+        rows = [[0] + row + [0] * (n_steps - len(row)) for row in [lower, upper]]
+        self.register_buffer("quantile_crossing_index", torch.tensor(rows, device=device).flatten(), persistent=False)
+        # Position of each quantile in the flattened rows, the median being set separately
+        inverse = [0] + list(range(divider - 1, 0, -1)) + list(range(n_steps + 2, n_steps + 2 + len(upper)))
+        self.register_buffer("quantile_crossing_inverse", torch.tensor(inverse, device=device), persistent=False)
+        # Direction of each quantile from the median
+        signs = [1.0] + [-1.0] * len(lower) + [1.0] * len(upper)
+        self.register_buffer("quantile_signs", torch.tensor(signs, device=device), persistent=False)
+
     def set_components_stacker(self, stacker, mode):
         """Set the components stacker for the given mode.
         Parameters
@@ -325,6 +357,34 @@ class TimeNet(pl.LightningModule):
         modes = ["train", "val", "test", "predict"]
         assert mode in modes, f"mode must be one of {modes}"
         self.components_stacker[mode] = stacker
+        self.unstack_plans[mode] = self._resolve_unstack_plan(stacker)
+
+    def _resolve_unstack_plan(self, stacker):
+        """Resolves the unstacking functions of the components present in the input tensor of a components stacker.
+
+        The functions are returned in the order in which ``_forward`` processes the components, with ``None`` for
+        absent components, so that the forward pass does not look up the stacker and its feature indices per call.
+        """
+        feature_indices = stacker.feature_indices
+        has_seasonalities = bool(self.config_seasonality and self.config_seasonality.periods)
+        has_events = self.events_dims is not None
+        has_lagged_regressors = bool(
+            self.config_lagged_regressors and self.config_lagged_regressors.regressors is not None
+        )
+        return (
+            stacker.unstack_time,
+            stacker.unstack_seasonalities if has_seasonalities else None,
+            stacker.unstack_additive_events if has_events and "additive_events" in feature_indices else None,
+            (
+                stacker.unstack_multiplicative_events
+                if has_events and "multiplicative_events" in feature_indices
+                else None
+            ),
+            stacker.unstack_additive_regressors if "additive_regressors" in feature_indices else None,
+            stacker.unstack_multiplicative_regressors if "multiplicative_regressors" in feature_indices else None,
+            stacker.unstack_lags if "lags" in feature_indices else None,
+            stacker.unstack_lagged_regressors if has_lagged_regressors else None,
+        )
 
     def get_covar_weights(self, covar_input=None) -> torch.Tensor:
         """
@@ -411,56 +471,33 @@ class TimeNet(pl.LightningModule):
         if len(self.quantiles) <= 1:
             return diffs
         # generate the actual quantile forecasts from predicted differences
-        if any(quantile > 0.5 for quantile in self.quantiles):
-            quantiles_divider_index = next(i for i, quantile in enumerate(self.quantiles) if quantile > 0.5)
-        else:
-            quantiles_divider_index = len(self.quantiles)
-
-        n_upper_quantiles = diffs.shape[-1] - quantiles_divider_index
-        n_lower_quantiles = quantiles_divider_index - 1
-
-        out = torch.zeros_like(diffs)
-        out[:, :, 0] = diffs[:, :, 0]  # set the median where 0 is the median quantile index
-
-        if n_upper_quantiles > 0:  # check if upper quantiles exist
-            upper_quantile_diffs = diffs[:, :, quantiles_divider_index:]
-            if predict_mode:  # check for quantile crossing and correct them in predict mode
-                upper_quantile_diffs[:, :, 0] = torch.max(
-                    torch.tensor(0, device=self.device), upper_quantile_diffs[:, :, 0]
-                )
-                for i in range(n_upper_quantiles - 1):
-                    next_diff = upper_quantile_diffs[:, :, i + 1]
-                    diff = upper_quantile_diffs[:, :, i]
-                    upper_quantile_diffs[:, :, i + 1] = torch.max(next_diff, diff)
-            out[:, :, quantiles_divider_index:] = (
-                upper_quantile_diffs + diffs[:, :, 0].unsqueeze(dim=2).repeat(1, 1, n_upper_quantiles).detach()
-            )  # set the upper quantiles
-
-        if n_lower_quantiles > 0:  # check if lower quantiles exist
-            lower_quantile_diffs = diffs[:, :, 1:quantiles_divider_index]
-            if predict_mode:  # check for quantile crossing and correct them in predict mode
-                lower_quantile_diffs[:, :, -1] = torch.max(
-                    torch.tensor(0, device=self.device), lower_quantile_diffs[:, :, -1]
-                )
-                for i in range(n_lower_quantiles - 1, 0, -1):
-                    next_diff = lower_quantile_diffs[:, :, i - 1]
-                    diff = lower_quantile_diffs[:, :, i]
-                    lower_quantile_diffs[:, :, i - 1] = torch.max(next_diff, diff)
-            lower_quantile_diffs = -lower_quantile_diffs
-            out[:, :, 1:quantiles_divider_index] = (
-                lower_quantile_diffs + diffs[:, :, 0].unsqueeze(dim=2).repeat(1, 1, n_lower_quantiles).detach()
-            )  # set the lower quantiles
-
-        return out
-
-    def scalar_features_effects(self, features: torch.Tensor, params: nn.Parameter, indices=None) -> torch.Tensor:
+        median = diffs[:, :, :1]
+        if not predict_mode:
+            out = torch.addcmul(median.detach(), diffs, self.quantile_signs)
+            out[:, :, 0] = diffs[:, :, 0]  # set the median
+            return out
+        # check for quantile crossing and correct them in predict mode, on quantile-major rows
+        # (2, n_steps + 1, batch, n_forecasts) of which each step is contiguous in memory
+        steps = diffs.movedim(-1, 0).index_select(0, self.quantile_crossing_index).unflatten(0, (2, -1))
+        steps[:, 0] = 0.0
+        for i in range(1, steps.shape[1]):
+            steps[:, i] = torch.maximum(steps[:, i - 1], steps[:, i])
+        corrected = steps.flatten(end_dim=1).index_select(0, self.quantile_crossing_inverse)
+        out = torch.addcmul(median.detach().movedim(-1, 0), corrected, self.quantile_signs[:, None, None])
+        out[0] = median[:, :, 0]  # set the median
+        return out.movedim(0, -1)
+
+    def scalar_features_effects(
+        self, features: Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]], params: nn.Parameter, indices=None
+    ) -> torch.Tensor:
         """
         Computes events component of the model
         Parameters
         ----------
-            features : torch.Tensor, float
+            features : torch.Tensor, float or tuple of torch.Tensor
                 Features (either additive or multiplicative) related to event component dims (batch, n_forecasts,
-                n_features)
+                n_features), or in the sparse format, the feature indices (long) and values of the active events,
+                each of dims (batch, n_forecasts, n_slots)
             params : nn.Parameter
                 Params (either additive or multiplicative) related to events dims (n_quantiles, n_features)
             indices : list of int
@@ -470,13 +507,31 @@ class TimeNet(pl.LightningModule):
             torch.Tensor
                 Forecast component of dims (batch, n_forecasts, n_quantiles)
         """
+        if isinstance(features, tuple):
+            feature_ids, values = features
+            if indices is not None:
+                # only the params of the event are kept, the other active events have no effect
+                event_params = torch.zeros_like(params)
+                event_params[:, indices] = params[:, indices]
+                params = event_params
+            # Sum of the params of the active events weighted by their values. The embedding-bag lookup is the
+            # fastest without gradients, but its backward pass is slower than gathering the params of each slot.
+            values = values.to(params.dtype)
+            if torch.is_grad_enabled() and params.requires_grad:
+                out = torch.matmul(values.unsqueeze(-2), params.t()[feature_ids]).squeeze(-2)
+                return out  # dims (batch, n_forecasts, n_quantiles)
+            out = nn.functional.embedding_bag(
+                feature_ids.reshape(-1, feature_ids.shape[-1]),
+                params.t().contiguous(),
+                per_sample_weights=values.reshape(-1, values.shape[-1]),
+                mode="sum",
+            )
+            return out.view(*feature_ids.shape[:-1], -1)  # dims (batch, n_forecasts, n_quantiles)
         if indices is not None:
             features = features[:, :, indices]
             params = params[:, indices]
-        # features dims: (batch, n_forecasts, n_features)  -> (batch, n_forecasts, 1, n_features)
-        # params dims: (n_quantiles, n_features) -> (batch, 1, n_quantiles, n_features)
-        out = torch.sum(features.unsqueeze(dim=2) * params.unsqueeze(dim=0).unsqueeze(dim=0), dim=-1)
-        return out  # dims (batch, n_forecasts, n_quantiles)
+        # features dims: (batch, n_forecasts, n_features), params dims: (n_quantiles, n_features)
+        return torch.matmul(features, params.t())  # dims (batch, n_forecasts, n_quantiles)
 
     def auto_regression(self, lags: Union[torch.Tensor, float]) -> torch.Tensor:
         """Computes auto-regessive model component AR-Net.
@@ -516,6 +571,30 @@ class TimeNet(pl.LightningModule):
         x = x.view(x.shape[0], self.config_model.n_forecasts, len(self.quantiles))
         return x
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Compiled functions can not be pickled, they are re-compiled on first use. The unstack plans are resolved
+        # again from the components stackers.
+        state.pop("compiled_forward", None)
+        state.pop("unstack_plans", None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Models pickled by earlier versions have no compile flag, or stored it as ``compile``, shadowing
+        # ``nn.Module.compile``
+        if "use_compile" not in state:
+            self.use_compile = bool(self.__dict__.pop("compile", False))
+        self.compiled_forward = None
+        # Models pickled by earlier versions have no quantile crossing buffers, they are built on the model's device
+        if "quantile_signs" not in self._buffers:
+            parameter = next(self.parameters(), None)
+            self._register_quantile_crossing_buffers(device=None if parameter is None else parameter.device)
+        self.unstack_plans = {
+            mode: None if stacker is None else self._resolve_unstack_plan(stacker)
+            for mode, stacker in self.components_stacker.items()
+        }
+
     def forward(
         self,
         input_tensor: torch.Tensor,
@@ -523,6 +602,35 @@ class TimeNet(pl.LightningModule):
         meta: Dict = None,
     ) -> torch.Tensor:
         """This method defines the model forward pass.
+
+        Dispatches to the compiled forward pass if compilation is enabled.
+
+        Parameters
+        ----------
+            input_tensor : torch.Tensor
+                Input tensor of dims (batch, n_lags + n_forecasts, n_features)
+            mode : str operation mode ["train", "val", "test", "predict"]
+            meta : dict Static features of the time series
+        Returns
+        -------
+            torch.Tensor Forecast tensor of dims (batch, n_forecasts, n_quantiles)
+            dict of components of the model if self.include_components is True,
+                each of dims (batch, n_forecasts, n_quantiles)
+        """
+        if self.use_compile:
+            if self.compiled_forward is None:
+                # One graph is traced per mode, as the mode determines the components stacker
+                self.compiled_forward = torch.compile(self._forward)
+            return self.compiled_forward(input_tensor, mode, meta)
+        return self._forward(input_tensor, mode, meta)
+
+    def _forward(
+        self,
+        input_tensor: torch.Tensor,
+        mode: str,
+        meta: Dict = None,
+    ) -> torch.Tensor:
+        """This method defines the model forward pass.
         Parameters
         ----------
             input_tensor : torch.Tensor
@@ -537,7 +645,17 @@ class TimeNet(pl.LightningModule):
 
         """
 
-        time_input = self.components_stacker[mode].unstack(component_name="time", batch_tensor=input_tensor)
+        (
+            unstack_time,
+            unstack_seasonalities,
+            unstack_additive_events,
+            unstack_multiplicative_events,
+            unstack_additive_regressors,
+            unstack_multiplicative_regressors,
+            unstack_lags,
+            unstack_lagged_regressors,
+        ) = self.unstack_plans[mode]
+        time_input = unstack_time(input_tensor)
         # Handle meta argument
         if meta is None and self.meta_used_in_model:
             name_id_dummy = self.id_list[0]
@@ -566,10 +684,8 @@ class TimeNet(pl.LightningModule):
 
         # Unpack and process seasonalities
         seasonalities_input = None
-        if self.config_seasonality and self.config_seasonality.periods:
-            seasonalities_input = self.components_stacker[mode].unstack(
-                component_name="seasonalities", batch_tensor=input_tensor
-            )
+        if unstack_seasonalities is not None:
+            seasonalities_input = unstack_seasonalities(input_tensor)
             s = self.seasonality(s=seasonalities_input, meta=meta)
             if self.config_seasonality.mode == "additive":
                 additive_components_nonstationary += s
@@ -580,46 +696,37 @@ class TimeNet(pl.LightningModule):
         # Unpack and process events
         additive_events_input = None
         multiplicative_events_input = None
-        if self.events_dims is not None:
-            if "additive_events" in self.components_stacker[mode].feature_indices:
-                additive_events_input = self.components_stacker[mode].unstack(
-                    component_name="additive_events", batch_tensor=input_tensor
-                )
-                additive_events = self.scalar_features_effects(additive_events_input, self.event_params["additive"])
-                additive_components_nonstationary += additive_events
-                components["additive_events"] = additive_events
-            if "multiplicative_events" in self.components_stacker[mode].feature_indices:
-                multiplicative_events_input = self.components_stacker[mode].unstack(
-                    component_name="multiplicative_events", batch_tensor=input_tensor
-                )
-                multiplicative_events = self.scalar_features_effects(
-                    multiplicative_events_input, self.event_params["multiplicative"]
-                )
-                multiplicative_components_nonstationary += multiplicative_events
-                components["multiplicative_events"] = multiplicative_events
+        if unstack_additive_events is not None:
+            additive_events_input = unstack_additive_events(input_tensor)
+            additive_events = self.scalar_features_effects(additive_events_input, self.event_params["additive"])
+            additive_components_nonstationary += additive_events
+            components["additive_events"] = additive_events
+        if unstack_multiplicative_events is not None:
+            multiplicative_events_input = unstack_multiplicative_events(input_tensor)
+            multiplicative_events = self.scalar_features_effects(
+                multiplicative_events_input, self.event_params["multiplicative"]
+            )
+            multiplicative_components_nonstationary += multiplicative_events
+            components["multiplicative_events"] = multiplicative_events
 
         # Unpack and process regressors
         additive_regressors_input = None
         multiplicative_regressors_input = None
-        if "additive_regressors" in self.components_stacker[mode].feature_indices:
-            additive_regressors_input = self.components_stacker[mode].unstack(
-                component_name="additive_regressors", batch_tensor=input_tensor
-            )
+        if unstack_additive_regressors is not None:
+            additive_regressors_input = unstack_additive_regressors(input_tensor)
             additive_regressors = self.future_regressors(additive_regressors_input, "additive")
             additive_components_nonstationary += additive_regressors
             components["additive_regressors"] = additive_regressors
-        if "multiplicative_regressors" in self.components_stacker[mode].feature_indices:
-            multiplicative_regressors_input = self.components_stacker[mode].unstack(
-                component_name="multiplicative_regressors", batch_tensor=input_tensor
-            )
+        if unstack_multiplicative_regressors is not None:
+            multiplicative_regressors_input = unstack_multiplicative_regressors(input_tensor)
             multiplicative_regressors = self.future_regressors(multiplicative_regressors_input, "multiplicative")
             multiplicative_components_nonstationary += multiplicative_regressors
             components["multiplicative_regressors"] = multiplicative_regressors
 
         # Unpack and process lags
         lags_input = None
-        if "lags" in self.components_stacker[mode].feature_indices:
-            lags_input = self.components_stacker[mode].unstack(component_name="lags", batch_tensor=input_tensor)
+        if unstack_lags is not None:
+            lags_input = unstack_lags(input_tensor)
             nonstationary_components = (
                 trend[:, : self.n_lags, 0]
                 + additive_components_nonstationary[:, : self.n_lags, 0]
@@ -632,10 +739,8 @@ class TimeNet(pl.LightningModule):
 
         # Unpack and process covariates
         covariates_input = None
-        if self.config_lagged_regressors and self.config_lagged_regressors.regressors is not None:
-            covariates_input = self.components_stacker[mode].unstack(
-                component_name="lagged_regressors", batch_tensor=input_tensor
-            )
+        if unstack_lagged_regressors is not None:
+            covariates_input = unstack_lagged_regressors(input_tensor)
             covariates = self.forward_covar_net(covariates=covariates_input)
             additive_components += covariates
             components["covariates"] = covariates
@@ -729,11 +834,15 @@ class TimeNet(pl.LightningModule):
                 mode = configs["mode"]
                 indices = configs["event_indices"]
                 if mode == "additive":
-                    features = additive_events_input[:, self.n_lags : time_input.shape[1], :]
+                    features = additive_events_input
                     params = self.event_params["additive"]
                 else:
-                    features = multiplicative_events_input[:, self.n_lags : time_input.shape[1], :]
+                    features = multiplicative_events_input
                     params = self.event_params["multiplicative"]
+                if isinstance(features, tuple):
+                    features = tuple(part[:, self.n_lags : time_input.shape[1], :] for part in features)
+                else:
+                    features = features[:, self.n_lags : time_input.shape[1], :]
                 components[f"event_{event}"] = self.scalar_features_effects(
                     features=features, params=params, indices=indices
                 )
@@ -891,6 +1000,10 @@ class TimeNet(pl.LightningModule):
             mode="predict",
             meta=meta_name_tensor,
         )
+        # Under reduced precision autocast, layer outputs are not float32
+        prediction = prediction.float()
+        if components is not None:
+            components = {name: value.float() for name, value in components.items()}
         return prediction, components
 
     def configure_optimizers(self):
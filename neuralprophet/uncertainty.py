@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import Any, List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 import matplotlib
 import numpy as np
@@ -60,6 +60,8 @@ class Conformal:
         """Apply a given conformal prediction technique to get the uncertainty prediction intervals (or q-hat) for test
         dataframe.
 
+        The nonconformity scores and q-hats of all forecast steps are computed at once.
+
         Parameters
         ----------
             df : pd.DataFrame
@@ -75,165 +77,147 @@ class Conformal:
                     test dataframe with uncertainty prediction intervals
 
         """
-        df_qr = df.copy()
-
-        for step_number in range(1, self.n_forecasts + 1):
-            # conformalize
-            noncon_scores = self._get_nonconformity_scores(df_cal, step_number)
-            q_hat = self._get_q_hat(df_cal, noncon_scores)
-            y_hat_col = f"yhat{step_number}"
-            y_hat_lo_col = f"{y_hat_col} {min(self.quantiles) * 100}%"
-            y_hat_hi_col = f"{y_hat_col} {max(self.quantiles) * 100}%"
-            if self.method == "naive" and self.symmetrical:
-                q_hat_sym = q_hat["q_hat_sym"]
-                df[y_hat_lo_col] = df[y_hat_col] - q_hat_sym
-                df[y_hat_hi_col] = df[y_hat_col] + q_hat_sym
-            elif self.method == "cqr" and self.symmetrical:
-                q_hat_sym = q_hat["q_hat_sym"]
-                df[y_hat_lo_col] = df[y_hat_lo_col] - q_hat_sym
-                df[y_hat_hi_col] = df[y_hat_hi_col] + q_hat_sym
-            elif self.method == "cqr" and not self.symmetrical:
-                q_hat_lo = q_hat["q_hat_lo"]
-                q_hat_hi = q_hat["q_hat_hi"]
-                df[y_hat_lo_col] = df[y_hat_lo_col] - q_hat_lo
-                df[y_hat_hi_col] = df[y_hat_hi_col] + q_hat_hi
-            else:
-                raise ValueError(
-                    f"Unknown conformal prediction method '{self.method}'. Please input either 'naive' or 'cqr'."
-                )
-            if step_number == 1:
-                # save nonconformity scores of the first timestep
-                self.noncon_scores = noncon_scores
+        if self.method not in ["naive", "cqr"]:
+            raise ValueError(
+                f"Unknown conformal prediction method '{self.method}'. Please input either 'naive' or 'cqr'."
+            )
+        # conformalize all forecast steps at once
+        noncon_scores = self._get_nonconformity_scores(df_cal)
+        self.q_hats = self._get_q_hats(noncon_scores)
+        # save nonconformity scores of the first timestep
+        self.noncon_scores = {name: scores[:, 0][~np.isnan(scores[:, 0])] for name, scores in noncon_scores.items()}
+        return self._add_intervals(df, show_all_PI)
 
-            # append the dictionary of q_hats to the dataframe based on the keys of the dictionary
-            q_hat_df = pd.DataFrame([q_hat])
-            self.q_hats = pd.concat([self.q_hats, q_hat_df], ignore_index=True)
+    def _add_intervals(self, df: pd.DataFrame, show_all_PI: bool) -> pd.DataFrame:
+        """Add the prediction intervals of the current q-hats to the test dataframe.
 
-            # if show_all_PI is True, add the quantile regression prediction intervals
-            if show_all_PI:
-                df_quantiles = [col for col in df_qr.columns if "%" in col and f"yhat{step_number}" in col]
-                df_add = df_qr[df_quantiles]
+        Parameters
+        ----------
+            df : pd.DataFrame
+                test dataframe
+            show_all_PI : bool
+                whether to return all prediction intervals (including quantile regression and conformal prediction)
 
+            Returns
+            -------
+                pd.DataFrame
+                    test dataframe with uncertainty prediction intervals
+
+        """
+        steps = range(1, self.n_forecasts + 1)
+        y_hat_cols = [f"yhat{step_number}" for step_number in steps]
+        y_hat_lo_cols = [f"{y_hat_col} {min(self.quantiles) * 100}%" for y_hat_col in y_hat_cols]
+        y_hat_hi_cols = [f"{y_hat_col} {max(self.quantiles) * 100}%" for y_hat_col in y_hat_cols]
+        if self.method == "naive":
+            y_hat_lo = y_hat_hi = df[y_hat_cols].to_numpy()
+            q_hat_lo = q_hat_hi = self.q_hats["q_hat_sym"].to_numpy()
+        else:
+            y_hat_lo = df[y_hat_lo_cols].to_numpy()
+            y_hat_hi = df[y_hat_hi_cols].to_numpy()
+            q_hat_lo = self.q_hats["q_hat_sym" if self.symmetrical else "q_hat_lo"].to_numpy()
+            q_hat_hi = self.q_hats["q_hat_sym" if self.symmetrical else "q_hat_hi"].to_numpy()
+        # the intervals keep the precision of the forecast
+        y_hat_lo = y_hat_lo - q_hat_lo.astype(y_hat_lo.dtype)
+        y_hat_hi = y_hat_hi + q_hat_hi.astype(y_hat_hi.dtype)
+
+        # interval columns replace the quantile regression columns, or are added if not present
+        intervals = {}
+        for i in range(self.n_forecasts):
+            intervals[y_hat_lo_cols[i]] = y_hat_lo[:, i]
+            intervals[y_hat_hi_cols[i]] = y_hat_hi[:, i]
+        # if show_all_PI is True, the intervals are renamed and the quantile regression intervals are added
+        renamed = {}
+        if show_all_PI:
+            for step_number, y_hat_lo_col, y_hat_hi_col in zip(steps, y_hat_lo_cols, y_hat_hi_cols):
                 if self.method == "naive":
-                    cp_lo_col = f"yhat{step_number} - qhat{step_number}"  # e.g. yhat1 - qhat1
-                    cp_hi_col = f"yhat{step_number} + qhat{step_number}"  # e.g. yhat1 + qhat1
-                    df.rename(columns={y_hat_lo_col: cp_lo_col, y_hat_hi_col: cp_hi_col}, inplace=True)
-                elif self.method == "cqr":
-                    qr_lo_col = (
-                        f"yhat{step_number} {max(self.quantiles) * 100}% - qhat{step_number}"  # e.g. yhat1 95% - qhat1
-                    )
-                    qr_hi_col = (
-                        f"yhat{step_number} {min(self.quantiles) * 100}% + qhat{step_number}"  # e.g. yhat1 5% + qhat1
-                    )
-                    df.rename(columns={y_hat_lo_col: qr_lo_col, y_hat_hi_col: qr_hi_col}, inplace=True)
+                    renamed[y_hat_lo_col] = f"yhat{step_number} - qhat{step_number}"  # e.g. yhat1 - qhat1
+                    renamed[y_hat_hi_col] = f"yhat{step_number} + qhat{step_number}"  # e.g. yhat1 + qhat1
+                else:
+                    # e.g. yhat1 95% - qhat1 and yhat1 5% + qhat1
+                    renamed[y_hat_lo_col] = f"yhat{step_number} {max(self.quantiles) * 100}% - qhat{step_number}"
+                    renamed[y_hat_hi_col] = f"yhat{step_number} {min(self.quantiles) * 100}% + qhat{step_number}"
+
+        columns = {renamed.get(col, col): intervals.get(col, df[col]) for col in df.columns}
+        for step_number, y_hat_lo_col, y_hat_hi_col in zip(steps, y_hat_lo_cols, y_hat_hi_cols):
+            for col in [y_hat_lo_col, y_hat_hi_col]:
+                if col not in df.columns:
+                    columns[renamed.get(col, col)] = intervals[col]
+            if show_all_PI:
+                for col in df.columns:
+                    if "%" in col and col.startswith(f"yhat{step_number} "):
+                        columns[col] = df[col]
+        return pd.DataFrame(columns, index=df.index)
+
+    def _get_nonconformity_scores(self, df_cal: pd.DataFrame) -> dict:
+        """Get the nonconformity scores of all forecast steps using the given conformal prediction technique.
+
+        Parameters
+        ----------
+            df_cal : pd.DataFrame
+                calibration dataframe
 
-                df = pd.concat([df, df_add], axis=1, ignore_index=False)
+            Returns
+            -------
+                Dict[str, np.ndarray]
+                    dictionary with one entry (symmetrical) or two entries (asymmetrical) of nonconformity scores,
+                    each of shape (rows, n_forecasts), sorted per forecast step with NaN values last
 
-        return df
+        """
+        # Sort, NaN values are sorted to the end
+        return {name: np.sort(scores, axis=0) for name, scores in self._score(df_cal).items()}
 
-    def _get_nonconformity_scores(self, df_cal: pd.DataFrame, step_number: int) -> dict:
-        """Get the nonconformity scores using the given conformal prediction technique.
+    def _score(self, df_cal: pd.DataFrame) -> dict:
+        """Compute the nonconformity scores of all forecast steps, in the order of the calibration data.
 
         Parameters
         ----------
             df_cal : pd.DataFrame
                 calibration dataframe
-            step_number : int
-                i-th step ahead forecast
 
             Returns
             -------
                 Dict[str, np.ndarray]
-                    dictionary with one entry (symmetrical) or two entries (asymmetrical) of nonconformity scores
+                    dictionary with one entry (symmetrical) or two entries (asymmetrical) of nonconformity scores,
+                    each of shape (rows, n_forecasts), NaN where no forecast or actual value is available
 
         """
-        y_hat_col = f"yhat{step_number}"
+        y = df_cal["y"].to_numpy(dtype=np.float64)[:, np.newaxis]
+        y_hat_cols = [f"yhat{step_number}" for step_number in range(1, self.n_forecasts + 1)]
         if self.method == "cqr":
             # CQR nonconformity scoring function
-            quantile_lo = str(min(self.quantiles) * 100)
-            quantile_hi = str(max(self.quantiles) * 100)
-            quantile_lo_col = f"{y_hat_col} {quantile_lo}%"
-            quantile_hi_col = f"{y_hat_col} {quantile_hi}%"
+            quantile_lo = df_cal[[f"{col} {min(self.quantiles) * 100}%" for col in y_hat_cols]].to_numpy(np.float64)
+            quantile_hi = df_cal[[f"{col} {max(self.quantiles) * 100}%" for col in y_hat_cols]].to_numpy(np.float64)
             if self.symmetrical:
-
-                def cqr_scoring_func(row):
-                    return (
-                        [None, None]
-                        if row[quantile_lo_col] is None or row[quantile_hi_col] is None
-                        else [
-                            max(row[quantile_lo_col] - row["y"], row["y"] - row[quantile_hi_col]),
-                            0 if row[quantile_lo_col] - row["y"] > row["y"] - row[quantile_hi_col] else 1,
-                        ]
-                    )
-
-                scores_df = df_cal.apply(cqr_scoring_func, axis=1, result_type="expand")
-                scores_df.columns = ["scores", "arg"]
-                noncon_scores = scores_df["scores"].values
+                noncon_scores = {"noncon_scores": np.maximum(quantile_lo - y, y - quantile_hi)}
             else:  # asymmetrical intervals
-
-                def cqr_scoring_func(row):
-                    return (
-                        [None, None]
-                        if row[quantile_lo_col] is None or row[quantile_hi_col] is None
-                        else [
-                            row[quantile_lo_col] - row["y"],
-                            row["y"] - row[quantile_hi_col],
-                            0 if row[quantile_lo_col] - row["y"] > row["y"] - row[quantile_hi_col] else 1,
-                        ]
-                    )
-
-                scores_df = df_cal.apply(cqr_scoring_func, axis=1, result_type="expand")
-                scores_df.columns = ["scores_lo", "scores_hi", "arg"]
-                noncon_scores_lo = scores_df["scores_lo"].values
-                noncon_scores_hi = scores_df["scores_hi"].values
-                # Remove NaN values
-                noncon_scores_lo: Any = noncon_scores_lo[~pd.isnull(noncon_scores_lo)]
-                noncon_scores_hi: Any = noncon_scores_hi[~pd.isnull(noncon_scores_hi)]
-                # Sort
-                noncon_scores_lo.sort()
-                noncon_scores_hi.sort()
-                # return dict of nonconformity scores
-                return {"noncon_scores_hi": noncon_scores_lo, "noncon_scores_lo": noncon_scores_hi}
+                noncon_scores = {"noncon_scores_hi": quantile_lo - y, "noncon_scores_lo": y - quantile_hi}
         else:  # self.method == "naive"
             # Naive nonconformity scoring function
-            noncon_scores = abs(df_cal["y"] - df_cal[y_hat_col]).values
-        # Remove NaN values
-        noncon_scores: Any = noncon_scores[~pd.isnull(noncon_scores)]
-        # Sort
-        noncon_scores.sort()
-
-        return {"noncon_scores": noncon_scores}
+            noncon_scores = {"noncon_scores": np.abs(y - df_cal[y_hat_cols].to_numpy(dtype=np.float64))}
+        return noncon_scores
 
-    def _get_q_hat(self, df_cal: pd.DataFrame, noncon_scores: dict) -> dict:
-        """Get the q_hat that is derived from the nonconformity scores.
+    def _get_q_hats(self, noncon_scores: dict) -> pd.DataFrame:
+        """Get the q_hats of all forecast steps that are derived from the nonconformity scores.
 
         Parameters
         ----------
-            df_cal : pd.DataFrame
-                calibration dataframe
             noncon_scores : dict
-                dictionary with one entry (symmetrical) or two entries (asymmetrical) of nonconformity scores
+                dictionary with one entry (symmetrical) or two entries (asymmetrical) of sorted nonconformity scores
 
             Returns
             -------
-                Dict[str, float]
-                    upper and lower q_hat value, or the one-sided prediction interval width
+                pd.DataFrame
+                    upper and lower q_hat value, or the one-sided prediction interval width, for each forecast step
 
         """
-        # Get the q-hat index and value
         if self.method == "cqr" and self.symmetrical is False:
-            noncon_scores_lo = noncon_scores["noncon_scores_lo"]
-            noncon_scores_hi = noncon_scores["noncon_scores_hi"]
-            q_hat_idx_lo = int(len(noncon_scores_lo) * self.alpha_lo)
-            q_hat_idx_hi = int(len(noncon_scores_hi) * self.alpha_hi)
-            q_hat_lo = noncon_scores_lo[-q_hat_idx_lo]
-            q_hat_hi = noncon_scores_hi[-q_hat_idx_hi]
-            return {"q_hat_lo": q_hat_lo, "q_hat_hi": q_hat_hi}
-        else:
-            noncon_scores = noncon_scores["noncon_scores"]
-            q_hat_idx = int(len(noncon_scores) * self.alpha)
-            q_hat = noncon_scores[-q_hat_idx]
-            return {"q_hat_sym": q_hat}
+            return pd.DataFrame(
+                {
+                    "q_hat_lo": _get_q_hat_per_step(noncon_scores["noncon_scores_lo"], self.alpha_lo),
+                    "q_hat_hi": _get_q_hat_per_step(noncon_scores["noncon_scores_hi"], self.alpha_hi),
+                }
+            )
+        return pd.DataFrame({"q_hat_sym": _get_q_hat_per_step(noncon_scores["noncon_scores"], self.alpha)})
 
     def plot(self, plotting_backend=None):
         """Apply a given conformal prediction technique to get the uncertainty prediction intervals (or q-hats).
@@ -287,86 +271,252 @@ class Conformal:
             fig
 
 
-def uncertainty_evaluate(df_forecast: pd.DataFrame) -> pd.DataFrame:
+@dataclass
+class OnlineConformal(Conformal):
+    """Conformal prediction with incrementally updated nonconformity scores
+
+    The nonconformity scores of each forecast step are kept sorted, optionally over a sliding window of the most
+    recent scores. New calibration data only requires scoring and inserting its own scores to update the q-hats,
+    instead of recomputing the scores of all calibration data.
+
+    Parameters
+    ----------
+    window : int
+        optional, number of most recent nonconformity scores per forecast step used for calibration, all scores are
+        used if None
+
+    """
+
+    window: Optional[int] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.method not in ["naive", "cqr"]:
+            raise ValueError(
+                f"Unknown conformal prediction method '{self.method}'. Please input either 'naive' or 'cqr'."
+            )
+        if self.window is not None and self.window < 1:
+            raise ValueError("The window of nonconformity scores must contain at least one score.")
+        names = ["noncon_scores"] if self.symmetrical else ["noncon_scores_lo", "noncon_scores_hi"]
+        # sorted scores, and scores in order of arrival to remove the oldest scores from the window, of each step
+        self._sorted_scores = {name: [np.empty(0) for _ in range(self.n_forecasts)] for name in names}
+        self._recent_scores = {name: [np.empty(0) for _ in range(self.n_forecasts)] for name in names}
+
+    def update(self, df_cal: pd.DataFrame) -> pd.DataFrame:
+        """Add the nonconformity scores of new calibration data and update the q-hats.
+
+        Parameters
+        ----------
+            df_cal : pd.DataFrame
+                new calibration dataframe, a forecast with actual values ``y``. Rows which were part of an earlier
+                update must not be included again.
+
+            Returns
+            -------
+                pd.DataFrame
+                    upper and lower q_hat value, or the one-sided prediction interval width, for each forecast step
+
+        """
+        for name, scores in self._score(df_cal).items():
+            for step_idx in range(self.n_forecasts):
+                step_scores = scores[:, step_idx]
+                step_scores = step_scores[~np.isnan(step_scores)]
+                removed_scores = np.empty(0)
+                if self.window is not None:
+                    recent_scores = np.concatenate([self._recent_scores[name][step_idx], step_scores])
+                    removed_scores = np.sort(recent_scores[: max(0, len(recent_scores) - self.window)])
+                    self._recent_scores[name][step_idx] = recent_scores = recent_scores[len(removed_scores) :]
+                    if len(removed_scores) >= len(recent_scores):
+                        # the window is mostly replaced
+                        self._sorted_scores[name][step_idx] = np.sort(recent_scores)
+                        continue
+                sorted_scores = self._sorted_scores[name][step_idx]
+                step_scores = np.sort(step_scores)
+                sorted_scores = np.insert(sorted_scores, np.searchsorted(sorted_scores, step_scores), step_scores)
+                if len(removed_scores) > 0:
+                    # position of each removed score, counting equal scores separately
+                    n_equal_before = np.arange(len(removed_scores)) - np.searchsorted(removed_scores, removed_scores)
+                    positions = np.searchsorted(sorted_scores, removed_scores) + n_equal_before
+                    sorted_scores = np.delete(sorted_scores, positions)
+                self._sorted_scores[name][step_idx] = sorted_scores
+        # save nonconformity scores of the first timestep
+        self.noncon_scores = {name: steps[0].copy() for name, steps in self._sorted_scores.items()}
+        if self.symmetrical:
+            q_hats = {"q_hat_sym": [_get_q_hat(s, self.alpha) for s in self._sorted_scores["noncon_scores"]]}
+        else:
+            q_hats = {
+                "q_hat_lo": [_get_q_hat(s, self.alpha_lo) for s in self._sorted_scores["noncon_scores_lo"]],
+                "q_hat_hi": [_get_q_hat(s, self.alpha_hi) for s in self._sorted_scores["noncon_scores_hi"]],
+            }
+        self.q_hats = pd.DataFrame(q_hats)
+        return self.q_hats
+
+    def predict(
+        self, df: pd.DataFrame, df_cal: Optional[pd.DataFrame] = None, show_all_PI: bool = False
+    ) -> pd.DataFrame:
+        """Get the uncertainty prediction intervals for test dataframe with the current q-hats.
+
+        Parameters
+        ----------
+            df : pd.DataFrame
+                test dataframe
+            df_cal : pd.DataFrame
+                optional, new calibration dataframe to update the q-hats with before, see :meth:`update`
+            show_all_PI : bool
+                whether to return all prediction intervals (including quantile regression and conformal prediction)
+
+            Returns
+            -------
+                pd.DataFrame
+                    test dataframe with uncertainty prediction intervals
+
+        """
+        if df_cal is not None:
+            self.update(df_cal)
+        if len(self.q_hats) == 0:
+            raise ValueError("No calibration data available. Please update the conformal prediction with data first.")
+        return self._add_intervals(df, show_all_PI)
+
+
+def _get_q_hat(sorted_scores: np.ndarray, alpha: float) -> float:
+    """Get the q_hat of one forecast step from its sorted nonconformity scores, NaN if there are none."""
+    if len(sorted_scores) == 0:
+        return np.nan
+    q_hat_idx = int(len(sorted_scores) * alpha)
+    return sorted_scores[-q_hat_idx]
+
+
+def _get_q_hat_per_step(sorted_scores: np.ndarray, alpha: float) -> np.ndarray:
+    """Get the q_hat of each forecast step from its sorted nonconformity scores.
+
+    Parameters
+    ----------
+        sorted_scores : np.ndarray
+            nonconformity scores of shape (rows, n_forecasts), sorted per forecast step with NaN values last
+        alpha : float
+            significance level
+
+    Returns
+    -------
+        np.ndarray
+            q_hat of each forecast step
+    """
+    n_scores = np.count_nonzero(~np.isnan(sorted_scores), axis=0)
+    # q_hat is the int(n_scores * alpha)-th largest score, or the smallest score if this is zero
+    q_hat_idx = (n_scores * alpha).astype(int)
+    q_hat_pos = np.where(q_hat_idx > 0, n_scores - q_hat_idx, 0)
+    return sorted_scores[q_hat_pos, np.arange(sorted_scores.shape[1])]
+
+
+def uncertainty_evaluate(df_forecast: pd.DataFrame, per_id: bool = False, window: Optional[int] = None) -> pd.DataFrame:
     """Evaluate conformal prediction on test dataframe.
 
+    The interval width and miscoverage rate of all forecast steps are computed at once, from the interval bounds of
+    all steps gathered in one array.
+
     Parameters
     ----------
         df_forecast : pd.DataFrame
             forecast dataframe with the conformal prediction intervals
+        per_id : bool
+            whether to evaluate each time series (``ID``) separately
+        window : int
+            number of rows of a rolling evaluation window, per time series.
+            If set, each row of the result evaluates the ``window`` rows up to and including the row at ``ds``.
 
     Returns
     -------
         pd.DataFrame
-            table containing evaluation metrics such as interval_width and miscoverage_rate
+            table containing evaluation metrics such as interval_width and miscoverage_rate,
+            with columns ``(yhat<step>, metric)``, indexed by ``ID`` and/or ``ds`` when evaluated per ID or window
     """
     # Remove beginning rows used as lagged regressors (if any), or future dataframes without y-values
     # therefore, this ensures that all forecast rows for evaluation contains both y and y-hat
     df_forecast_eval = df_forecast.dropna(subset=["y", "yhat1"]).reset_index(drop=True)
-
-    # Get evaluation params
-    df_eval = pd.DataFrame()
-    cols = df_forecast_eval.columns
-    yhat_cols = [col for col in cols if "%" in col]
-    n_forecasts = int(re.search("yhat(\\d+)", yhat_cols[-1]).group(1))
-
-    # get the highest and lowest quantile percentages
-    quantiles = []
-    for col in yhat_cols:
-        match = re.search(r"\d+\.\d+", col)
-        if match:
-            quantiles.append(float(match.group()))
-    quantiles = sorted(set(quantiles))
-
-    # Begin conformal evaluation steps
-    for step_number in range(1, n_forecasts + 1):
-        y = df_forecast_eval["y"].values
-        # only relevant if show_all_PI is true
-        if len([col for col in cols if "qhat" in col]) > 0:
-            qhat_cols = [col for col in cols if f"qhat{step_number}" in col]
-            yhat_lo = df_forecast_eval[qhat_cols[0]].values
-            yhat_hi = df_forecast_eval[qhat_cols[-1]].values
+    lo_cols, hi_cols = _get_interval_columns(df_forecast_eval.columns)
+
+    # Interval bounds of all steps, dims: (rows, steps, lower and upper bound)
+    y = df_forecast_eval["y"].to_numpy(dtype=np.float64)[:, np.newaxis]
+    bounds = np.stack(
+        (df_forecast_eval[lo_cols].to_numpy(dtype=np.float64), df_forecast_eval[hi_cols].to_numpy(dtype=np.float64)),
+        axis=2,
+    )
+    # Interval width (efficiency metric) and miscoverage (validity metric) of each row, dims: (rows, steps * 2)
+    covered = (y >= bounds[:, :, 0]) & (y <= bounds[:, :, 1])
+    metrics = np.stack((bounds[:, :, 1] - bounds[:, :, 0], ~covered), axis=2).reshape(len(y), -1)
+
+    # Group the rows by time series, keeping their order within each time series
+    by_id = per_id and "ID" in df_forecast_eval.columns
+    if by_id:
+        codes, df_names = pd.factorize(df_forecast_eval["ID"], sort=True)
+    else:
+        codes, df_names = np.zeros(len(y), dtype=np.int64), None
+    order = np.argsort(codes, kind="stable")
+    codes, metrics = codes[order], metrics[order]
+    starts = np.flatnonzero(np.diff(codes, prepend=-1))
+
+    if window is None:
+        counts = np.diff(np.append(starts, len(codes)))
+        values = np.add.reduceat(metrics, starts, axis=0) / counts[:, np.newaxis]
+        index = pd.Index(df_names, name="ID") if by_id else None
+    else:
+        # Rolling sums from cumulative sums, NaN values (e.g. of missing forecasts) only affect their windows
+        missing = np.isnan(metrics)
+        sums = np.cumsum(np.concatenate((np.zeros((1, metrics.shape[1])), np.where(missing, 0, metrics))), axis=0)
+        n_missing = np.cumsum(np.concatenate((np.zeros((1, metrics.shape[1])), missing)), axis=0)
+        ends = np.arange(1, len(codes) + 1)
+        valid = ends - window >= starts[np.searchsorted(starts, ends - 1, side="right") - 1]
+        ends = ends[valid]
+        values = (sums[ends] - sums[ends - window]) / window
+        values[n_missing[ends] - n_missing[ends - window] > 0] = np.nan
+        ds = df_forecast_eval["ds"].to_numpy()[order][valid]
+        if by_id:
+            index = pd.MultiIndex.from_arrays([df_names[codes[valid]], ds], names=["ID", "ds"])
         else:
-            yhat_lo = df_forecast_eval[f"yhat{step_number} {quantiles[0]}%"].values
-            yhat_hi = df_forecast_eval[f"yhat{step_number} {quantiles[-1]}%"].values
-        interval_width, miscoverage_rate = _get_evaluate_metrics_from_dataset(y, yhat_lo, yhat_hi)
-
-        # Construct row dataframe with current timestep using its q-hat, interval width, and miscoverage rate
-        col_names = ["interval_width", "miscoverage_rate"]
-        row = [interval_width, miscoverage_rate]
-        df_row = pd.DataFrame([row], columns=pd.MultiIndex.from_product([[f"yhat{step_number}"], col_names]))
+            index = pd.Index(ds, name="ds")
 
-        # Add row dataframe to overall evaluation dataframe with all forecasted timesteps
-        df_eval = pd.concat([df_eval, df_row], axis=1)
+    columns = pd.MultiIndex.from_product(
+        [[f"yhat{step_number}" for step_number in range(1, len(lo_cols) + 1)], ["interval_width", "miscoverage_rate"]]
+    )
+    return pd.DataFrame(values, index=index, columns=columns)
 
-    return df_eval
 
-
-def _get_evaluate_metrics_from_dataset(y: np.ndarray, yhat_lo: np.ndarray, yhat_hi: np.ndarray) -> Tuple[float, float]:
-    #     df_forecast_eval: pd.DataFrame,
-    #     quantile_lo_col: str,
-    #     quantile_hi_col: str,
-    # ) -> Tuple[float, float]:
-    """Infers evaluation parameters based on the evaluation dataframe columns.
+def _get_interval_columns(cols: pd.Index) -> Tuple[List[str], List[str]]:
+    """Get the columns of the lower and upper interval bounds of each forecast step.
 
     Parameters
     ----------
-        df_forecast_eval : pd.DataFrame
-            forecast dataframe with the conformal prediction intervals
+        cols : pd.Index
+            columns of the forecast dataframe with the conformal prediction intervals
 
     Returns
     -------
-        float, float
-            conformal prediction evaluation metrics
+        list, list
+            lower and upper interval bound columns, one per forecast step
     """
-    # Interval width (efficiency metric)
-    quantile_lo_mean = np.mean(yhat_lo)
-    quantile_hi_mean = np.mean(yhat_hi)
-    interval_width = quantile_hi_mean - quantile_lo_mean
+    yhat_cols = [col for col in cols if "%" in col]
+    n_forecasts = int(re.search("yhat(\\d+)", yhat_cols[-1]).group(1))
 
-    # Miscoverage rate (validity metric)
-    n_covered = np.sum((y >= yhat_lo) & (y <= yhat_hi))
-    coverage_rate = n_covered / len(y)
-    miscoverage_rate = 1 - coverage_rate
+    # only relevant if show_all_PI is true, the outermost intervals of each step
+    qhat_cols = {}
+    for col in cols:
+        match = re.search(r"qhat(\d+)$", col)
+        if match:
+            qhat_cols.setdefault(int(match.group(1)), []).append(col)
+    if len(qhat_cols) > 0:
+        steps = range(1, n_forecasts + 1)
+        return [qhat_cols[step_number][0] for step_number in steps], [
+            qhat_cols[step_number][-1] for step_number in steps
+        ]
 
-    return interval_width, miscoverage_rate
+    # get the highest and lowest quantile percentages
+    quantiles = []
+    for col in yhat_cols:
+        match = re.search(r"\d+\.\d+", col)
+        if match:
+            quantiles.append(float(match.group()))
+    quantiles = sorted(set(quantiles))
+    return (
+        [f"yhat{step_number} {quantiles[0]}%" for step_number in range(1, n_forecasts + 1)],
+        [f"yhat{step_number} {quantiles[-1]}%" for step_number in range(1, n_forecasts + 1)],
+    )
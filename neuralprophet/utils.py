@@ -12,7 +12,7 @@ import pandas as pd
 import torch
 from lightning_fabric.utilities.seed import seed_everything
 
-from neuralprophet import utils_torch
+from neuralprophet import np_types, utils_serialization, utils_torch
 
 if TYPE_CHECKING:
     from neuralprophet import configure_components
@@ -22,7 +22,7 @@ log = logging.getLogger("NP.utils")
 FILE_LIKE = Union[str, os.PathLike, BinaryIO, IO[bytes]]
 
 
-def save(forecaster, path: FILE_LIKE):
+def save(forecaster, path: FILE_LIKE, format: np_types.SaveFormat = "state"):
     """Save a fitted Neural Prophet model to disk.
 
     Parameters:
@@ -30,6 +30,13 @@ def save(forecaster, path: FILE_LIKE):
             input forecaster that is fitted
         path : FILE_LIKE
             Path and filename to be saved, or an in-memory buffer. Filename could be any but suggested to have extension .np.
+        format : {``state``, ``torch``}
+            Serialization format of the saved model.
+
+            Options
+                * (default) ``state``: compact versioned format of the configuration and the model weights,
+                  see ``neuralprophet.utils_serialization``
+                * ``torch``: pickle of the whole forecaster object with ``torch.save``
 
     After you fitted a model, you may save the model to save_test_model.np
         >>> from neuralprophet import save
@@ -38,6 +45,16 @@ def save(forecaster, path: FILE_LIKE):
         >>> buffer = io.BytesIO()
         >>> save(forecaster, buffer)
     """
+    if format == "state":
+        if isinstance(path, (str, os.PathLike)):
+            with open(path, "wb") as file:
+                utils_serialization.save_state(forecaster, file)
+        else:
+            utils_serialization.save_state(forecaster, path)
+        return
+    if format != "torch":
+        raise ValueError(f"Unknown save format {format}, must be one of 'state' or 'torch'.")
+
     # List of attributes to remove
     attrs_to_remove_forecaster = ["trainer"]
     attrs_to_remove_model = ["_trainer"]
@@ -75,6 +92,8 @@ def save(forecaster, path: FILE_LIKE):
 def load(path: FILE_LIKE, map_location=None):
     """retrieve a fitted model from a .np file or buffer that was saved by save.
 
+    Both the compact state format and whole-object pickles saved with ``format="torch"`` are detected and loaded.
+
     Parameters
     ----------
         path : FILE_LIKE
@@ -99,11 +118,47 @@ def load(path: FILE_LIKE, map_location=None):
     if map_location is not None:
         torch_map_location = torch.device(map_location)
 
-    m = torch.load(path, map_location=torch_map_location)
-    m.restore_trainer(accelerator=map_location)
+    if isinstance(path, (str, os.PathLike)):
+        with open(path, "rb") as file:
+            m = _load_file(file, torch_map_location)
+    else:
+        m = _load_file(path, torch_map_location)
+    # The trainer is only restored when needed, predicting does not require one
+    m.trainer = None
+    if map_location is not None:
+        m.accelerator = map_location
     return m
 
 
+def _load_file(file, map_location):
+    if utils_serialization.is_state_file(file):
+        return utils_serialization.load_state(file, map_location=map_location)
+    return torch.load(file, map_location=map_location)
+
+
+def convert(source: FILE_LIKE, target: FILE_LIKE):
+    """Convert a model saved as whole-object pickle (``format="torch"``) to the compact state format.
+
+    Parameters
+    ----------
+        source : FILE_LIKE
+            Path and filename, or buffer, of the model to be converted.
+        target : FILE_LIKE
+            Path and filename, or buffer, the converted model is saved to.
+
+    Examples
+    --------
+        >>> from neuralprophet import convert
+        >>> convert("old_model.np", "new_model.np")
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            m = _load_file(file, torch.device("cpu"))
+    else:
+        m = _load_file(source, torch.device("cpu"))
+    save(m, target, format="state")
+
+
 def reg_func_abs(weights):
     """Regularization of weights to induce sparcity
 
@@ -650,40 +705,41 @@ def fcst_df_to_latest_forecast(fcst, quantiles, n_last=1):
     Returns
     -------
         pd.DataFrame
-            Dataframe where origin-0 is latest forecast, origin-1 second to latest etc
+            Dataframe where origin-0 is latest forecast, origin-1 second to latest etc, with float forecast columns
     """
-    cols = ["ds", "y"]  # cols to keep from df
-    df = pd.concat((fcst[cols],), axis=1)
-    df.reset_index(drop=True, inplace=True)
+    df = fcst[["ds", "y"]].reset_index(drop=True)
 
     yhat_col_names = [
         col_name for col_name in fcst.columns if "yhat" in col_name and "%" not in col_name and "qhat" not in col_name
     ]
     yhat_col_names_quants = [col_name for col_name in fcst.columns if "yhat" in col_name and "%" in col_name]
     n_forecast_steps = len(yhat_col_names)
-    yhats = pd.concat((fcst[yhat_col_names],), axis=1)
-    yhats_quants = pd.concat((fcst[yhat_col_names_quants],), axis=1)
-    cols = list(range(n_forecast_steps))
+    n_rows = len(df)
+    if n_rows < n_forecast_steps + n_last - 1:
+        raise ValueError(
+            f"The forecast df has {n_rows} rows, at least {n_forecast_steps + n_last - 1} rows are required "
+            f"for the {n_last} latest forecasts of {n_forecast_steps} steps."
+        )
+    # yhats of shape (rows, quantiles, forecast steps), the quantile columns are ordered one quantile after another
+    yhats = np.concatenate(
+        (fcst[yhat_col_names].to_numpy(dtype=np.float64), fcst[yhat_col_names_quants].to_numpy(dtype=np.float64)),
+        axis=1,
+    )[:, : len(quantiles) * n_forecast_steps].reshape(n_rows, -1, n_forecast_steps)
+    n_quantiles = yhats.shape[1]
+
+    # origin-i forecasts step j+1 for row n_rows - n_forecast_steps - i + j, a diagonal of the yhat matrix
+    origins = np.arange(n_last)[:, np.newaxis]
+    steps = np.arange(n_forecast_steps)[np.newaxis, :]
+    rows = n_rows - n_forecast_steps - origins + steps
+    latest = np.full((n_last, n_quantiles, n_rows), np.nan)
+    latest[origins[:, :, np.newaxis], np.arange(n_quantiles), rows[:, :, np.newaxis]] = yhats[rows, :, steps]
+
+    columns = {}
     for i in range(n_last - 1, -1, -1):
-        forecast_name = f"origin-{i}"
-        df[forecast_name] = None
-        rows = len(df) + np.arange(-n_forecast_steps - i, -i, 1)
-        last = yhats.values[rows, cols]
-        df.loc[rows, forecast_name] = last
-        startcol = 0
-        endcol = n_forecast_steps
-        for quantile_idx in range(1, len(quantiles)):
-            yhats_quants_split = yhats_quants.iloc[
-                :, startcol:endcol
-            ]  # split yhats_quants to consider one quantile at a time
-            forecast_name_quants = "origin-{} {}%".format((i), quantiles[quantile_idx] * 100)
-            df[forecast_name_quants] = None
-            rows = len(df) + np.arange(-n_forecast_steps - i, -i, 1)
-            last = yhats_quants_split.values[rows, cols]
-            df.loc[rows, forecast_name_quants] = last
-            startcol += n_forecast_steps
-            endcol += n_forecast_steps
-    return df
+        columns[f"origin-{i}"] = latest[i, 0]
+        for quantile_idx in range(1, n_quantiles):
+            columns["origin-{} {}%".format(i, quantiles[quantile_idx] * 100)] = latest[i, quantile_idx]
+    return pd.concat((df, pd.DataFrame(columns, index=df.index)), axis=1)
 
 
 class HiddenPrints:
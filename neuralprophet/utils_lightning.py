@@ -179,6 +179,10 @@ def configure_trainer(
 
     pl_trainer_config["deterministic"] = deterministic
 
+    # Numerical precision, bf16 autocasts the forward pass while keeping float32 weights
+    if "precision" not in pl_trainer_config:
+        pl_trainer_config["precision"] = config_train.precision
+
     # Configure callbacks
     callbacks = []
     has_custom_callbacks = True if "callbacks" in pl_trainer_config else False
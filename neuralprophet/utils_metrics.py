@@ -1,5 +1,7 @@
 import logging
 
+import numpy as np
+import pandas as pd
 import torchmetrics
 
 log = logging.getLogger("NP.metrics")
@@ -55,3 +57,83 @@ def get_metrics(metric_input):
         return {k: [v, {}] for k, v in metric_input.items()}
     else:
         raise ValueError("Received unsupported argument for collect_metrics.")
+
+
+class ForecastMetricsAccumulator:
+    """Accumulates forecast errors per time series and forecast step, one batch at a time.
+
+    Only running sums are kept, so that arbitrarily many batches can be evaluated with constant memory.
+    """
+
+    def __init__(self, df_names, n_forecasts, quantiles):
+        """
+        Parameters
+        ----------
+            df_names : list
+                names of the time series (``ID``), indexed by the codes passed to :meth:`update`
+            n_forecasts : int
+                number of forecast steps
+            quantiles : list
+                quantiles of the forecast, the first one being the median
+        """
+        self.df_names = list(df_names)
+        self.n_forecasts = n_forecasts
+        self.quantiles = np.asarray(quantiles, dtype=np.float64)
+        n_bins = len(self.df_names) * n_forecasts
+        self.sums = {name: np.zeros(n_bins) for name in ["n", "abs", "sq", "ape", "n_ape", "pinball"]}
+
+    def update(self, id_codes, predicted, targets):
+        """Adds the errors of one batch.
+
+        Parameters
+        ----------
+            id_codes : np.array, int
+                code of the time series of each sample, dims: (batch,)
+            predicted : np.array, float
+                denormalized forecasts, dims: (batch, n_forecasts, quantiles)
+            targets : np.array, float
+                denormalized targets, dims: (batch, n_forecasts)
+        """
+        bins = np.asarray(id_codes)[:, np.newaxis] * self.n_forecasts + np.arange(self.n_forecasts)
+        valid = np.isfinite(targets) & np.isfinite(predicted).all(axis=2)
+        bins, targets, predicted = bins[valid], targets[valid], predicted[valid]
+        errors = targets - predicted[:, 0]
+        abs_errors = np.abs(errors)
+        nonzero = targets != 0
+        differences = targets[:, np.newaxis] - predicted
+        pinball = np.maximum(self.quantiles * differences, (self.quantiles - 1) * differences).mean(axis=1)
+        n_bins = len(self.df_names) * self.n_forecasts
+        for name, weights in [
+            ("n", None),
+            ("abs", abs_errors),
+            ("sq", errors**2),
+            ("ape", np.where(nonzero, abs_errors / np.where(nonzero, np.abs(targets), 1.0), 0.0)),
+            ("n_ape", nonzero.astype(np.float64)),
+            ("pinball", pinball),
+        ]:
+            self.sums[name] += np.bincount(bins, weights=weights, minlength=n_bins)
+
+    def compute(self):
+        """Returns the metrics of all batches added so far.
+
+        Returns
+        -------
+            pd.DataFrame
+                one row per time series and forecast step with columns ``ID``, ``step``, ``n`` (number of evaluated
+                targets), ``MAE``, ``RMSE``, ``MAPE`` (as a fraction, excluding zero targets) and ``Pinball`` (mean
+                pinball loss over all quantiles)
+        """
+        n = self.sums["n"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            metrics = pd.DataFrame(
+                {
+                    "ID": np.repeat(self.df_names, self.n_forecasts),
+                    "step": np.tile(np.arange(1, self.n_forecasts + 1), len(self.df_names)),
+                    "n": n.astype(np.int64),
+                    "MAE": self.sums["abs"] / n,
+                    "RMSE": np.sqrt(self.sums["sq"] / n),
+                    "MAPE": self.sums["ape"] / self.sums["n_ape"],
+                    "Pinball": self.sums["pinball"] / n,
+                }
+            )
+        return metrics[metrics["n"] > 0].reset_index(drop=True)
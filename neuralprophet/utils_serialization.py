@@ -0,0 +1,387 @@
+"""
+Compact, versioned serialization format for fitted NeuralProphet models.
+
+A file consists of a fixed magic, the size of the header, a JSON header and a flat binary blob of tensors::
+
+    b"NPSTATE\\0" | header size (uint64, little endian) | header (utf-8 JSON) | tensor blob
+
+The header holds the format version, the configuration and normalization state of the forecaster and an index of
+all tensors in the blob (dtype, shape and byte offsets, in the spirit of safetensors). Model weights are stored as the
+state dict of the ``TimeNet``, the model itself is rebuilt from the configuration when loading.
+Reading a file only requires ``json``, ``numpy`` and ``torch``; no Lightning objects are created.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import datetime
+import importlib
+import json
+import logging
+import struct
+from collections import OrderedDict
+from typing import IO, BinaryIO, Optional, Union
+
+import numpy as np
+import pandas as pd
+import torch
+
+from neuralprophet._version import __version__
+
+log = logging.getLogger("NP.utils_serialization")
+
+MAGIC = b"NPSTATE\0"
+FORMAT_VERSION = 1
+# Tensors are aligned in the blob, so that they can be viewed with their dtype without copying
+ALIGNMENT = 8
+# Modules from which classes and functions referenced in the configuration may be imported when loading
+TRUSTED_MODULES = ("neuralprophet", "torch", "torchmetrics", "numpy", "pandas", "builtins", "collections")
+
+# Attributes of the forecaster that are not configuration and are rebuilt when loading
+FORECASTER_EXCLUDED_ATTRIBUTES = ["model", "trainer", "metrics_logger", "component_curves", "profiler"]
+# Attributes of the TimeNet which are set during fitting, in addition to its state dict
+MODEL_ATTRIBUTES = ["learning_rate", "batch_size", "train_steps_per_epoch", "train_progress"]
+# Entries of the Lightning trainer config which hold runtime objects or flags derived from the arguments of the last
+# fit, these are set up again when the trainer is configured
+TRAINER_CONFIG_RUNTIME_KEYS = ["logger", "callbacks", "enable_progress_bar", "enable_checkpointing"]
+
+
+class _Encoder:
+    """Converts configuration objects into JSON compatible structures, collecting arrays and tensors in a blob."""
+
+    def __init__(self):
+        self.tensors = OrderedDict()
+
+    def add_tensor(self, tensor: torch.Tensor) -> str:
+        key = f"config.{len(self.tensors)}"
+        self.tensors[key] = tensor
+        return key
+
+    def encode(self, obj):
+        if obj is None or isinstance(obj, (bool, str)):
+            return obj
+        if isinstance(obj, (np.generic,)):
+            return {"__type__": "numpy_scalar", "dtype": obj.dtype.str, "value": obj.item()}
+        if isinstance(obj, (int, float)):
+            return obj
+        if isinstance(obj, torch.Tensor):
+            return {"__type__": "tensor", "key": self.add_tensor(obj)}
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.hasobject:
+                return {"__type__": "object_array", "items": [self.encode(item) for item in obj.tolist()]}
+            return {"__type__": "ndarray", "dtype": obj.dtype.str, "key": self.add_tensor(obj)}
+        if isinstance(obj, pd.Timestamp):
+            return {"__type__": "timestamp", "value": obj.isoformat()}
+        if isinstance(obj, pd.Timedelta):
+            return {"__type__": "timedelta", "value": obj.value}
+        if isinstance(obj, datetime.datetime):
+            return {"__type__": "datetime", "value": obj.isoformat()}
+        if isinstance(obj, datetime.date):
+            return {"__type__": "date", "value": obj.isoformat()}
+        if isinstance(obj, torch.device):
+            return {"__type__": "device", "value": str(obj)}
+        if isinstance(obj, torch.dtype):
+            return {"__type__": "torch_dtype", "value": str(obj).replace("torch.", "")}
+        if isinstance(obj, OrderedDict):
+            return {"__type__": "ordered_dict", "items": [[self.encode(k), self.encode(v)] for k, v in obj.items()]}
+        if isinstance(obj, dict):
+            if all(isinstance(k, str) for k in obj) and "__type__" not in obj:
+                return {k: self.encode(v) for k, v in obj.items()}
+            return {"__type__": "dict", "items": [[self.encode(k), self.encode(v)] for k, v in obj.items()]}
+        if isinstance(obj, list):
+            return [self.encode(item) for item in obj]
+        if isinstance(obj, tuple):
+            return {"__type__": "tuple", "items": [self.encode(item) for item in obj]}
+        if isinstance(obj, (set, frozenset)):
+            items = sorted(obj, key=repr)
+            return {"__type__": type(obj).__name__, "items": [self.encode(item) for item in items]}
+        if isinstance(obj, type) or callable(obj) and not isinstance(obj, torch.nn.Module):
+            return {"__type__": "reference", "path": _reference_path(obj)}
+        if dataclasses.is_dataclass(obj):
+            return {
+                "__type__": "dataclass",
+                "class": _reference_path(type(obj)),
+                "fields": {k: self.encode(v) for k, v in vars(obj).items()},
+            }
+        if isinstance(obj, torch.nn.Module):
+            if len(obj.state_dict()) > 0:
+                raise TypeError(f"Cannot serialize module {type(obj).__name__} with state as part of the config.")
+            return {
+                "__type__": "module",
+                "class": _reference_path(type(obj)),
+                "attributes": {k: self.encode(v) for k, v in vars(obj).items() if not k.startswith("_")},
+                "modules": {k: self.encode(v) for k, v in obj._modules.items()},
+            }
+        raise TypeError(f"Cannot serialize object of type {type(obj).__name__}: {obj!r}")
+
+
+class _Decoder:
+    """Restores configuration objects from their JSON compatible structure and the loaded tensors."""
+
+    def __init__(self, tensors: dict):
+        self.tensors = tensors
+
+    def decode(self, obj):
+        if isinstance(obj, list):
+            return [self.decode(item) for item in obj]
+        if not isinstance(obj, dict):
+            return obj
+        obj_type = obj.get("__type__")
+        if obj_type is None:
+            return {k: self.decode(v) for k, v in obj.items()}
+        if obj_type == "numpy_scalar":
+            return np.dtype(obj["dtype"]).type(obj["value"])
+        if obj_type == "tensor":
+            return self.tensors[obj["key"]]
+        if obj_type == "ndarray":
+            return self.tensors[obj["key"]]
+        if obj_type == "object_array":
+            return np.array([self.decode(item) for item in obj["items"]], dtype=object)
+        if obj_type == "timestamp":
+            return pd.Timestamp(obj["value"])
+        if obj_type == "timedelta":
+            return pd.Timedelta(obj["value"])
+        if obj_type == "datetime":
+            return datetime.datetime.fromisoformat(obj["value"])
+        if obj_type == "date":
+            return datetime.date.fromisoformat(obj["value"])
+        if obj_type == "device":
+            return torch.device(obj["value"])
+        if obj_type == "torch_dtype":
+            return getattr(torch, obj["value"])
+        if obj_type == "ordered_dict":
+            return OrderedDict((self.decode(k), self.decode(v)) for k, v in obj["items"])
+        if obj_type == "dict":
+            return {self.decode(k): self.decode(v) for k, v in obj["items"]}
+        if obj_type == "tuple":
+            return tuple(self.decode(item) for item in obj["items"])
+        if obj_type == "set":
+            return set(self.decode(item) for item in obj["items"])
+        if obj_type == "frozenset":
+            return frozenset(self.decode(item) for item in obj["items"])
+        if obj_type == "reference":
+            return _resolve_reference(obj["path"])
+        if obj_type == "dataclass":
+            cls = _resolve_reference(obj["class"])
+            instance = cls.__new__(cls)
+            for k, v in obj["fields"].items():
+                setattr(instance, k, self.decode(v))
+            return instance
+        if obj_type == "module":
+            cls = _resolve_reference(obj["class"])
+            module = cls.__new__(cls)
+            torch.nn.Module.__init__(module)
+            for k, v in obj["attributes"].items():
+                setattr(module, k, self.decode(v))
+            for k, v in obj["modules"].items():
+                module.add_module(k, self.decode(v))
+            return module
+        raise ValueError(f"Unknown serialized type {obj_type}.")
+
+
+def _reference_path(obj) -> str:
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if module is None or qualname is None or "<" in qualname:
+        raise TypeError(f"Cannot serialize {obj!r}, only importable classes and functions can be referenced.")
+    return f"{module}:{qualname}"
+
+
+def _resolve_reference(path: str):
+    module_name, qualname = path.split(":")
+    if module_name.split(".")[0] not in TRUSTED_MODULES:
+        raise ValueError(f"Refusing to import {path}, module is not in {TRUSTED_MODULES}.")
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _without_runtime_objects(trainer_config: Optional[dict]) -> Optional[dict]:
+    if trainer_config is None:
+        return None
+    return {k: v for k, v in trainer_config.items() if k not in TRAINER_CONFIG_RUNTIME_KEYS}
+
+
+def _as_bytes(value: Union[torch.Tensor, np.ndarray]) -> tuple[str, list, bytes]:
+    if isinstance(value, torch.Tensor):
+        tensor = value.detach().cpu().contiguous()
+        dtype = str(tensor.dtype).replace("torch.", "")
+        return dtype, list(tensor.shape), tensor.reshape(-1).view(torch.uint8).numpy().tobytes()
+    array = np.ascontiguousarray(value)
+    return array.dtype.str, list(array.shape), array.tobytes()
+
+
+def write_state(file: BinaryIO, header: dict, tensors: dict):
+    """Writes a header and named tensors (torch tensors or numpy arrays) to a binary file object.
+
+    Parameters
+    ----------
+        file : BinaryIO
+            writable binary file object
+        header : dict
+            JSON serializable header, an index of the tensors is added under the key ``tensors``
+        tensors : dict
+            named torch tensors or numpy arrays to store in the blob
+    """
+    index = OrderedDict()
+    chunks = []
+    offset = 0
+    for name, value in tensors.items():
+        dtype, shape, data = _as_bytes(value)
+        kind = "tensor" if isinstance(value, torch.Tensor) else "ndarray"
+        index[name] = {"kind": kind, "dtype": dtype, "shape": shape, "offsets": [offset, offset + len(data)]}
+        padding = -len(data) % ALIGNMENT
+        chunks.append(data + b"\0" * padding)
+        offset += len(data) + padding
+    header = dict(header, tensors=index)
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * (-len(header_bytes) % ALIGNMENT)
+    file.write(MAGIC)
+    file.write(struct.pack("<Q", len(header_bytes)))
+    file.write(header_bytes)
+    for chunk in chunks:
+        file.write(chunk)
+
+
+def read_state(file: BinaryIO) -> tuple[dict, dict]:
+    """Reads the header and all tensors written by ``write_state``.
+
+    Parameters
+    ----------
+        file : BinaryIO
+            readable binary file object, positioned at the start of the file
+
+    Returns
+    -------
+        dict
+            header of the file
+        dict
+            named torch tensors and numpy arrays
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a NeuralProphet state file.")
+    (header_size,) = struct.unpack("<Q", file.read(8))
+    header = json.loads(file.read(header_size).decode("utf-8"))
+    if header.get("format_version", 0) > FORMAT_VERSION:
+        raise ValueError(
+            f"State file has format version {header['format_version']}, "
+            f"this version of NeuralProphet supports up to {FORMAT_VERSION}. Please upgrade NeuralProphet."
+        )
+    blob = bytearray(file.read())
+    blob_tensor = torch.frombuffer(blob, dtype=torch.uint8) if len(blob) > 0 else None
+    tensors = OrderedDict()
+    for name, entry in header["tensors"].items():
+        start, end = entry["offsets"]
+        if entry["kind"] == "tensor":
+            dtype = getattr(torch, entry["dtype"])
+            if end > start:
+                tensors[name] = blob_tensor[start:end].view(dtype).reshape(entry["shape"])
+            else:
+                tensors[name] = torch.empty(entry["shape"], dtype=dtype)
+        else:
+            dtype = np.dtype(entry["dtype"])
+            tensors[name] = np.frombuffer(blob, dtype=dtype, count=(end - start) // dtype.itemsize, offset=start)
+            tensors[name] = tensors[name].reshape(entry["shape"]).copy()
+    return header, tensors
+
+
+def is_state_file(file: Union[BinaryIO, IO[bytes]]) -> bool:
+    """Checks whether a seekable binary file object starts with the state format magic, without consuming it."""
+    position = file.tell()
+    magic = file.read(len(MAGIC))
+    file.seek(position)
+    return magic == MAGIC
+
+
+def save_state(forecaster, file: BinaryIO):
+    """Writes a fitted forecaster in the compact state format to a binary file object.
+
+    Parameters
+    ----------
+        forecaster : np.forecaster.NeuralProphet
+            input forecaster that is fitted
+        file : BinaryIO
+            writable binary file object
+    """
+    encoder = _Encoder()
+    attributes = {k: v for k, v in vars(forecaster).items() if k not in FORECASTER_EXCLUDED_ATTRIBUTES}
+    if attributes.get("config_train") is not None:
+        attributes["config_train"] = copy.copy(attributes["config_train"])
+        attributes["config_train"].pl_trainer_config = _without_runtime_objects(
+            attributes["config_train"].pl_trainer_config
+        )
+    if attributes.get("config") is not None:
+        attributes["config"] = dict(
+            attributes["config"], trainer_config=_without_runtime_objects(attributes["config"].get("trainer_config"))
+        )
+    config = {attr: encoder.encode(value) for attr, value in attributes.items()}
+    model_attributes = {}
+    tensors = OrderedDict()
+    if forecaster.model is not None:
+        model_attributes = {
+            attr: encoder.encode(getattr(forecaster.model, attr))
+            for attr in MODEL_ATTRIBUTES
+            if hasattr(forecaster.model, attr)
+        }
+        for name, value in forecaster.model.state_dict().items():
+            tensors[f"model.{name}"] = value
+    tensors.update(encoder.tensors)
+    metrics_log_dir = None
+    if forecaster.metrics_logger is not None:
+        metrics_log_dir = forecaster.metrics_logger.save_dir
+    header = {
+        "format_version": FORMAT_VERSION,
+        "neuralprophet_version": __version__,
+        "forecaster": config,
+        "model": model_attributes if forecaster.model is not None else None,
+        "metrics_log_dir": metrics_log_dir,
+    }
+    write_state(file, header, tensors)
+
+
+def load_state(file: BinaryIO, map_location: Optional[str] = None):
+    """Restores a forecaster written by ``save_state``, without restoring the trainer.
+
+    Parameters
+    ----------
+        file : BinaryIO
+            readable binary file object, positioned at the start of the file
+        map_location : str, optional
+            device to move the model weights to
+
+    Returns
+    -------
+        np.forecaster.NeuralProphet
+            previously saved model
+    """
+    from neuralprophet.forecaster import NeuralProphet
+    from neuralprophet.logger import MetricsLogger
+
+    header, tensors = read_state(file)
+    decoder = _Decoder(tensors)
+    forecaster = NeuralProphet.__new__(NeuralProphet)
+    for attr, value in header["forecaster"].items():
+        setattr(forecaster, attr, decoder.decode(value))
+    forecaster.trainer = None
+    forecaster.metrics_logger = None
+    forecaster.component_curves = {}
+    forecaster.profiler = None
+    if header["metrics_log_dir"] is not None:
+        forecaster.metrics_logger = MetricsLogger(save_dir=header["metrics_log_dir"])
+    forecaster.model = None
+    if header["model"] is not None:
+        # The trend component prepends the zero changepoint to the configured changepoints when it is built
+        if forecaster.config_trend is not None and forecaster.config_trend.changepoints is not None:
+            forecaster.config_trend.changepoints = forecaster.config_trend.changepoints[1:]
+        forecaster.model = forecaster._init_model()
+        state_dict = OrderedDict(
+            (name[len("model.") :], value) for name, value in tensors.items() if name.startswith("model.")
+        )
+        forecaster.model.load_state_dict(state_dict)
+        for attr, value in header["model"].items():
+            setattr(forecaster.model, attr, decoder.decode(value))
+        if map_location is not None:
+            forecaster.model.to(torch.device(map_location))
+    return forecaster
@@ -18,6 +18,8 @@ class ComponentStacker:
         feature_indices (dict): A dictionary containing the start and end indices of different features in the tensor.
         config_seasonality (object, optional): Configuration object that defines the seasonality periods.
         lagged_regressor_config (dict, optional): Configuration dictionary that defines the lagged regressors and their properties.
+        event_slots (dict): Number of slots of each event component stacked in the sparse format, the maximum number
+            of events active at the same time, shared by all time series stacked with this stacker.
     """
 
     n_lags: int
@@ -26,12 +28,13 @@ class ComponentStacker:
     feature_indices: dict = field(default_factory=dict)
     config_seasonality: Optional[Seasonalities] = None
     lagged_regressor_config: Optional[LaggedRegressors] = None
+    event_slots: dict = field(default_factory=dict)
     stack_func: dict = field(init=False)
-    unstack_func: dict = field(init=False)
+    slice_plan: dict = field(init=False, default=None)
 
     def __post_init__(self):
         """
-        Initializes mappings to comonent stacking and unstacking functions.
+        Initializes mappings to component stacking functions.
         """
         self.stack_func = {
             "targets": self.stack_targets,
@@ -44,30 +47,24 @@ class ComponentStacker:
             "additive_regressors": self.stack_additive_regressors,
             "multiplicative_regressors": self.stack_multiplicative_regressors,
         }
-        self.unstack_func = {
-            "targets": self.unstack_targets,
-            "time": self.unstack_time,
-            "seasonalities": self.unstack_seasonalities,
-            "lagged_regressors": self.unstack_lagged_regressors,
-            "lags": self.unstack_lags,
-            "additive_events": self.unstack_additive_events,
-            "multiplicative_events": self.unstack_multiplicative_events,
-            "additive_regressors": self.unstack_additive_regressors,
-            "multiplicative_regressors": self.unstack_multiplicative_regressors,
-        }
 
     def unstack(self, component_name, batch_tensor):
         """
-        Routes the unstackion process to the appropriate function based on the component name.
+        Unstacks a component from the batch tensor, using the precomputed slice plan.
 
         Args:
             component_name (str): The name of the component to unstack.
 
         Returns:
-            Various: The output of the specific unstacking function.
+            torch.Tensor or OrderedDict: View(s) of the batch tensor holding the component features.
         """
-        assert component_name in self.unstack_func, f"Unknown component name: {component_name}"
-        return self.unstack_func[component_name](batch_tensor)
+        assert component_name in self.slice_plan, f"Unknown component name: {component_name}"
+        if component_name in self.event_slots:
+            return self.unstack_events(component_name, batch_tensor)
+        index = self.slice_plan[component_name]
+        if isinstance(index, tuple):
+            return batch_tensor[index]
+        return OrderedDict((name, batch_tensor[part_index]) for name, part_index in index.items())
 
     def stack(self, component_name, df_tensors, feature_list, current_idx, **kwargs):
         """
@@ -109,112 +106,128 @@ class ComponentStacker:
                 **args,
             )
 
+        # Resolve the feature indices once, so that unstacking a batch is a fixed sequence of views
+        self.compile_slice_plan()
+
         # Concatenate all features into one big tensor
         return torch.cat(feature_list, dim=1)  # Concatenating along the second dimension
 
-    def unstack_targets(self, batch_tensor):
-        targets_start_idx, targets_end_idx = self.feature_indices["targets"]
-        if self.max_lags > 0:
-            return batch_tensor[:, self.max_lags : self.max_lags + self.n_forecasts, targets_start_idx].unsqueeze(2)
-        else:
-            return batch_tensor[:, targets_start_idx : targets_end_idx + 1].unsqueeze(1)
+    def compile_slice_plan(self):
+        """
+        Resolves the index ranges of all stacked components into fixed indexing tuples.
 
-    def unstack_time(self, batch_tensor):
-        start_idx, end_idx = self.feature_indices["time"]
+        Each entry of the plan is either a tuple of slices (and integer indices) that extracts a component as a
+        view of the batch tensor, or an OrderedDict of such tuples for components with multiple named parts
+        (seasonalities and lagged regressors). Needs to be called after all features have been stacked.
+        """
+        plan = {}
         if self.max_lags > 0:
-            return batch_tensor[:, self.max_lags - self.n_lags : self.max_lags + self.n_forecasts, start_idx]
+            # Samples are windows of dims (batch, max_lags + n_forecasts, n_features)
+            window = slice(self.max_lags - self.n_lags, self.max_lags + self.n_forecasts)
+            if "targets" in self.feature_indices:
+                start_idx, _ = self.feature_indices["targets"]
+                plan["targets"] = (
+                    slice(None),
+                    slice(self.max_lags, self.max_lags + self.n_forecasts),
+                    slice(start_idx, start_idx + 1),
+                )
+            if "time" in self.feature_indices:
+                start_idx, _ = self.feature_indices["time"]
+                plan["time"] = (slice(None), window, start_idx)
+            if "lags" in self.feature_indices:
+                start_idx, _ = self.feature_indices["lags"]
+                plan["lags"] = (slice(None), slice(self.max_lags - self.n_lags, self.max_lags), start_idx)
         else:
-            return batch_tensor[:, start_idx : end_idx + 1]
+            # Samples are single rows of dims (batch, n_features), the forecast dimension is inserted
+            window = None
+            if "targets" in self.feature_indices:
+                start_idx, end_idx = self.feature_indices["targets"]
+                plan["targets"] = (slice(None), None, slice(start_idx, end_idx + 1))
+            if "time" in self.feature_indices:
+                start_idx, end_idx = self.feature_indices["time"]
+                plan["time"] = (slice(None), slice(start_idx, end_idx + 1))
+
+        for component_name in [
+            "additive_events",
+            "multiplicative_events",
+            "additive_regressors",
+            "multiplicative_regressors",
+        ]:
+            if component_name in self.feature_indices:
+                start_idx, end_idx = self.feature_indices[component_name]
+                if component_name in self.event_slots:
+                    # Sparse events are stacked as the feature indices of the slots, followed by their values
+                    n_slots = self.event_slots[component_name]
+                    plan[component_name] = (
+                        (slice(None), window, slice(start_idx, start_idx + n_slots)),
+                        (slice(None), window, slice(start_idx + n_slots, end_idx + 1)),
+                    )
+                else:
+                    plan[component_name] = (slice(None), window, slice(start_idx, end_idx + 1))
 
-    def unstack_lags(self, batch_tensor):
-        lags_start_idx, _ = self.feature_indices["lags"]
-        return batch_tensor[:, self.max_lags - self.n_lags : self.max_lags, lags_start_idx]
+        seasonalities = OrderedDict()
+        if self.config_seasonality is not None and self.config_seasonality.periods:
+            for seasonality_name in self.config_seasonality.periods.keys():
+                seasonality_key = f"seasonality_{seasonality_name}"
+                if seasonality_key in self.feature_indices:
+                    start_idx, end_idx = self.feature_indices[seasonality_key]
+                    seasonalities[seasonality_name] = (slice(None), window, slice(start_idx, end_idx))
+        plan["seasonalities"] = seasonalities
 
-    def unstack_lagged_regressors(self, batch_tensor):
         lagged_regressors = OrderedDict()
         if self.lagged_regressor_config is not None and self.lagged_regressor_config.regressors is not None:
             for name, lagged_regressor in self.lagged_regressor_config.regressors.items():
                 lagged_regressor_key = f"lagged_regressor_{name}"
                 if lagged_regressor_key in self.feature_indices:
-                    lagged_regressor_start_idx, _ = self.feature_indices[lagged_regressor_key]
-                    covar_lags = lagged_regressor.n_lags
-                    lagged_regressor_offset = self.max_lags - covar_lags
-                    lagged_regressors[name] = batch_tensor[
-                        :,
-                        lagged_regressor_offset : lagged_regressor_offset + covar_lags,
-                        lagged_regressor_start_idx,
-                    ]
-        return lagged_regressors
+                    start_idx, _ = self.feature_indices[lagged_regressor_key]
+                    lagged_regressor_offset = self.max_lags - lagged_regressor.n_lags
+                    lagged_regressors[name] = (
+                        slice(None),
+                        slice(lagged_regressor_offset, self.max_lags),
+                        start_idx,
+                    )
+        plan["lagged_regressors"] = lagged_regressors
 
-    def unstack_seasonalities(self, batch_tensor):
-        seasonalities = OrderedDict()
-        if self.max_lags > 0:
-            for seasonality_name in self.config_seasonality.periods.keys():
-                seasonality_key = f"seasonality_{seasonality_name}"
-                if seasonality_key in self.feature_indices:
-                    seasonality_start_idx, seasonality_end_idx = self.feature_indices[seasonality_key]
-                    seasonalities[seasonality_name] = batch_tensor[
-                        :,
-                        self.max_lags - self.n_lags : self.max_lags + self.n_forecasts,
-                        seasonality_start_idx:seasonality_end_idx,
-                    ]
-        else:
-            for seasonality_name in self.config_seasonality.periods.keys():
-                seasonality_key = f"seasonality_{seasonality_name}"
-                if seasonality_key in self.feature_indices:
-                    seasonality_start_idx, seasonality_end_idx = self.feature_indices[seasonality_key]
-                    seasonalities[seasonality_name] = batch_tensor[
-                        :, seasonality_start_idx:seasonality_end_idx
-                    ].unsqueeze(1)
+        self.slice_plan = plan
 
-        return seasonalities
+    def unstack_targets(self, batch_tensor):
+        return batch_tensor[self.slice_plan["targets"]]
 
-    def unstack_additive_events(self, batch_tensor):
-        if self.max_lags > 0:
-            events_start_idx, events_end_idx = self.feature_indices["additive_events"]
-            future_offset = self.max_lags - self.n_lags
-            return batch_tensor[
-                :, future_offset : future_offset + self.n_forecasts + self.n_lags, events_start_idx : events_end_idx + 1
-            ]
-        else:
-            events_start_idx, events_end_idx = self.feature_indices["additive_events"]
+    def unstack_time(self, batch_tensor):
+        return batch_tensor[self.slice_plan["time"]]
 
-            return batch_tensor[:, events_start_idx : events_end_idx + 1].unsqueeze(1)
+    def unstack_lags(self, batch_tensor):
+        return batch_tensor[self.slice_plan["lags"]]
+
+    def unstack_lagged_regressors(self, batch_tensor):
+        return OrderedDict((name, batch_tensor[index]) for name, index in self.slice_plan["lagged_regressors"].items())
+
+    def unstack_seasonalities(self, batch_tensor):
+        return OrderedDict((name, batch_tensor[index]) for name, index in self.slice_plan["seasonalities"].items())
+
+    def unstack_additive_events(self, batch_tensor):
+        return self.unstack_events("additive_events", batch_tensor)
 
     def unstack_multiplicative_events(self, batch_tensor):
-        if self.max_lags > 0:
-            events_start_idx, events_end_idx = self.feature_indices["multiplicative_events"]
-            return batch_tensor[
-                :, self.max_lags - self.n_lags : self.max_lags + self.n_forecasts, events_start_idx : events_end_idx + 1
-            ]
-        else:
-            events_start_idx, events_end_idx = self.feature_indices["multiplicative_events"]
-            return batch_tensor[:, events_start_idx : events_end_idx + 1].unsqueeze(1)
+        return self.unstack_events("multiplicative_events", batch_tensor)
+
+    def unstack_events(self, component_name, batch_tensor):
+        """
+        Unstacks the event features, either dense of dims (batch, window, n_features), or if stacked in the sparse
+        format, a tuple of the feature indices (long) and the values of the active events, each of dims
+        (batch, window, n_slots).
+        """
+        index = self.slice_plan[component_name]
+        if component_name in self.event_slots:
+            indices_index, values_index = index
+            return batch_tensor[indices_index].long(), batch_tensor[values_index]
+        return batch_tensor[index]
 
     def unstack_additive_regressors(self, batch_tensor):
-        if self.max_lags > 0:
-            regressors_start_idx, regressors_end_idx = self.feature_indices["additive_regressors"]
-            return batch_tensor[
-                :,
-                self.max_lags - self.n_lags : self.max_lags + self.n_forecasts,
-                regressors_start_idx : regressors_end_idx + 1,
-            ]
-        else:
-            regressors_start_idx, regressors_end_idx = self.feature_indices["additive_regressors"]
-            return batch_tensor[:, regressors_start_idx : regressors_end_idx + 1].unsqueeze(1)
+        return batch_tensor[self.slice_plan["additive_regressors"]]
 
     def unstack_multiplicative_regressors(self, batch_tensor):
-        if self.max_lags > 0:
-            regressors_start_idx, regressors_end_idx = self.feature_indices["multiplicative_regressors"]
-            future_offset = self.max_lags - self.n_lags
-            return batch_tensor[
-                :,
-                future_offset : future_offset + self.n_forecasts + self.n_lags,
-                regressors_start_idx : regressors_end_idx + 1,
-            ]
-        else:
-            regressors_start_idx, regressors_end_idx = self.feature_indices["multiplicative_regressors"]
-            return batch_tensor[:, regressors_start_idx : regressors_end_idx + 1].unsqueeze(1)
+        return batch_tensor[self.slice_plan["multiplicative_regressors"]]
 
     def stack_time(self, df_tensors, feature_list, current_idx):
         """
@@ -264,10 +277,12 @@ class ComponentStacker:
             current_idx = current_idx + num_features
         return feature_list, current_idx
 
-    def stack_additive_events(self, df_tensors, feature_list, current_idx, names):
+    def stack_additive_events(self, df_tensors, feature_list, current_idx, names, sparse=False):
         """
         Stack the additive event and holiday features.
         """
+        if names and sparse:
+            return self.stack_sparse_events("additive_events", df_tensors, feature_list, current_idx, names)
         if names:
             additive_events_tensor = torch.cat(
                 [df_tensors[name].unsqueeze(-1) for name in names],
@@ -281,10 +296,12 @@ class ComponentStacker:
             current_idx = current_idx + additive_events_tensor.size(1)
         return feature_list, current_idx
 
-    def stack_multiplicative_events(self, df_tensors, feature_list, current_idx, names):
+    def stack_multiplicative_events(self, df_tensors, feature_list, current_idx, names, sparse=False):
         """
         Stack the multiplicative event and holiday features.
         """
+        if names and sparse:
+            return self.stack_sparse_events("multiplicative_events", df_tensors, feature_list, current_idx, names)
         if names:
             multiplicative_events_tensor = torch.cat([df_tensors[name].unsqueeze(-1) for name in names], dim=1)
             feature_list.append(multiplicative_events_tensor)
@@ -295,6 +312,38 @@ class ComponentStacker:
             current_idx = current_idx + multiplicative_events_tensor.size(1)
         return feature_list, current_idx
 
+    def stack_sparse_events(self, component_name, df_tensors, feature_list, current_idx, names):
+        """
+        Stack event and holiday features in the sparse format.
+
+        Instead of one mostly zero column per event (offset), each row holds the feature indices of the active events
+        in ``n_slots`` columns, followed by their values in another ``n_slots`` columns. Unused slots have index and
+        value zero. The number of slots is the maximum number of events active at the same time, at least one, and
+        is kept in ``event_slots`` so that all time series stacked with this stacker share the same layout.
+        """
+        rows, feature_ids, values = [], [], []
+        for i, name in enumerate(names):
+            active = torch.nonzero(df_tensors[name], as_tuple=True)[0]
+            rows.append(active)
+            feature_ids.append(torch.full_like(active, i))
+            values.append(df_tensors[name][active])
+        rows, feature_ids, values = torch.cat(rows), torch.cat(feature_ids), torch.cat(values)
+        # Order the active events by row, numbering them within each row to assign their slots
+        order = torch.argsort(rows, stable=True)
+        rows, feature_ids, values = rows[order], feature_ids[order], values[order]
+        n_rows = len(df_tensors["t"])
+        counts = torch.bincount(rows, minlength=n_rows)
+        slots = torch.arange(len(rows)) - (torch.cumsum(counts, dim=0) - counts)[rows]
+        n_slots = max(1, int(counts.max()) if len(rows) > 0 else 0, self.event_slots.get(component_name, 1))
+        self.event_slots[component_name] = n_slots
+
+        events_tensor = torch.zeros(n_rows, 2 * n_slots)
+        events_tensor[rows, slots] = feature_ids.float()
+        events_tensor[rows, n_slots + slots] = values
+        feature_list.append(events_tensor)
+        self.feature_indices[component_name] = (current_idx, current_idx + 2 * n_slots - 1)
+        return feature_list, current_idx + 2 * n_slots
+
     def stack_additive_regressors(self, df_tensors, feature_list, current_idx, names):
         """
         Stack the additive regressor features.
@@ -66,6 +66,10 @@ class ProphetLabsSettings(BaseSettings):
     data_dir: Path = Field(default=Path("data"), description="Directory for normalized datasets")
     models_dir: Path = Field(default=Path("models"), description="Directory for trained models")
     outputs_dir: Path = Field(default=Path("outputs"), description="Directory for generated reports and forecasts")
+    model_cache_max_entries: int = Field(32, description="Max number of trained models kept loaded in memory")
+    model_cache_max_bytes: Optional[int] = Field(
+        512 * 1024 * 1024, description="Approximate max bytes of model files kept loaded in memory"
+    )
 
     metrics_enabled: bool = Field(True, description="Expose Prometheus metrics endpoint")
     enable_security: bool = Field(False, description="Require auth dependencies when True")
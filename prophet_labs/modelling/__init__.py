@@ -2,6 +2,7 @@
 
 from prophet_labs.modelling.evaluation import evaluate_dataframe, evaluate_forecast
 from prophet_labs.modelling.forecasting import bulk_forecast, forecast_metric
+from prophet_labs.modelling.model_cache import ModelCache, get_model_cache
 from prophet_labs.modelling.neural_prophet_runner import load_model, make_future, save_model, train_model
 from prophet_labs.modelling.training import bulk_train, load_trained_model, train_and_store
 
@@ -10,6 +11,8 @@ __all__ = [
     "evaluate_forecast",
     "bulk_forecast",
     "forecast_metric",
+    "ModelCache",
+    "get_model_cache",
     "load_model",
     "make_future",
     "save_model",
@@ -2,15 +2,15 @@
 from __future__ import annotations
 
 import datetime as dt
-import hashlib
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import pandas as pd
 
 from prophet_labs.forecast_history.models import ForecastIssued
 from prophet_labs.forecast_history.repository import ForecastHistoryRepository
-from prophet_labs.modelling.neural_prophet_runner import load_model, make_future
+from prophet_labs.modelling.model_cache import get_model_cache
+from prophet_labs.modelling.neural_prophet_runner import make_future
 from prophet_labs.storage.models import MetricForecast
 from prophet_labs.storage.repository import Repository
 from prophet_labs.utils.logging_config import get_logger
@@ -19,12 +19,22 @@ LOGGER = get_logger("prophet_labs.forecast")
 
 
 def forecast_metric(metric_id: str, history: pd.DataFrame, model_dir: Path, periods: int = 12) -> pd.DataFrame:
+    forecast, _ = _forecast_metric(metric_id, history, model_dir, periods=periods)
+    return forecast
+
+
+def _forecast_metric(
+    metric_id: str, history: pd.DataFrame, model_dir: Path, periods: int = 12
+) -> Tuple[pd.DataFrame, str]:
+    """Forecast a metric, also returning the version of the model used."""
+
     model_path = model_dir.joinpath(f"{metric_id}_model.np")
-    model = load_model(model_path)
-    forecast = make_future(model, periods=periods, df=history)
+    entry = get_model_cache().get(metric_id, model_path)
+    with entry.use() as model:
+        forecast = make_future(model, periods=periods, df=history)
     forecast["metric_id"] = metric_id
     LOGGER.info("Forecast generated", extra_fields={"metric_id": metric_id, "rows": len(forecast)})
-    return forecast
+    return forecast, entry.version
 
 
 def bulk_forecast(histories: Dict[str, pd.DataFrame], model_dir: Path, periods: int = 12) -> Dict[str, pd.DataFrame]:
@@ -50,7 +60,9 @@ def forecast_all_metrics(repository: Repository, periods: int = 12) -> None:
             "y": [o.value for o in observations],
         })
         try:
-            forecast_df = forecast_metric(definition.metric_id, history, model_dir=repository.settings.models_path, periods=periods)
+            forecast_df, model_version = _forecast_metric(
+                definition.metric_id, history, model_dir=repository.settings.models_path, periods=periods
+            )
             forecasts = [
                 MetricForecast(
                     metric_id=definition.metric_id,
@@ -64,7 +76,6 @@ def forecast_all_metrics(repository: Repository, periods: int = 12) -> None:
             repository.store_forecasts(definition.metric_id, forecasts)
 
             issued_at = dt.datetime.utcnow()
-            model_version = _hash_file(repository.settings.models_path.joinpath(f"{definition.metric_id}_model.np"))
             last_actual = history["ds"].max()
             future_rows = forecast_df[forecast_df["ds"] > last_actual].reset_index(drop=True)
             issued_records: List[ForecastIssued] = []
@@ -89,14 +100,4 @@ def forecast_all_metrics(repository: Repository, periods: int = 12) -> None:
             LOGGER.exception("Forecasting failed", extra_fields={"metric_id": definition.metric_id})
 
 
-def _hash_file(path: Path) -> str:
-    if not path.exists():
-        return "unknown"
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 __all__ = ["forecast_metric", "bulk_forecast", "forecast_all_metrics"]
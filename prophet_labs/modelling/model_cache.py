@@ -0,0 +1,157 @@
+"""In-process LRU cache of trained models for Prophet Labs.
+
+Models are keyed by metric id and validated against the modification time and
+size of the model file, so a model rewritten on disk (e.g. by another process)
+is reloaded on the next access. The cache is bounded both by the number of
+models and by their approximate size in bytes, and is shared by all callers in
+a process through ``get_model_cache``.
+
+A cached model is shared by all threads of the process. Predicting mutates the
+state of a NeuralProphet model, so callers must hold the ``lock`` of the entry
+while using its model, e.g. through ``CachedModel.use``.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from neuralprophet import NeuralProphet, load
+from prometheus_client import Counter, Gauge
+
+from prophet_labs.config.settings import get_settings
+from prophet_labs.utils.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+MODEL_CACHE_REQUESTS = Counter("prophet_labs_model_cache_requests_total", "Model cache lookups", ["result"])
+MODEL_CACHE_EVICTIONS = Counter("prophet_labs_model_cache_evictions_total", "Models evicted from the model cache")
+MODEL_CACHE_ENTRIES = Gauge("prophet_labs_model_cache_entries", "Models held in the model cache")
+MODEL_CACHE_BYTES = Gauge("prophet_labs_model_cache_bytes", "Approximate size of the models held in the model cache")
+
+
+@dataclass
+class CachedModel:
+    model: NeuralProphet
+    version: str
+    mtime_ns: int
+    size: int
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @contextmanager
+    def use(self) -> Iterator[NeuralProphet]:
+        """Hold the model exclusively, as predicting mutates its state."""
+
+        with self.lock:
+            yield self.model
+
+
+def _load_from_bytes(data: bytes) -> NeuralProphet:
+    return load(io.BytesIO(data))
+
+
+class ModelCache:
+    """Bounded LRU cache of loaded models, keyed by metric id and file mtime/size."""
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        max_bytes: Optional[int] = None,
+        loader: Callable[[bytes], NeuralProphet] = _load_from_bytes,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._loader = loader
+        self._entries: OrderedDict[str, CachedModel] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, metric_id: str, path: Path) -> CachedModel:
+        """Return the model stored at ``path``, loading it when not cached or changed on disk."""
+
+        if not path.exists():
+            raise FileNotFoundError(f"Model not found for metric {metric_id}")
+        stat = path.stat()
+        with self._lock:
+            entry = self._entries.get(metric_id)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self._entries.move_to_end(metric_id)
+                MODEL_CACHE_REQUESTS.labels(result="hit").inc()
+                return entry
+        MODEL_CACHE_REQUESTS.labels(result="miss").inc()
+
+        # The file is read once, both for loading the model and for its version hash
+        data = path.read_bytes()
+        entry = CachedModel(
+            model=self._loader(data),
+            version=hashlib.sha256(data).hexdigest(),
+            mtime_ns=stat.st_mtime_ns,
+            size=len(data),
+        )
+        with self._lock:
+            self._remove(metric_id)
+            self._entries[metric_id] = entry
+            self._bytes += entry.size
+            self._evict()
+            self._update_gauges()
+        LOGGER.info("Loaded model into cache", extra={"metric_id": metric_id, "path": str(path)})
+        return entry
+
+    def invalidate(self, metric_id: str) -> None:
+        """Drop the cached model of a metric, e.g. after a new model was trained."""
+
+        with self._lock:
+            self._remove(metric_id)
+            self._update_gauges()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._update_gauges()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, metric_id: str) -> bool:
+        return metric_id in self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def _remove(self, metric_id: str) -> None:
+        entry = self._entries.pop(metric_id, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        # The most recently used model is always kept, even if it alone exceeds the byte budget
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            metric_id, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            MODEL_CACHE_EVICTIONS.inc()
+            LOGGER.info("Evicted model from cache", extra={"metric_id": metric_id})
+
+    def _update_gauges(self) -> None:
+        MODEL_CACHE_ENTRIES.set(len(self._entries))
+        MODEL_CACHE_BYTES.set(self._bytes)
+
+
+@lru_cache(maxsize=1)
+def get_model_cache() -> ModelCache:
+    """Process-wide model cache, sized by the Prophet Labs settings."""
+
+    settings = get_settings()
+    return ModelCache(max_entries=settings.model_cache_max_entries, max_bytes=settings.model_cache_max_bytes)
+
+
+__all__ = ["CachedModel", "ModelCache", "get_model_cache"]
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Dict, Tuple
 
 import pandas as pd
-from neuralprophet import NeuralProphet
+from neuralprophet import NeuralProphet, load, save
 
 from prophet_labs.utils.logging import get_logger
 
@@ -22,13 +22,13 @@ def train_model(df: pd.DataFrame, config: Dict[str, object] | None = None) -> Tu
 
 def save_model(model: NeuralProphet, path: Path) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    model.save(str(path))
+    save(model, str(path))
     LOGGER.info("Saved model", extra={"path": str(path)})
     return path
 
 
 def load_model(path: Path) -> NeuralProphet:
-    model = NeuralProphet.load(str(path))
+    model = load(str(path))
     LOGGER.info("Loaded model", extra={"path": str(path)})
     return model
 
@@ -6,6 +6,7 @@ from typing import Dict
 
 import pandas as pd
 
+from prophet_labs.modelling.model_cache import get_model_cache
 from prophet_labs.modelling.neural_prophet_runner import load_model, save_model, train_model
 from prophet_labs.storage.repository import Repository
 from prophet_labs.utils.logging import get_logger
@@ -17,6 +18,7 @@ def train_and_store(metric_id: str, df: pd.DataFrame, model_dir: Path, config: D
     model, metrics = train_model(df, config=config)
     target_path = model_dir.joinpath(f"{metric_id}_model.np")
     save_model(model, target_path)
+    get_model_cache().invalidate(metric_id)
     LOGGER.info("Training complete", extra={"metric_id": metric_id, "path": str(target_path), "metrics": metrics})
     return target_path
 
@@ -1,6 +1,6 @@
-"""Storage abstractions for Prophet Labs."""
+"""Storage abstractions for Prophet Labs.
 
-from prophet_labs.storage.models import NormalizedRecord
-from prophet_labs.storage.repository import DataRepository
-
-__all__ = ["NormalizedRecord", "DataRepository"]
+The ORM models live in ``prophet_labs.storage.models`` and the repository in
+``prophet_labs.storage.repository``. They are not imported here, as the
+forecast history models and the repository import each other's modules.
+"""
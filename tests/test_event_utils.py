@@ -151,3 +151,42 @@ def test_events():
         m.plot(forecast)
         m.plot_parameters()
         plt.show()
+
+
+def test_sparse_events():
+    log.info("testing: Sparse events")
+    df = pd.read_csv(PEYTON_FILE)[-NROWS:]
+    # only the second time series has (overlapping) events, needing more slots than the first one
+    df_a = df.iloc[: NROWS // 2].assign(ID="a")
+    df_b = df.iloc[NROWS // 2 :].assign(ID="b")
+    events_df = pd.DataFrame({"event": "launch", "ds": df_b["ds"].iloc[[20, 21, 60]].values})
+    events_df["ds"] = pd.to_datetime(events_df["ds"])
+
+    def fit(sparse_events):
+        m = NeuralProphet(
+            n_lags=3,
+            n_forecasts=2,
+            epochs=EPOCHS,
+            batch_size=BATCH_SIZE,
+            learning_rate=LR,
+            sparse_events=sparse_events,
+        )
+        m = m.add_events("launch", lower_window=-2, upper_window=2)
+        m = m.add_country_holidays(["US", "DE"], lower_window=-1, upper_window=1, mode="multiplicative")
+        history_df = m.create_df_with_events(pd.concat((df_a, df_b)), events_df)
+        m.fit(history_df, freq="D")
+        return m, history_df
+
+    m, history_df = fit(sparse_events=False)
+    forecast = m.predict(history_df)
+    # the forecasts of the sparse format match those of the dense format
+    m.config_model.sparse_events = True
+    forecast_sparse = m.predict(history_df)
+    pd.testing.assert_frame_equal(forecast, forecast_sparse, check_exact=False, atol=1e-5)
+
+    m_sparse, _ = fit(sparse_events=True)
+    stacker = m_sparse.model.components_stacker["train"]
+    assert stacker.event_slots["additive_events"] == 2
+    start_idx, end_idx = stacker.feature_indices["additive_events"]
+    assert end_idx - start_idx + 1 == 2 * 2
+    assert not m_sparse.predict(history_df)["yhat1"].isna().all()
@@ -4,6 +4,7 @@ import logging
 import os
 import pathlib
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -414,3 +415,72 @@ def test_trend_local_reg_if_global():
         log.debug(
             f"forecast = {forecast}, metrics= {metrics}, forecast_trend = {forecast_trend}, forecast_seasonal_componets= {forecast_seasonal_componets}"
         )
+
+
+def test_evaluate_per_series():
+    # denormalized metrics per time series and step must match the errors of the predictions
+    log.info("Evaluate per time series with local normalization")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df1 = df.copy(deep=True)
+    df1["ID"] = "df1"
+    df2 = df.copy(deep=True)
+    df2["ID"] = "df2"
+    df2["y"] = 3 * df2["y"] + 5
+    df_global = pd.concat((df1, df2))
+    m = NeuralProphet(
+        n_forecasts=3,
+        n_lags=7,
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE,
+        learning_rate=LR,
+        quantiles=[0.1, 0.9],
+        trend_global_local="local",
+        global_normalization=False,
+    )
+    m.fit(df_global, freq="D")
+    metrics = m.evaluate(df_global, batch_size=50)
+    assert list(metrics.columns) == ["ID", "step", "n", "MAE", "RMSE", "MAPE", "Pinball"]
+    assert list(zip(metrics["ID"], metrics["step"])) == [(ID, step) for ID in ["df1", "df2"] for step in [1, 2, 3]]
+    forecast = m.predict(df_global)
+    for _, row in metrics.iterrows():
+        fcst = forecast[forecast["ID"] == row["ID"]]
+        errors = (fcst["y"] - fcst[f"yhat{row['step']}"]).dropna()
+        assert row["n"] == len(errors)
+        assert np.isclose(row["MAE"], errors.abs().mean(), rtol=1e-4)
+        assert np.isclose(row["RMSE"], np.sqrt((errors**2).mean()), rtol=1e-4)
+
+
+def test_make_future_dataframe_panel():
+    log.info("Future dataframe of many time series with future regressors and events")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df["A"] = df["y"].rolling(7, min_periods=1).mean()
+    df_global = pd.concat([df.iloc[: NROWS - 5 * i].assign(ID=f"df{i}", y=df["y"] + i) for i in range(3)])
+    events_df = pd.DataFrame({"event": ["playoff"] * 2, "ds": pd.to_datetime(["2008-09-08", "2008-09-19"])})
+    m = NeuralProphet(n_lags=3, n_forecasts=2, epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR)
+    m.add_future_regressor("A")
+    m.add_events("playoff")
+    history_df = m.create_df_with_events(df_global, events_df)
+    m.fit(history_df, freq="D")
+    regressors_df = pd.DataFrame({"ds": pd.date_range("2008-09-18", periods=2), "A": [1.0, 2.0]})
+    future = m.make_future_dataframe(
+        history_df, events_df=events_df, regressors_df=regressors_df, n_historic_predictions=4
+    )
+    # identical to extending each time series on its own
+    expected = pd.concat(
+        [
+            m.make_future_dataframe(
+                history_df[history_df["ID"] == df_name],
+                events_df=events_df,
+                regressors_df=regressors_df,
+                n_historic_predictions=4,
+            )
+            for df_name in ["df0", "df1", "df2"]
+        ],
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(future, expected)
+    assert len(future) == 3 * (3 + 4 + 2)
+    assert future.groupby("ID")["A"].last().tolist() == [2.0, 2.0, 2.0]
+    assert future.loc[future["y"].isnull(), "playoff"].tolist() == [0, 1, 0, 0, 1, 0]
+    with pytest.raises(ValueError):
+        m.make_future_dataframe(history_df, regressors_df=regressors_df.assign(ID="df3"))
@@ -1704,4 +1704,107 @@ def test_fit_twice_error():
         _ = m.fit(df, freq="D")
 
 
+def test_update():
+    log.info("testing: Update a fitted model with new data")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS + 3)
+    df1 = df.copy(deep=True)
+    df1["ID"] = "df1"
+    df2 = df.copy(deep=True)
+    df2["ID"] = "df2"
+    df_global = pd.concat((df1, df2))
+    m = NeuralProphet(n_lags=7, n_forecasts=3, epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR)
+    with pytest.raises(RuntimeError):
+        m.update(df_global)
+    m.fit(df_global.groupby("ID").head(NROWS), freq="D")
+    train_end_ds = m.train_end_ds["df1"]
+    data_params = m.config_normalization.get_data_params("df1")["y"]
+    shift, scale = data_params.shift, data_params.scale
+    weights = [param.detach().clone() for param in m.model.parameters()]
+    # without new data, the model is not changed
+    assert m.update(df_global.groupby("ID").head(NROWS)) is None
+    m.update(df_global.groupby("ID").head(NROWS + 1), epochs=2, replay=5)
+    assert m.train_end_ds["df1"] == train_end_ds + pd.Timedelta(days=1)
+    # replay samples are limited to the history of each time series
+    m.update(df_global, epochs=1, replay=10 * NROWS)
+    assert m.train_end_ds["df1"] == train_end_ds + pd.Timedelta(days=3)
+    data_params = m.config_normalization.get_data_params("df1")["y"]
+    assert (data_params.shift, data_params.scale) == (shift, scale)
+    assert any(not torch.equal(w, param) for w, param in zip(weights, m.model.parameters()))
+    future = m.make_future_dataframe(df_global)
+    forecast = m.predict(future)
+    assert forecast["yhat3"].notna().sum() == 2
+    with pytest.raises(ValueError):
+        m.update(df.assign(ID="df3"))
+
+
+def test_streaming_session():
+    log.info("testing: Streaming forecasts of an AR model")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS + 5)
+    df["A"] = df["y"].rolling(7, min_periods=1).mean()
+    df1 = df.copy(deep=True)
+    df1["ID"] = "df1"
+    df2 = df.copy(deep=True)
+    df2["ID"] = "df2"
+    df2["y"] = 2 * df2["y"] + 1
+    df_global = pd.concat((df1, df2))
+    m = NeuralProphet(
+        n_lags=7,
+        n_forecasts=3,
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE,
+        learning_rate=LR,
+        trend_global_local="local",
+        global_normalization=False,
+    )
+    m.add_lagged_regressor("A", n_lags=3)
+    m.fit(df_global.groupby("ID").head(NROWS), freq="D")
+    session = m.streaming_session(df_global.groupby("ID").head(NROWS))
+    # observations are added one at a time for df1 and as a micro-batch for df2
+    for _, row in df1.iloc[NROWS:].iterrows():
+        session.update(row["ds"], row["y"], df_name="df1", lagged_regressors={"A": row["A"]})
+    session.update(
+        df2["ds"].iloc[NROWS:], df2["y"].iloc[NROWS:], df_name="df2", lagged_regressors={"A": df2["A"].iloc[NROWS:]}
+    )
+    forecast = m.predict(m.make_future_dataframe(df_global), decompose=False)
+    for df_name in ["df1", "df2"]:
+        ds, yhat = session.forecast(df_name)
+        fcst = forecast[forecast["ID"] == df_name].iloc[-3:]
+        assert (pd.to_datetime(ds) == pd.to_datetime(fcst["ds"]).values).all()
+        expected = [fcst[f"yhat{step}"].iloc[step - 1] for step in range(1, 4)]
+        np.testing.assert_allclose(yhat[:, 0], expected, rtol=1e-5)
+    # forecasting keeps the training mode and the predict plan of the model
+    m.model.train()
+    predict_plan = m.model.unstack_plans["predict"]
+    session.forecast("df1")
+    assert m.model.training
+    assert m.model.unstack_plans["predict"] is predict_plan
+    with pytest.raises(ValueError):
+        session.update(df1["ds"].iloc[0], 1.0, df_name="df1", lagged_regressors={"A": 1.0})
+    # skipped timestamps, after the last observation and within a micro-batch
+    last = pd.Timestamp(df1["ds"].iloc[-1])
+    with pytest.raises(ValueError):
+        session.update(last + pd.Timedelta(days=2), 1.0, df_name="df1", lagged_regressors={"A": 1.0})
+    with pytest.raises(ValueError):
+        session.update(
+            [last + pd.Timedelta(days=1), last + pd.Timedelta(days=3)],
+            [1.0, 1.0],
+            df_name="df1",
+            lagged_regressors={"A": [1.0, 1.0]},
+        )
+    with pytest.raises(ValueError):
+        session.forecast("df3")
+
+
+def test_streaming_session_bf16():
+    log.info("testing: Streaming forecasts of an AR model with bf16 precision")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(n_lags=7, n_forecasts=3, epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR, precision="bf16")
+    m.fit(df, freq="D")
+    session = m.streaming_session(df)
+    forecast = m.predict(m.make_future_dataframe(df), decompose=False).iloc[-3:]
+    _, yhat = session.forecast()
+    expected = [forecast[f"yhat{step}"].iloc[step - 1] for step in range(1, 4)]
+    np.testing.assert_allclose(yhat[:, 0], expected, rtol=1e-2)
+
+
 test_global_modeling_no_exogenous_variable()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+from prometheus_client import REGISTRY
+
+from prophet_labs.modelling import training
+from prophet_labs.modelling.model_cache import ModelCache
+
+log = logging.getLogger("NP.test")
+log.setLevel("ERROR")
+log.parent.setLevel("ERROR")
+
+
+class _Model:
+    """Stands in for a loaded model, holding the bytes it was loaded from."""
+
+    def __init__(self, data):
+        self.data = data
+
+
+def _write(path, data, mtime_ns=None):
+    path.write_bytes(data)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def _requests(result):
+    return REGISTRY.get_sample_value("prophet_labs_model_cache_requests_total", {"result": result}) or 0.0
+
+
+def _evictions():
+    return REGISTRY.get_sample_value("prophet_labs_model_cache_evictions_total") or 0.0
+
+
+def test_model_cache_hit_and_reload(tmp_path):
+    cache = ModelCache(max_entries=2, loader=_Model)
+    path = _write(tmp_path / "a_model.np", b"first", mtime_ns=1_000_000_000)
+    hits, misses = _requests("hit"), _requests("miss")
+
+    entry = cache.get("a", path)
+    assert entry.model.data == b"first"
+    assert cache.get("a", path) is entry
+    assert _requests("hit") == hits + 1
+    assert _requests("miss") == misses + 1
+
+    # a model rewritten on disk is reloaded, with a new version
+    _write(path, b"second", mtime_ns=2_000_000_000)
+    reloaded = cache.get("a", path)
+    assert reloaded is not entry
+    assert reloaded.model.data == b"second"
+    assert reloaded.version != entry.version
+    assert _requests("miss") == misses + 2
+    assert cache.size_bytes == len(b"second")
+
+    with pytest.raises(FileNotFoundError):
+        cache.get("b", tmp_path / "b_model.np")
+
+
+def test_model_cache_lru_eviction(tmp_path):
+    cache = ModelCache(max_entries=2, loader=_Model)
+    paths = {name: _write(tmp_path / f"{name}_model.np", name.encode()) for name in ["a", "b", "c"]}
+    evictions = _evictions()
+
+    cache.get("a", paths["a"])
+    cache.get("b", paths["b"])
+    # using "a" makes "b" the least recently used model
+    cache.get("a", paths["a"])
+    cache.get("c", paths["c"])
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert len(cache) == 2
+    assert _evictions() == evictions + 1
+    assert REGISTRY.get_sample_value("prophet_labs_model_cache_entries") == 2
+
+
+def test_model_cache_byte_bound(tmp_path):
+    cache = ModelCache(max_entries=10, max_bytes=10, loader=_Model)
+    cache.get("a", _write(tmp_path / "a_model.np", b"x" * 4))
+    cache.get("b", _write(tmp_path / "b_model.np", b"x" * 4))
+    assert cache.size_bytes == 8
+    cache.get("c", _write(tmp_path / "c_model.np", b"x" * 4))
+    assert "a" not in cache
+    assert cache.size_bytes == 8
+    assert REGISTRY.get_sample_value("prophet_labs_model_cache_bytes") == 8
+
+    # the most recently used model is kept even if it alone exceeds the budget
+    cache.get("d", _write(tmp_path / "d_model.np", b"x" * 20))
+    assert len(cache) == 1 and "d" in cache
+    assert cache.size_bytes == 20
+
+
+def test_model_cache_invalidated_by_training(tmp_path, monkeypatch):
+    cache = ModelCache(loader=_Model)
+    path = _write(tmp_path / "a_model.np", b"old")
+    cache.get("a", path)
+
+    def save_model(model, target_path):
+        target_path.write_bytes(model.data)
+        return target_path
+
+    monkeypatch.setattr(training, "get_model_cache", lambda: cache)
+    monkeypatch.setattr(training, "train_model", lambda df, config=None: (_Model(b"new"), pd.DataFrame()))
+    monkeypatch.setattr(training, "save_model", save_model)
+    training.train_and_store("a", pd.DataFrame({"ds": [], "y": []}), tmp_path)
+    assert "a" not in cache
+    assert cache.size_bytes == 0
+    assert cache.get("a", path).model.data == b"new"
+
+
+def test_model_cache_serializes_model_use(tmp_path):
+    cache = ModelCache(loader=_Model)
+    path = _write(tmp_path / "a_model.np", b"model")
+    cache.get("a", path)
+    active = []
+    overlaps = []
+
+    def predict():
+        with cache.get("a", path).use() as model:
+            overlaps.append(any(other is model for other in active))
+            active.append(model)
+            time.sleep(0.01)
+            active.remove(model)
+
+    threads = [threading.Thread(target=predict) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(overlaps) == 8
+    assert not any(overlaps)
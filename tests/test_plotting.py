@@ -5,10 +5,11 @@ import os
 import pathlib
 
 import matplotlib
+import numpy as np
 import pandas as pd
 import pytest
 
-from neuralprophet import NeuralProphet
+from neuralprophet import NeuralProphet, export_figures, plot_utils
 
 log = logging.getLogger("NP.test")
 log.setLevel("ERROR")
@@ -803,6 +804,146 @@ def test_plot_latest_forecast(plotting_backend):
     matplotlib.pyplot.close("all")
 
 
+@pytest.mark.parametrize(*decorator_input)
+def test_plot_downsampled(plotting_backend):
+    log.info(f"testing: Plotting of downsampled forecasts with {plotting_backend}")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR, quantiles=[0.05, 0.95])
+    m.fit(df, freq="D")
+    forecast = m.predict(df)
+
+    for method in ["lttb", "minmax"]:
+        downsampled = plot_utils.downsample_fcst(forecast, max_points=50, method=method)
+        assert len(downsampled) < len(forecast)
+        assert downsampled["ds"].iloc[0] == forecast["ds"].iloc[0]
+        assert downsampled["ds"].iloc[-1] == forecast["ds"].iloc[-1]
+        if method == "minmax":
+            assert downsampled["y"].max() == forecast["y"].max()
+    with pytest.raises(ValueError):
+        plot_utils.downsample_fcst(forecast, max_points=50, method="mean")
+
+    # only the drawn columns are decimated, each adding at most max_points rows
+    columns = plot_utils.get_forecast_plot_columns(m.config_model.quantiles, m.config_model.n_forecasts)
+    assert columns == ["y", "yhat1", "yhat1 5.0%", "yhat1 95.0%"]
+    for method in ["lttb", "minmax"]:
+        for max_points in [4, 5, 50]:
+            downsampled = plot_utils.downsample_fcst(forecast, max_points=max_points, method=method, columns=columns)
+            assert len(downsampled) <= len(columns) * max_points
+            downsampled = plot_utils.downsample_fcst(forecast, max_points=max_points, method=method, columns=["y"])
+            assert len(downsampled) <= max_points
+
+    fig1 = m.plot(forecast, max_points=50, plotting_backend=plotting_backend)
+    fig2 = m.plot_components(forecast, max_points=50, downsample_method="minmax", plotting_backend=plotting_backend)
+
+    if PLOT:
+        fig1.show()
+        fig2.show()
+    matplotlib.pyplot.close("all")
+
+
+@pytest.mark.parametrize(*decorator_input)
+def test_component_curves_cache(plotting_backend):
+    log.info(f"testing: Cached component curves of plot_parameters with {plotting_backend}")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df = pd.concat((df.assign(ID="df1"), df.assign(ID="df2", y=df["y"] + 1.0)), ignore_index=True)
+    m = NeuralProphet(
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE,
+        learning_rate=LR,
+        trend_global_local="local",
+        quantiles=[0.1, 0.9],
+    )
+    m.fit(df.groupby("ID").head(NROWS - 16), freq="D")
+
+    curves = m.predict_component_curves()
+    assert set(curves) == {"trend", "weekly"}
+    assert set(curves["trend"]["ID"]) == {"df1", "df2"}
+    assert set(curves["weekly"]["quantile"]) == {0.5, 0.1, 0.9}
+    for df_name in ["df1", "df2"]:
+        dates = plot_utils.get_trend_dates(m, df_name)
+        trend = m.predict_trend(pd.DataFrame({"ds": dates, "ID": df_name}), quantile=0.9)
+        cached = curves["trend"].query("ID == @df_name and quantile == 0.9")
+        np.testing.assert_allclose(cached["trend"].to_numpy(), trend["trend"].to_numpy())
+
+    n_cached = len(m.component_curves)
+    fig1 = m.plot_parameters(quantile=0.9, plotting_backend=plotting_backend)
+    fig2 = m.plot_parameters(df_name="df1", plotting_backend=plotting_backend)
+    assert len(m.component_curves) == n_cached
+
+    m.update(df, epochs=EPOCHS)
+    assert len(m.component_curves) == 0
+
+    if PLOT:
+        fig1.show()
+        fig2.show()
+    matplotlib.pyplot.close("all")
+
+
+def test_component_curves_cache_frequency():
+    log.info("testing: Cached seasonal curves of date ranges with the same start and length")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR)
+    m.fit(df, freq="D")
+    daily = pd.date_range(start="2017-01-01", periods=7 * 24, freq="D")
+    hourly = pd.date_range(start="2017-01-01", periods=7 * 24, freq="H")
+    plot_utils.predict_season_from_dates(m, daily, "weekly", quantile=0.5)
+    cached = plot_utils.predict_season_from_dates(m, hourly, "weekly", quantile=0.5)
+    m.component_curves = {}
+    predicted = plot_utils.predict_season_from_dates(m, hourly, "weekly", quantile=0.5)
+    np.testing.assert_allclose(cached["weekly"], predicted["weekly"])
+
+
+@pytest.mark.parametrize(*decorator_input)
+def test_export_figures(plotting_backend, tmp_path):
+    log.info(f"testing: Batch export of figures with {plotting_backend}")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m1 = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR)
+    m1.fit(df, freq="D")
+    df_global = pd.concat((df.assign(ID="df1"), df.assign(ID="df2")), ignore_index=True)
+    m2 = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR)
+    m2.fit(df_global, freq="D")
+    jobs = [(m1, m1.predict(df)), (m2, m2.predict(df_global))]
+    file_format = "png" if plotting_backend == "matplotlib" else "html"
+
+    files, throughput = export_figures(
+        jobs,
+        str(tmp_path),
+        names=["single", "global"],
+        plots=["forecast", "components"],
+        plotting_backend=plotting_backend,
+        file_format=file_format,
+        num_workers=0,
+    )
+    assert list(files["path"].map(os.path.basename)) == [
+        f"single_forecast.{file_format}",
+        f"single_components.{file_format}",
+        f"global_df1_forecast.{file_format}",
+        f"global_df1_components.{file_format}",
+        f"global_df2_forecast.{file_format}",
+        f"global_df2_components.{file_format}",
+    ]
+    assert all(os.path.getsize(path) > 0 for path in files["path"])
+    assert throughput["figures"] == 6
+    assert throughput["bytes"] == files["bytes"].sum()
+    assert len(matplotlib.pyplot.get_fignums()) == 0
+
+    # rendered in worker processes
+    files_parallel, throughput = export_figures(
+        jobs,
+        str(tmp_path),
+        names=["single", "global"],
+        plots=["parameters"],
+        plotting_backend=plotting_backend,
+        file_format=file_format,
+        num_workers=2,
+    )
+    assert len(files_parallel) == 3
+    assert throughput["workers"] == 2
+
+    with pytest.raises(ValueError):
+        export_figures(jobs, str(tmp_path), plots=["forecast"], plotting_backend=plotting_backend, file_format="gif")
+
+
 def test_plotting_backend_options():
     log.info("testing: Plotting backend options")
     df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
@@ -5,9 +5,12 @@ import logging
 import os
 import pathlib
 
+import numpy as np
 import pandas as pd
+import pytest
+import torch
 
-from neuralprophet import NeuralProphet, load, save
+from neuralprophet import NeuralProphet, convert, load, save, utils_serialization
 
 log = logging.getLogger("NP.test")
 log.setLevel("ERROR")
@@ -54,6 +57,11 @@ def test_save_load():
     pd.testing.assert_frame_equal(forecast, forecast2)
     pd.testing.assert_frame_equal(forecast, forecast3)
 
+    # Predicting does not require a trainer, it is restored when first needed
+    assert m2.trainer is None
+    m2.test(df)
+    assert m2.trainer is not None
+
 
 def test_save_load_io():
     df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
@@ -88,6 +96,159 @@ def test_save_load_io():
     pd.testing.assert_frame_equal(forecast, forecast3)
 
 
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires a CUDA device")
+def test_load_predict_on_cuda():
+    # predicting without a trainer moves the outputs of the model back to the CPU
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR, n_lags=6, n_forecasts=3)
+    m.fit(df, freq="D")
+    forecast = m.predict(df)
+    buffer = io.BytesIO()
+    save(m, buffer)
+    buffer.seek(0)
+    m2 = load(buffer, map_location="cuda")
+    assert m2.trainer is None
+    forecast2 = m2.predict(df)
+    assert np.allclose(forecast["yhat3"], forecast2["yhat3"], atol=1e-5, equal_nan=True)
+
+
+def test_save_load_state_format():
+    # global model with local components, quantiles, events and all kinds of regressors
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df["A"] = df["y"].rolling(7, min_periods=1).mean()
+    df["B"] = df["y"].rolling(30, min_periods=1).mean()
+    df1 = df.iloc[:256].assign(ID="df1")
+    df2 = df.iloc[256:].assign(ID="df2")
+    df_global = pd.concat((df1, df2))
+    events = pd.DataFrame({"event": "event", "ds": pd.to_datetime(["2008-03-01", "2008-06-01", "2008-09-01"])})
+    m = NeuralProphet(
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE,
+        learning_rate=LR,
+        n_lags=6,
+        n_forecasts=3,
+        quantiles=[0.1, 0.9],
+        trend_global_local="local",
+        season_global_local="local",
+    )
+    m.add_lagged_regressor("A", n_lags=3)
+    m.add_future_regressor("B")
+    m.add_events("event")
+    m.add_country_holidays("US")
+    df_global = m.create_df_with_events(df_global, events)
+    m.fit(df_global, freq="D")
+    forecast = m.predict(df_global)
+
+    buffer = io.BytesIO()
+    save(m, buffer)
+    buffer.seek(0)
+    assert utils_serialization.is_state_file(buffer)
+    m2 = load(buffer)
+    pd.testing.assert_frame_equal(forecast, m2.predict(df_global))
+    assert m2.id_list == m.id_list
+    assert m2.config_normalization.local_data_params.keys() == m.config_normalization.local_data_params.keys()
+
+    # whole-object pickles can still be loaded, and converted to the state format
+    buffer_torch = io.BytesIO()
+    save(m, buffer_torch, format="torch")
+    buffer_torch.seek(0)
+    assert not utils_serialization.is_state_file(buffer_torch)
+    pd.testing.assert_frame_equal(forecast, load(buffer_torch).predict(df_global))
+    buffer_torch.seek(0)
+    buffer_converted = io.BytesIO()
+    convert(buffer_torch, buffer_converted)
+    buffer_converted.seek(0)
+    assert utils_serialization.is_state_file(buffer_converted)
+    pd.testing.assert_frame_equal(forecast, load(buffer_converted).predict(df_global))
+    assert len(buffer.getvalue()) < len(buffer_torch.getvalue())
+
+
+def test_load_pickle_without_compile_attributes():
+    # whole-object pickles of earlier versions have neither the compile flag nor the compiled forward pass
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR, n_lags=6, n_forecasts=3)
+    m.fit(df, freq="D")
+    forecast = m.predict(df)
+    del m.model.use_compile
+    buffer = io.BytesIO()
+    save(m, buffer, format="torch")
+    buffer.seek(0)
+    m2 = load(buffer)
+    assert m2.model.use_compile is False
+    assert m2.model.compiled_forward is None
+    pd.testing.assert_frame_equal(forecast, m2.predict(df))
+
+
+def test_load_pickle_without_quantile_crossing_buffers():
+    # whole-object pickles of earlier versions have no buffers for the quantile crossing correction
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR, quantiles=[0.05, 0.25, 0.75, 0.95])
+    m.fit(df, freq="D")
+    forecast = m.predict(df)
+    names = ["quantile_crossing_index", "quantile_crossing_inverse", "quantile_signs"]
+    buffers = {name: getattr(m.model, name) for name in names}
+    for name in buffers:
+        delattr(m.model, name)
+    buffer = io.BytesIO()
+    save(m, buffer, format="torch")
+    buffer.seek(0)
+    m2 = load(buffer)
+    for name, value in buffers.items():
+        assert torch.equal(getattr(m2.model, name), value)
+    pd.testing.assert_frame_equal(forecast, m2.predict(df))
+
+
+def test_convert_baseline_pickle():
+    # whole-object pickles of earlier versions lack the attributes added since, and can be converted and loaded.
+    # The pickle is stripped from a current model, as repro.np in the repository root predates these versions.
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(
+        epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR, n_lags=6, n_forecasts=3, quantiles=[0.1, 0.9]
+    )
+    m.fit(df, freq="D")
+    forecast = m.predict(df)
+    for attr in ["component_curves", "profiler", "train_end_ds"]:
+        vars(m).pop(attr, None)
+    for attr in ["precision", "compile"]:
+        vars(m.config_train).pop(attr, None)
+    for attr in ["use_compile", "unstack_plans", "compiled_forward"]:
+        vars(m.model).pop(attr, None)
+    for name in ["quantile_crossing_index", "quantile_crossing_inverse", "quantile_signs"]:
+        delattr(m.model, name)
+    for attr in ["_segment_tables", "_segment_tables_key"]:
+        vars(m.model.trend).pop(attr, None)
+    buffer_torch = io.BytesIO()
+    save(m, buffer_torch, format="torch")
+    buffer_torch.seek(0)
+    buffer_converted = io.BytesIO()
+    convert(buffer_torch, buffer_converted)
+    buffer_converted.seek(0)
+    m2 = load(buffer_converted)
+    assert m2.model.use_compile is False
+    assert m2.config_train.precision == "32-true"
+    pd.testing.assert_frame_equal(forecast, m2.predict(df))
+
+
+def test_state_format_version():
+    buffer = io.BytesIO()
+    utils_serialization.write_state(
+        buffer, {"format_version": utils_serialization.FORMAT_VERSION + 1}, {"x": torch.ones(3)}
+    )
+    buffer.seek(0)
+    with pytest.raises(ValueError):
+        utils_serialization.read_state(buffer)
+
+    buffer = io.BytesIO()
+    tensors = {"x": torch.arange(5, dtype=torch.float32), "y": np.arange(3, dtype=np.int16), "z": torch.ones(2, 3)}
+    utils_serialization.write_state(buffer, {"format_version": utils_serialization.FORMAT_VERSION}, tensors)
+    buffer.seek(0)
+    header, loaded = utils_serialization.read_state(buffer)
+    assert list(header["tensors"].keys()) == ["x", "y", "z"]
+    assert torch.equal(loaded["x"], tensors["x"])
+    assert np.array_equal(loaded["y"], tensors["y"]) and loaded["y"].dtype == np.int16
+    assert torch.equal(loaded["z"], tensors["z"])
+
+
 # def test_continue_training_checkpoint():
 #     df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
 #     m = NeuralProphet(
@@ -4,9 +4,11 @@ import logging
 import os
 import pathlib
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from neuralprophet import NeuralProphet
+from neuralprophet import NeuralProphet, configure, set_random_seed
 
 log = logging.getLogger("NP.test")
 log.setLevel("ERROR")
@@ -80,3 +82,58 @@ def test_custom_lr_scheduler():
         scheduler="OneCycleLR",
     )
     print(f"metrics = {metrics}")
+
+
+@pytest.mark.parametrize(
+    "data_file, model_args",
+    [
+        (PEYTON_FILE, {"n_lags": 14, "n_forecasts": 7, "ar_layers": [32, 32]}),
+        (AIR_FILE, {"n_lags": 12, "n_forecasts": 3, "quantiles": [0.1, 0.9], "seasonality_mode": "multiplicative"}),
+    ],
+)
+def test_bf16_precision(data_file, model_args):
+    # bf16 autocast must match float32 accuracy closely
+    df = pd.read_csv(data_file, nrows=NROWS)
+    df["A"] = df["y"].rolling(7, min_periods=1).mean()
+    errors, dtypes = {}, {}
+    for precision in ["32", "bf16"]:
+        set_random_seed(0)
+        m = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=0.1, precision=precision, **model_args)
+        m.add_lagged_regressor("A", n_lags=3)
+        m.fit(df, freq="auto")
+        forecast = m.predict(df)
+        dtypes[precision] = forecast["yhat1"].dtype
+        errors[precision] = np.nanmean(np.abs(forecast["yhat1"] - forecast["y"]))
+    log.info(f"MAE by precision: {errors}")
+    assert dtypes["bf16"] == dtypes["32"]
+    assert errors["bf16"] < 1.1 * errors["32"]
+
+
+def test_precision_options():
+    config_train = configure.Train(**generate_config_train_params({"precision": "bf16"}))
+    assert config_train.precision == "bf16-mixed"
+    with pytest.raises(ValueError):
+        configure.Train(**generate_config_train_params({"precision": "16"}))
+
+    # Precision set in fit() overrides the model config and is used by the trainer
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=1, batch_size=BATCH_SIZE, learning_rate=LR)
+    m.fit(df, freq="D", precision="bf16")
+    assert m.trainer.precision == "bf16-mixed"
+    forecast = m.predict(df)
+
+    # Predicting without a trainer uses the same autocast
+    m.trainer = None
+    pd.testing.assert_frame_equal(forecast, m.predict(df))
+
+
+def test_compile():
+    # compiled forward must match the eager forward, and the model must remain serializable
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=2, batch_size=BATCH_SIZE, learning_rate=LR, n_lags=7, n_forecasts=3, compile=True)
+    m.fit(df, freq="D")
+    forecast = m.predict(df)
+    m.model.use_compile = False
+    forecast_eager = m.predict(df)
+    assert np.allclose(forecast["yhat3"], forecast_eager["yhat3"], atol=1e-4, equal_nan=True)
+    assert "compiled_forward" not in m.model.__getstate__()
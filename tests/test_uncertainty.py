@@ -4,10 +4,12 @@ import logging
 import os
 import pathlib
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from neuralprophet import NeuralProphet, uncertainty_evaluate
+from neuralprophet.uncertainty import Conformal, OnlineConformal
 
 log = logging.getLogger("NP.test")
 log.setLevel("ERROR")
@@ -241,3 +243,122 @@ def test_asymmetrical_quantiles():
         decompose=decompose,
     )
     uncertainty_evaluate(forecast)
+
+
+def test_conformal_q_hats_per_step():
+    log.info("testing: Conformal q-hats of all forecast steps")
+    n_forecasts = 12
+    df_cal = pd.DataFrame({"y": np.zeros(100)})
+    for step_number in range(1, n_forecasts + 1):
+        # absolute residuals 1, ..., 100 of step 1, scaled with the step number, with a missing forecast
+        residuals = step_number * np.arange(1.0, 101.0)
+        residuals[0] = np.nan
+        df_cal[f"yhat{step_number}"] = residuals
+        df_cal[f"yhat{step_number} 5.0%"] = residuals - 1
+        df_cal[f"yhat{step_number} 95.0%"] = residuals + 1
+    df_test = df_cal.iloc[1:5].reset_index(drop=True)
+
+    c = Conformal(alpha=0.1, method="naive", n_forecasts=n_forecasts, quantiles=[0.5, 0.05, 0.95])
+    forecast = c.predict(df=df_test, df_cal=df_cal)
+    # the int(99 * 0.1) = 9th largest of the 99 scores 2, ..., 100
+    np.testing.assert_array_equal(c.q_hats["q_hat_sym"], 92.0 * np.arange(1, n_forecasts + 1))
+    np.testing.assert_array_equal(c.noncon_scores["noncon_scores"], np.arange(2.0, 101.0))
+    np.testing.assert_array_equal(forecast["yhat12 95.0%"], df_test["yhat12"] + 12 * 92.0)
+    assert list(forecast.columns) == list(df_test.columns)
+
+    c = Conformal(alpha=(0.1, 0.2), method="cqr", n_forecasts=n_forecasts, quantiles=[0.5, 0.05, 0.95])
+    forecast = c.predict(df=df_test, df_cal=df_cal, show_all_PI=True)
+    assert list(c.q_hats.columns) == ["q_hat_lo", "q_hat_hi"]
+    assert len(c.q_hats) == n_forecasts
+    # each conformal interval is added once, followed by the quantile regression intervals of its step
+    assert not forecast.columns.duplicated().any()
+    assert list(forecast.columns[-2:]) == ["yhat12 5.0%", "yhat12 95.0%"]
+
+
+def test_online_conformal():
+    log.info("testing: Online conformal prediction")
+    n_forecasts = 3
+    rng = np.random.default_rng(0)
+    df_cal = pd.DataFrame({"y": rng.normal(size=90)})
+    for step_number in range(1, n_forecasts + 1):
+        df_cal[f"yhat{step_number}"] = rng.normal(size=90)
+        df_cal[f"yhat{step_number} 5.0%"] = df_cal[f"yhat{step_number}"] - 1
+        df_cal[f"yhat{step_number} 95.0%"] = df_cal[f"yhat{step_number}"] + 1
+    df_cal.loc[:5, "yhat3"] = np.nan
+    df_test = df_cal.iloc[:10].reset_index(drop=True)
+
+    for method, alpha in [("naive", 0.1), ("cqr", 0.1), ("cqr", (0.05, 0.1))]:
+        args = {"alpha": alpha, "method": method, "n_forecasts": n_forecasts, "quantiles": [0.5, 0.05, 0.95]}
+        # incremental updates with all scores are identical to calibrating with all data at once
+        c = Conformal(**args)
+        forecast = c.predict(df=df_test, df_cal=df_cal)
+        c_online = OnlineConformal(**args)
+        for start in range(0, 90, 30):
+            c_online.update(df_cal.iloc[start : start + 30])
+        pd.testing.assert_frame_equal(c_online.q_hats, c.q_hats)
+        pd.testing.assert_frame_equal(c_online.predict(df_test), forecast)
+        # with a window, the q-hats are those of the most recent scores
+        c_window = OnlineConformal(**args, window=40)
+        for start in range(0, 90, 30):
+            c_window.update(df_cal.iloc[start : start + 30])
+        c_recent = Conformal(**args)
+        c_recent.predict(df=df_test, df_cal=df_cal.iloc[-40:])
+        pd.testing.assert_frame_equal(c_window.q_hats, c_recent.q_hats)
+
+    with pytest.raises(ValueError):
+        OnlineConformal(alpha=0.1, method="naive", n_forecasts=n_forecasts, quantiles=[0.5]).predict(df_test)
+
+    df = pd.read_csv(AIR_FILE)
+    m = NeuralProphet(quantiles=[0.05, 0.95], epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR)
+    train_df, test_df = m.split_df(df, freq="MS", valid_p=0.2)
+    train_df, cal_df = m.split_df(train_df, freq="MS", valid_p=0.15)
+    m.fit(train_df, freq="MS")
+    calibrator = m.conformal_calibrator(cal_df, alpha=0.1, method="cqr")
+    forecast = m.conformal_predict(test_df, calibration_df=cal_df, alpha=0.1, method="cqr")
+    pd.testing.assert_frame_equal(calibrator.predict(m.predict(test_df)), forecast)
+
+
+def test_uncertainty_evaluate_per_id_and_window():
+    log.info("testing: Uncertainty evaluation per ID and rolling window")
+    rng = np.random.default_rng(0)
+    n_rows, n_forecasts = 20, 2
+    dfs = []
+    for df_name, width in [("b", 2.0), ("a", 4.0)]:
+        df = pd.DataFrame({"ds": pd.date_range("2022-01-01", periods=n_rows, freq="D"), "y": rng.normal(size=n_rows)})
+        for step_number in range(1, n_forecasts + 1):
+            df[f"yhat{step_number}"] = 0.0
+            df[f"yhat{step_number} 5.0%"] = -width / 2 * step_number
+            df[f"yhat{step_number} 95.0%"] = width / 2 * step_number
+        df["ID"] = df_name
+        dfs.append(df)
+    df_global = pd.concat(dfs, ignore_index=True)
+
+    def expected_metrics(df):
+        metrics = []
+        for step_number in range(1, n_forecasts + 1):
+            lo, hi = df[f"yhat{step_number} 5.0%"], df[f"yhat{step_number} 95.0%"]
+            metrics += [(hi - lo).mean(), 1 - ((df["y"] >= lo) & (df["y"] <= hi)).mean()]
+        return metrics
+
+    df_eval = uncertainty_evaluate(df_global)
+    assert list(df_eval.columns) == [
+        (f"yhat{step_number}", metric)
+        for step_number in range(1, n_forecasts + 1)
+        for metric in ["interval_width", "miscoverage_rate"]
+    ]
+    np.testing.assert_allclose(df_eval.iloc[0].values, expected_metrics(df_global))
+
+    df_eval = uncertainty_evaluate(df_global, per_id=True)
+    assert list(df_eval.index) == ["a", "b"]
+    for df in dfs:
+        np.testing.assert_allclose(df_eval.loc[df["ID"].iloc[0]].values, expected_metrics(df))
+
+    window = 5
+    df_eval = uncertainty_evaluate(df_global, per_id=True, window=window)
+    assert len(df_eval) == 2 * (n_rows - window + 1)
+    for df in dfs:
+        for end in [window, n_rows]:
+            np.testing.assert_allclose(
+                df_eval.loc[(df["ID"].iloc[0], df["ds"].iloc[end - 1])].values,
+                expected_metrics(df.iloc[end - window : end]),
+            )
@@ -3,14 +3,28 @@
 import logging
 import os
 import pathlib
+import subprocess
+import sys
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pytest
+import torch
 from torch.utils.data import DataLoader
 
-from neuralprophet import NeuralProphet, configure, configure_components, df_utils, time_dataset, utils_time_dataset
+from neuralprophet import (
+    NeuralProphet,
+    configure,
+    configure_components,
+    df_utils,
+    set_random_seed,
+    time_dataset,
+    utils,
+    utils_time_dataset,
+)
+from neuralprophet.components.router import get_trend
+from neuralprophet.crossvalidation import attach_dataframe, cross_validate, share_dataframe
 from neuralprophet.data.process import _handle_missing_data
 from neuralprophet.data.transform import _normalize
 
@@ -360,6 +374,151 @@ def test_cv():
     )
 
 
+def _cross_validate_model_factory():
+    return NeuralProphet(n_lags=3, n_forecasts=2, epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR)
+
+
+def test_cross_validate():
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = _cross_validate_model_factory()
+    folds = m.crossvalidation_split_df(df, freq="D", k=3, fold_pct=0.1, fold_overlap_pct=0.5)
+    fit_kwargs = {"progress": None}
+    fold_metrics, summary = cross_validate(
+        _cross_validate_model_factory, df, k=3, freq="D", num_workers=1, fit_kwargs=fit_kwargs
+    )
+    assert list(fold_metrics.index) == [0, 1, 2]
+    assert list(fold_metrics["n_train"]) == [len(df_train) for df_train, _ in folds]
+    assert list(fold_metrics["n_val"]) == [len(df_val) for _, df_val in folds]
+    assert "MAE_val" in fold_metrics.columns
+    assert list(summary.index) == ["mean", "std"]
+    # folds fitted in worker processes, sharing the base dataframe
+    fold_metrics_parallel, _ = cross_validate(
+        _cross_validate_model_factory, df, k=3, freq="D", num_workers=2, num_threads=1, fit_kwargs=fit_kwargs
+    )
+    pd.testing.assert_frame_equal(
+        fold_metrics_parallel[["n_train", "n_val"]], fold_metrics[["n_train", "n_val"]], check_dtype=False
+    )
+
+
+def test_cross_validate_keeps_shared_memory_tracked():
+    # the resource tracker of a fresh process reports to the captured stderr when a block is unlinked
+    script = f"""
+import functools
+import pandas as pd
+from neuralprophet import NeuralProphet, cross_validate
+
+if __name__ == "__main__":
+    df = pd.read_csv({PEYTON_FILE!r}, nrows={NROWS})
+    model_factory = functools.partial(
+        NeuralProphet, n_lags=3, n_forecasts=2, epochs={EPOCHS}, batch_size={BATCH_SIZE}, learning_rate={LR}
+    )
+    cross_validate(model_factory, df, k=3, freq="D", num_workers=2, num_threads=1, fit_kwargs={{"progress": None}})
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=600)
+    assert result.returncode == 0, result.stderr
+    assert "resource_tracker" not in result.stderr
+    assert "KeyError" not in result.stderr
+
+
+def _impute_fold(m, df):
+    return _handle_missing_data(
+        df=df,
+        freq="D",
+        n_lags=m.config_ar.n_lags,
+        n_forecasts=m.config_model.n_forecasts,
+        config_missing=m.config_missing,
+        config_regressors=m.config_regressors,
+        config_lagged_regressors=m.config_lagged_regressors,
+        config_events=m.config_events,
+        config_seasonality=m.config_seasonality,
+        predicting=False,
+    )
+
+
+def test_crossvalidation_fold_ranges():
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df["ds"] = pd.to_datetime(df["ds"])
+    m = NeuralProphet(n_lags=3, n_forecasts=2)
+    folds = m.crossvalidation_split_df(df, freq="D", k=3, fold_pct=0.1, fold_overlap_pct=0.5)
+    df_base, fold_ranges, freq = m.crossvalidation_fold_ranges(df, freq="D", k=3, fold_pct=0.1, fold_overlap_pct=0.5)
+    assert freq == "D"
+    # the base dataframe is completed with the missing dates, but not imputed
+    df_complete = df.set_index("ds").asfreq("D").reset_index().assign(ID="__df__")
+    assert df_complete["y"].isna().any()
+    np.testing.assert_array_equal(df_base["ds"].to_numpy(), df_complete["ds"].to_numpy())
+    np.testing.assert_allclose(df_base["y"].to_numpy(), df_complete["y"].to_numpy())
+    # the folds cover the same dates as the folds of crossvalidation_split_df, each imputed on its own
+    for (df_train, df_val), (train_rows, val_rows) in zip(folds, fold_ranges):
+        for df_fold, rows in [(df_train, train_rows), (df_val, val_rows)]:
+            df_rows = df_utils.select_rows(df_base, rows)
+            np.testing.assert_array_equal(df_rows["ds"].to_numpy(), df_fold["ds"].to_numpy())
+            df_expected = df_complete[df_complete["ds"].isin(df_fold["ds"])].reset_index(drop=True)
+            pd.testing.assert_frame_equal(
+                _impute_fold(m, df_rows)[["ds", "y"]].reset_index(drop=True),
+                _impute_fold(m, df_expected)[["ds", "y"]].reset_index(drop=True),
+            )
+
+    # without gaps, fitting on a fold of the base dataframe is identical to fitting on the fold data
+    y = pd.read_csv(PEYTON_FILE, nrows=NROWS)["y"].to_numpy()
+    df = pd.DataFrame({"ds": pd.date_range(start="2017-01-01", periods=NROWS), "y": y})
+    folds = m.crossvalidation_split_df(df, freq="D", k=3, fold_pct=0.1, fold_overlap_pct=0.5)
+    df_base, fold_ranges, _ = m.crossvalidation_fold_ranges(df, freq="D", k=3, fold_pct=0.1, fold_overlap_pct=0.5)
+    assert not df_base["y"].isna().any()
+    df_train, df_val = folds[0]
+    train_rows, val_rows = fold_ranges[0]
+    metrics = []
+    for fit_args in [
+        {"df": df_train, "validation_df": df_val},
+        {"df": df_base, "rows": train_rows, "validation_rows": val_rows},
+    ]:
+        set_random_seed(0)
+        m_fold = NeuralProphet(n_lags=3, n_forecasts=2, epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR)
+        metrics.append(m_fold.fit(freq="D", progress=None, **fit_args))
+    pd.testing.assert_frame_equal(metrics[0], metrics[1])
+    with pytest.raises(ValueError):
+        NeuralProphet().fit(df_base, freq="D", validation_rows=val_rows)
+
+
+def test_crossvalidation_fold_ranges_impute_per_fold():
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df["ds"] = pd.to_datetime(df["ds"])
+    df_complete = df.set_index("ds").asfreq("D").reset_index()
+    m = NeuralProphet(n_lags=3, n_forecasts=2)
+    _, fold_ranges, _ = m.crossvalidation_fold_ranges(df, freq="D", k=3, fold_pct=0.1, fold_overlap_pct=0.5)
+    train_rows, val_rows = fold_ranges[0]
+    # missing values in the validation period of the first fold are left for the fold to impute
+    missing = np.arange(val_rows[0][0] + 5, val_rows[0][0] + 8)
+    df_complete.loc[missing, "y"] = np.nan
+    df_base, _, _ = m.crossvalidation_fold_ranges(df_complete, freq="D", k=3, fold_pct=0.1, fold_overlap_pct=0.5)
+    assert len(df_base) == len(df_complete)
+    np.testing.assert_allclose(df_base["y"].to_numpy(), df_complete["y"].to_numpy())
+    m = NeuralProphet(n_lags=3, n_forecasts=2, epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR)
+    metrics = m.fit(df_base, freq="D", rows=train_rows, validation_rows=val_rows, progress=None)
+    assert metrics["MAE_val"].notna().all()
+
+
+def test_share_dataframe():
+    df = pd.DataFrame(
+        {
+            "ds": pd.date_range(start="2022-01-01", periods=5),
+            "y": np.arange(5, dtype=np.float64),
+            "ID": ["a", "a", "b", "b", "b"],
+            "text": ["x", None, "y", "x", "y"],
+        }
+    )
+    shms, spec = share_dataframe(df)
+    try:
+        df_shared, attached = attach_dataframe(spec)
+        pd.testing.assert_frame_equal(df_shared, df)
+        assert list(df_shared["text"].isna()) == [False, True, False, False, False]
+        for shm in attached:
+            shm.close()
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+
 def test_cv_for_global_model():
     def check_folds_dict(
         df, n_lags, n_forecasts, valid_fold_num, valid_fold_pct, fold_overlap_pct, global_model_cv_type="local"
@@ -1063,3 +1222,224 @@ def test_float32_inputs():
     m.fit(df, freq="D")
     forecast = m.predict(df)
     assert forecast["yhat1"].dtype == np.float32
+
+
+@pytest.mark.parametrize("trend_reg", [0, 1.0])
+@pytest.mark.parametrize("growth", ["linear", "discontinuous"])
+@pytest.mark.parametrize("trend_global_local", ["global", "local"])
+def test_piecewise_linear_trend_segment_lookup(trend_reg, growth, trend_global_local):
+    # the searchsorted based trend forward must match the one-hot reference implementation
+    torch.manual_seed(0)
+    id_list = ["a", "b", "c"] if trend_global_local == "local" else ["__df__"]
+    config_trend = configure_components.Trend(
+        growth=growth,
+        changepoints=None,
+        n_changepoints=100,
+        changepoints_range=0.8,
+        trend_reg=trend_reg,
+        trend_reg_threshold=False,
+        trend_global_local=trend_global_local,
+        trend_local_reg=False,
+    )
+    trend = get_trend(
+        config=config_trend,
+        n_forecasts=24,
+        quantiles=[0.5, 0.1, 0.9],
+        id_list=id_list,
+        num_trends_modelled=len(id_list),
+        device=torch.device("cpu"),
+    )
+    with torch.no_grad():
+        for param in trend.parameters():
+            param.normal_()
+    t = torch.rand(size=(32, 24)) * 1.2 - 0.1
+    # include times exactly on changepoints
+    t[0, :20] = trend.trend_changepoints_t[:20]
+    meta = torch.randint(low=0, high=len(id_list), size=(32,))
+    expected = trend.forward_one_hot(t, meta)
+    result = trend(t, meta)
+    assert result.shape == expected.shape
+    assert torch.allclose(result, expected, atol=1e-5)
+
+
+def test_piecewise_linear_trend_segment_tables_cache():
+    # segment tables are reused when no gradients are required, and rebuilt after parameter updates
+    config_trend = configure_components.Trend(
+        growth="linear",
+        changepoints=None,
+        n_changepoints=10,
+        changepoints_range=0.8,
+        trend_reg=0,
+        trend_reg_threshold=False,
+        trend_global_local="global",
+        trend_local_reg=False,
+    )
+    trend = get_trend(
+        config=config_trend,
+        n_forecasts=1,
+        quantiles=[0.5],
+        id_list=["__df__"],
+        num_trends_modelled=1,
+        device=torch.device("cpu"),
+    )
+    t = torch.linspace(0, 1, 50).unsqueeze(dim=1)
+    with torch.no_grad():
+        tables = trend.get_segment_tables()
+        assert trend.get_segment_tables() is tables
+        trend.trend_deltas.add_(1.0)
+        assert trend.get_segment_tables() is not tables
+        result = trend(t, None)
+    assert trend.get_segment_tables() is not trend._segment_tables
+    assert torch.allclose(result, trend(t, None))
+
+
+def test_components_stacker_slice_plan():
+    # unstacking with the precomputed slice plan must return views of the batch with the expected layout
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df["A"] = df["y"].rolling(7, min_periods=1).mean()
+    df["B"] = df["y"].rolling(3, min_periods=1).mean()
+    m = NeuralProphet(epochs=1, batch_size=BATCH_SIZE, learning_rate=LR, n_lags=3, n_forecasts=2)
+    m.add_lagged_regressor("A", n_lags=5)
+    m.add_future_regressor("B")
+    m.fit(df, freq="D")
+    stacker = m.model.components_stacker["train"]
+    max_lags = stacker.max_lags
+    assert max_lags == 5
+    batch = torch.rand(size=(4, max_lags + 2, max(end for _, end in stacker.feature_indices.values()) + 1))
+
+    start, _ = stacker.feature_indices["targets"]
+    targets = stacker.unstack("targets", batch)
+    assert torch.equal(targets, batch[:, max_lags:, start].unsqueeze(2))
+    assert targets.data_ptr() == batch[:, max_lags:, start:].data_ptr()
+    start, _ = stacker.feature_indices["time"]
+    assert torch.equal(stacker.unstack_time(batch), batch[:, max_lags - 3 :, start])
+    start, _ = stacker.feature_indices["lags"]
+    assert torch.equal(stacker.unstack_lags(batch), batch[:, max_lags - 3 : max_lags, start])
+    start, _ = stacker.feature_indices["lagged_regressor_A"]
+    lagged_regressors = stacker.unstack("lagged_regressors", batch)
+    assert list(lagged_regressors.keys()) == ["A"]
+    assert torch.equal(lagged_regressors["A"], batch[:, :max_lags, start])
+    start, end = stacker.feature_indices["additive_regressors"]
+    assert torch.equal(stacker.unstack_additive_regressors(batch), batch[:, max_lags - 3 :, start : end + 1])
+    seasonalities = stacker.unstack("seasonalities", batch)
+    assert list(seasonalities.keys()) == list(m.config_seasonality.periods.keys())
+    for name, features in seasonalities.items():
+        start, end = stacker.feature_indices[f"seasonality_{name}"]
+        assert torch.equal(features, batch[:, max_lags - 3 :, start:end])
+
+    # without lags, samples are single rows and the forecast dimension is inserted
+    m = NeuralProphet(epochs=1, batch_size=BATCH_SIZE, learning_rate=LR)
+    m.fit(df[["ds", "y"]], freq="D")
+    stacker = m.model.components_stacker["train"]
+    batch = torch.rand(size=(4, max(end for _, end in stacker.feature_indices.values()) + 1))
+    start, end = stacker.feature_indices["targets"]
+    assert torch.equal(stacker.unstack_targets(batch), batch[:, start : end + 1].unsqueeze(1))
+    start, end = stacker.feature_indices["time"]
+    assert torch.equal(stacker.unstack_time(batch), batch[:, start : end + 1])
+    for name, features in stacker.unstack_seasonalities(batch).items():
+        start, end = stacker.feature_indices[f"seasonality_{name}"]
+        assert torch.equal(features, batch[:, start:end].unsqueeze(1))
+
+
+def test_predict_seasonal_components_restores_predict_stacker():
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=1, batch_size=BATCH_SIZE, learning_rate=LR, n_lags=3, n_forecasts=2)
+    m.fit(df, freq="D")
+    forecast = m.predict(m.make_future_dataframe(df, n_historic_predictions=True))
+    stacker = m.model.components_stacker["predict"]
+    m.predict_seasonal_components(df)
+    # the stacker and its unstack plan are restored together
+    assert m.model.components_stacker["predict"] is stacker
+    assert m.model.unstack_plans["predict"] == m.model._resolve_unstack_plan(stacker)
+    pd.testing.assert_frame_equal(m.predict(m.make_future_dataframe(df, n_historic_predictions=True)), forecast)
+
+
+def test_fcst_df_to_latest_forecast():
+    # origin-i holds the forecast made i steps before the latest forecast, as float columns
+    n_forecasts, n_rows = 3, 8
+    quantiles = [0.5, 0.1, 0.9]
+    fcst = pd.DataFrame({"ds": pd.date_range("2022-01-01", periods=n_rows, freq="D"), "y": np.arange(n_rows) * 1.0})
+    for quantile_idx, quantile in enumerate(quantiles):
+        for step in range(1, n_forecasts + 1):
+            name = f"yhat{step}" if quantile_idx == 0 else f"yhat{step} {round(quantile * 100, 1)}%"
+            fcst[name] = 100 * quantile_idx + 10 * step + np.arange(n_rows)
+    latest = utils.fcst_df_to_latest_forecast(fcst, quantiles, n_last=2)
+    assert list(latest.columns) == [
+        "ds",
+        "y",
+        "origin-1",
+        "origin-1 10.0%",
+        "origin-1 90.0%",
+        "origin-0",
+        "origin-0 10.0%",
+        "origin-0 90.0%",
+    ]
+    assert all(latest[col].dtype == np.float64 for col in latest.columns[2:])
+    for i in range(2):
+        rows = np.arange(n_rows - n_forecasts - i, n_rows - i)
+        for quantile_idx, suffix in enumerate(["", " 10.0%", " 90.0%"]):
+            expected = np.full(n_rows, np.nan)
+            expected[rows] = 100 * quantile_idx + 10 * np.arange(1, n_forecasts + 1) + rows
+            np.testing.assert_array_equal(latest[f"origin-{i}{suffix}"].values, expected)
+    with pytest.raises(ValueError):
+        utils.fcst_df_to_latest_forecast(fcst.iloc[-3:], quantiles, n_last=2)
+
+
+def test_quantile_forecasts_from_diffs():
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR, quantiles=[0.1, 0.3, 0.7, 0.9])
+    m.fit(df, freq="D")
+    model = m.model
+    assert model.quantiles == [0.5, 0.1, 0.3, 0.7, 0.9]
+    # diffs of the quantiles from the median, the 0.3 and 0.7 quantiles crossing the median
+    diffs = torch.tensor([[[1.0, 0.5, -0.2, -0.1, 0.3]]])
+    torch.testing.assert_close(
+        model._compute_quantile_forecasts_from_diffs(diffs, predict_mode=False),
+        torch.tensor([[[1.0, 0.5, 1.2, 0.9, 1.3]]]),
+    )
+    torch.testing.assert_close(
+        model._compute_quantile_forecasts_from_diffs(diffs, predict_mode=True),
+        torch.tensor([[[1.0, 0.5, 1.0, 1.0, 1.3]]]),
+    )
+    # crossing quantiles are ordered in predict mode, without changing the input
+    diffs = torch.randn(64, 3, 5)
+    diffs_before = diffs.clone()
+    out = model._compute_quantile_forecasts_from_diffs(diffs, predict_mode=True)
+    assert torch.equal(diffs, diffs_before)
+    ordered = out[:, :, [1, 2, 0, 3, 4]]
+    assert (ordered[:, :, 1:] >= ordered[:, :, :-1]).all()
+
+
+def test_profile():
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, batch_size=BATCH_SIZE, learning_rate=LR, n_lags=3)
+    with m.profile(memory=True) as profiler:
+        m.fit(df, freq="D")
+        m.predict(df)
+    assert m.profiler is None
+    report = profiler.report()
+    assert list(report.columns)[:6] == ["call", "method", "stage", "count", "seconds", "share"]
+    assert "memory_peak_mb" in report.columns
+    fit_stages = list(report.loc[report["method"] == "fit", "stage"])
+    assert fit_stages[0] == "total"
+    for stage in [
+        "check_dataframe",
+        "infer_frequency",
+        "normalize",
+        "create_dataset",
+        "configure_trainer",
+        "init_model",
+        "train",
+    ]:
+        assert stage in fit_stages
+    assert "lr_finder" not in fit_stages
+    predict_stages = list(report.loc[report["method"] == "predict", "stage"])
+    assert ["predict_raw", "predict_raw/create_dataset", "predict_raw/forward"] == [
+        stage for stage in predict_stages if stage.startswith("predict_raw")
+    ]
+    assert (report["seconds"] >= 0).all() and (report["memory_peak_mb"] >= 0).all()
+    totals = report[report["stage"] == "total"]
+    assert list(totals["call"]) == [1, 2] and (totals["share"] == 1.0).all()
+    # calls outside of the context are not profiled
+    m.predict(df)
+    assert profiler.report()["call"].max() == 2
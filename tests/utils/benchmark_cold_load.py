@@ -0,0 +1,71 @@
+import logging
+import os
+import pathlib
+import tempfile
+import time
+
+import pandas as pd
+
+from neuralprophet import NeuralProphet, load, save, set_random_seed
+
+log = logging.getLogger("NP.test")
+log.setLevel("ERROR")
+log.parent.setLevel("ERROR")
+
+DIR = pathlib.Path(__file__).parent.parent.parent.absolute()
+DATA_DIR = os.path.join(DIR, "tests", "test-data")
+PEYTON_FILE = os.path.join(DATA_DIR, "wp_log_peyton_manning.csv")
+NROWS = 1000
+EPOCHS = 2
+REPEATS = 20
+
+
+def fit(model_args):
+    set_random_seed(0)
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, learning_rate=0.1, **model_args)
+    m.fit(df, freq="D")
+    return m, df
+
+
+def time_first_forecast(path, df, eager_trainer):
+    """Median time from loading a model to its first forecast, optionally restoring the trainer on load."""
+    times = []
+    for _ in range(REPEATS):
+        tic = time.perf_counter()
+        m = load(path)
+        if eager_trainer:
+            m.restore_trainer()
+        future = m.make_future_dataframe(df, periods=m.config_model.n_forecasts)
+        m.predict(future)
+        times.append(time.perf_counter() - tic)
+    return pd.Series(times).median()
+
+
+def measure_cold_load():
+    cases = [
+        ("trend and seasonality", {}),
+        ("AR", {"n_lags": 14, "n_forecasts": 7}),
+    ]
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, model_args in cases:
+            m, df = fit(model_args)
+            df = df.iloc[-100:]
+            for format in ["torch", "state"]:
+                path = os.path.join(tmp_dir, f"{format}_model.np")
+                save(m, path, format=format)
+                for eager_trainer in [True, False]:
+                    rows.append(
+                        {
+                            "case": name,
+                            "format": format,
+                            "trainer": "eager" if eager_trainer else "lazy",
+                            "load to forecast [ms]": round(1000 * time_first_forecast(path, df, eager_trainer), 2),
+                        }
+                    )
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    measure_cold_load()
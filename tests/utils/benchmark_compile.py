@@ -0,0 +1,90 @@
+import logging
+import os
+import pathlib
+import time
+
+import pandas as pd
+import pytorch_lightning as pl
+
+from neuralprophet import NeuralProphet, set_random_seed
+
+log = logging.getLogger("NP.test")
+log.setLevel("ERROR")
+log.parent.setLevel("ERROR")
+
+DIR = pathlib.Path(__file__).parent.parent.parent.absolute()
+DATA_DIR = os.path.join(DIR, "tests", "test-data")
+PEYTON_FILE = os.path.join(DATA_DIR, "wp_log_peyton_manning.csv")
+YOS_FILE = os.path.join(DATA_DIR, "yosemite_temps.csv")
+EPOCHS = 6
+BATCH_SIZE = 128
+LR = 0.1
+
+
+class StepTimer(pl.Callback):
+    """Measures training steps per second, skipping the first epoch (includes compilation)."""
+
+    def __init__(self):
+        self.steps = 0
+        self.elapsed = 0.0
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx):
+        self.tic = time.perf_counter()
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx):
+        if trainer.current_epoch > 0:
+            self.steps += 1
+            self.elapsed += time.perf_counter() - self.tic
+
+    @property
+    def steps_per_sec(self):
+        return self.steps / self.elapsed if self.elapsed > 0 else float("nan")
+
+
+def run(data_file, freq, compile, n_lags, n_forecasts, ar_layers, nrows):
+    set_random_seed(0)
+    df = pd.read_csv(data_file, nrows=nrows)
+    timer = StepTimer()
+    m = NeuralProphet(
+        n_lags=n_lags,
+        n_forecasts=n_forecasts,
+        ar_layers=ar_layers,
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE,
+        learning_rate=LR,
+        compile=compile,
+        trainer_config={"callbacks": [timer]},
+    )
+    m.fit(df, freq=freq, progress=None, metrics=False)
+
+    # First prediction includes compilation of the predict graph
+    m.predict(df)
+    tic = time.perf_counter()
+    m.predict(df)
+    predict_time = time.perf_counter() - tic
+    return timer.steps_per_sec, predict_time
+
+
+def measure_times():
+    cases = [
+        ("peyton AR", PEYTON_FILE, "D", 14, 7, [], 3000),
+        ("peyton deep AR", PEYTON_FILE, "D", 30, 7, [64, 64], 3000),
+        ("yosemite AR", YOS_FILE, "5min", 36, 12, [32, 32], 10000),
+    ]
+    rows = []
+    for name, data_file, freq, n_lags, n_forecasts, ar_layers, nrows in cases:
+        for compile in [False, True]:
+            steps_per_sec, predict_time = run(data_file, freq, compile, n_lags, n_forecasts, ar_layers, nrows)
+            rows.append(
+                {
+                    "case": name,
+                    "compile": compile,
+                    "train steps/sec": round(steps_per_sec, 1),
+                    "predict time [s]": round(predict_time, 4),
+                }
+            )
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    measure_times()
@@ -0,0 +1,89 @@
+import logging
+import os
+import pathlib
+import time
+
+import pandas as pd
+import torch
+
+from neuralprophet import NeuralProphet, set_random_seed
+
+log = logging.getLogger("NP.test")
+log.setLevel("ERROR")
+log.parent.setLevel("ERROR")
+
+DIR = pathlib.Path(__file__).parent.parent.parent.absolute()
+DATA_DIR = os.path.join(DIR, "tests", "test-data")
+PEYTON_FILE = os.path.join(DATA_DIR, "wp_log_peyton_manning.csv")
+REPEATS = 200
+
+
+def reference_quantile_forecasts(quantiles, diffs, predict_mode):
+    """Quantile forecasts from diffs, correcting crossing quantiles one quantile after the other."""
+    diffs = diffs.clone()
+    divider = next((i for i, quantile in enumerate(quantiles) if quantile > 0.5), len(quantiles))
+    out = torch.zeros_like(diffs)
+    out[:, :, 0] = diffs[:, :, 0]
+    median = diffs[:, :, :1].detach()
+    upper = diffs[:, :, divider:]
+    lower = diffs[:, :, 1:divider]
+    if predict_mode:
+        if upper.shape[-1] > 0:
+            upper[:, :, 0] = torch.max(torch.tensor(0), upper[:, :, 0])
+            for i in range(upper.shape[-1] - 1):
+                upper[:, :, i + 1] = torch.max(upper[:, :, i + 1], upper[:, :, i])
+        if lower.shape[-1] > 0:
+            lower[:, :, -1] = torch.max(torch.tensor(0), lower[:, :, -1])
+            for i in range(lower.shape[-1] - 1, 0, -1):
+                lower[:, :, i - 1] = torch.max(lower[:, :, i - 1], lower[:, :, i])
+    out[:, :, divider:] = upper + median
+    out[:, :, 1:divider] = -lower + median
+    return out
+
+
+def fit(quantiles):
+    set_random_seed(0)
+    df = pd.read_csv(PEYTON_FILE, nrows=100)
+    m = NeuralProphet(epochs=1, learning_rate=0.1, n_changepoints=2, quantiles=quantiles)
+    m.fit(df, freq="D", progress=None, metrics=False)
+    return m.model
+
+
+def time_function(function, diffs):
+    tic = time.perf_counter()
+    for _ in range(REPEATS):
+        function(diffs)
+    return 1e6 * (time.perf_counter() - tic) / REPEATS
+
+
+def measure_quantile_crossing():
+    rows = []
+    for n_quantiles in [3, 9, 19]:
+        quantiles = [round(q, 3) for q in torch.linspace(0, 1, n_quantiles + 2)[1:-1].tolist() if round(q, 3) != 0.5]
+        model = fit(quantiles)
+        for batch_size, n_forecasts in [(128, 1), (128, 24), (4096, 24)]:
+            diffs = torch.randn(batch_size, n_forecasts, len(model.quantiles))
+            for predict_mode in [False, True]:
+                expected = reference_quantile_forecasts(model.quantiles, diffs, predict_mode)
+                actual = model._compute_quantile_forecasts_from_diffs(diffs.clone(), predict_mode)
+                assert torch.equal(actual, expected), "Results differ from the reference implementation."
+                reference_us = time_function(
+                    lambda d: reference_quantile_forecasts(model.quantiles, d, predict_mode), diffs
+                )
+                fused_us = time_function(lambda d: model._compute_quantile_forecasts_from_diffs(d, predict_mode), diffs)
+                rows.append(
+                    {
+                        "quantiles": len(model.quantiles),
+                        "batch": batch_size,
+                        "n_forecasts": n_forecasts,
+                        "mode": "predict" if predict_mode else "train",
+                        "reference [us]": round(reference_us, 1),
+                        "fused [us]": round(fused_us, 1),
+                        "speedup": round(reference_us / fused_us, 2),
+                    }
+                )
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    measure_quantile_crossing()
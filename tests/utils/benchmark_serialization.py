@@ -0,0 +1,68 @@
+import logging
+import os
+import pathlib
+import tempfile
+import time
+
+import pandas as pd
+
+from neuralprophet import NeuralProphet, convert, load, save, set_random_seed
+
+log = logging.getLogger("NP.test")
+log.setLevel("ERROR")
+log.parent.setLevel("ERROR")
+
+DIR = pathlib.Path(__file__).parent.parent.parent.absolute()
+DATA_DIR = os.path.join(DIR, "tests", "test-data")
+PEYTON_FILE = os.path.join(DATA_DIR, "wp_log_peyton_manning.csv")
+NROWS = 1000
+EPOCHS = 2
+REPEATS = 20
+
+
+def fit(model_args):
+    set_random_seed(0)
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(epochs=EPOCHS, learning_rate=0.1, **model_args)
+    m.fit(df, freq="D")
+    return m
+
+
+def time_load(path):
+    times = []
+    for _ in range(REPEATS):
+        tic = time.perf_counter()
+        load(path)
+        times.append(time.perf_counter() - tic)
+    return pd.Series(times).median()
+
+
+def measure_load_times():
+    cases = [
+        ("trend and seasonality", {}),
+        ("AR", {"n_lags": 14, "n_forecasts": 7}),
+        ("deep AR with quantiles", {"n_lags": 60, "n_forecasts": 14, "ar_layers": [64, 64], "quantiles": [0.1, 0.9]}),
+    ]
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, model_args in cases:
+            m = fit(model_args)
+            torch_path = os.path.join(tmp_dir, "torch_model.np")
+            state_path = os.path.join(tmp_dir, "state_model.np")
+            save(m, torch_path, format="torch")
+            # models saved with torch.save are converted, as done for an existing models directory
+            convert(torch_path, state_path)
+            for format, path in [("torch", torch_path), ("state", state_path)]:
+                rows.append(
+                    {
+                        "case": name,
+                        "format": format,
+                        "size [kB]": round(os.path.getsize(path) / 1024, 1),
+                        "load time [ms]": round(1000 * time_load(path), 2),
+                    }
+                )
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    measure_load_times()
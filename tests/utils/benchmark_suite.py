@@ -0,0 +1,307 @@
+"""Performance benchmark suite of the core library, with results stored as JSON to compare them between commits.
+
+Usage
+-----
+    python tests/utils/benchmark_suite.py run --preset quick
+    python tests/utils/benchmark_suite.py run --preset full --benchmarks predict load --compare .benchmarks/abc1234.json
+    python tests/utils/benchmark_suite.py compare .benchmarks/abc1234.json .benchmarks/def5678.json
+
+Results are written to ``.benchmarks/<commit>.json`` by default. Each benchmark runs for every case of the parameter
+grid of the preset (rows, series, n_lags, n_forecasts), on synthetic daily data with trend, seasonality and noise.
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import torch
+
+import neuralprophet
+from neuralprophet import NeuralProphet, load, save, set_log_level, set_random_seed
+
+log = logging.getLogger("NP.test")
+log.setLevel("ERROR")
+log.parent.setLevel("ERROR")
+
+DIR = pathlib.Path(__file__).parent.parent.parent.absolute()
+RESULTS_DIR = os.path.join(DIR, ".benchmarks")
+EPOCHS = 5
+BATCH_SIZE = 64
+LR = 0.1
+# Relative change of a benchmark above which it is reported as a regression
+THRESHOLD = 0.1
+
+PRESETS = {
+    "quick": {
+        "grid": {"rows": [500], "series": [1, 4], "n_lags": [0, 12], "n_forecasts": [1, 7]},
+        "fit_repeats": 2,
+        "repeats": 5,
+    },
+    "full": {
+        "grid": {"rows": [1000, 4000], "series": [1, 10], "n_lags": [0, 24], "n_forecasts": [1, 24]},
+        "fit_repeats": 3,
+        "repeats": 10,
+    },
+}
+
+
+def generate_df(rows, series, seed=0):
+    """Daily time series with trend, weekly and yearly seasonality and noise, with an ``ID`` per series."""
+    rng = np.random.default_rng(seed)
+    ds = pd.date_range("2015-01-01", periods=rows, freq="D")
+    t = np.arange(rows)
+    dfs = []
+    for i in range(series):
+        y = (
+            10.0
+            + (0.01 + 0.002 * i) * t
+            + 2.0 * np.sin(2 * np.pi * (t + i) / 7)
+            + 3.0 * np.sin(2 * np.pi * t / 365.25)
+            + rng.normal(scale=0.5, size=rows)
+        )
+        dfs.append(pd.DataFrame({"ds": ds, "y": y, "ID": f"series_{i}"}))
+    return pd.concat(dfs, ignore_index=True)
+
+
+def get_cases(grid):
+    """Parameter cases of the grid, skipping multi-step forecasts without lags, which are forecasted one step."""
+    cases = []
+    for rows, series, n_lags, n_forecasts in product(grid["rows"], grid["series"], grid["n_lags"], grid["n_forecasts"]):
+        if n_lags == 0 and n_forecasts > 1:
+            continue
+        cases.append({"rows": rows, "series": series, "n_lags": n_lags, "n_forecasts": n_forecasts})
+    return cases
+
+
+def fit(case, df, quantiles=None):
+    """Fits a model of the case, profiling its stages."""
+    set_random_seed(0)
+    m = NeuralProphet(
+        n_lags=case["n_lags"],
+        n_forecasts=case["n_forecasts"],
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE,
+        learning_rate=LR,
+        quantiles=quantiles or [],
+    )
+    with m.profile() as profiler:
+        m.fit(df, freq="D", progress=None, metrics=False)
+    stages = profiler.report().set_index("stage")["seconds"]
+    return m, stages
+
+
+def time_repeats(function, repeats):
+    times = []
+    for _ in range(repeats):
+        tic = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - tic)
+    return times
+
+
+def bench_fit(case, df, settings):
+    """Time of creating the training dataset, and training steps per second."""
+    dataset_times, steps_per_second = [], []
+    for _ in range(settings["fit_repeats"]):
+        m, stages = fit(case, df)
+        dataset_times.append(stages["create_dataset"])
+        steps = m.config_train.epochs * m.config_train.batches_per_epoch
+        steps_per_second.append(steps / stages["train"])
+    return [
+        ("dataset", "s", False, dataset_times),
+        ("train", "steps/s", True, steps_per_second),
+    ]
+
+
+def bench_predict(case, df, settings):
+    """Latency of predicting the full history, and of forecasting the future of each series."""
+    m, _ = fit(case, df)
+    future = m.make_future_dataframe(df, periods=case["n_forecasts"], n_historic_predictions=False)
+    m.predict(future)
+    return [
+        ("predict", "s", False, time_repeats(lambda: m.predict(df), settings["repeats"])),
+        ("predict_future", "s", False, time_repeats(lambda: m.predict(future), settings["repeats"])),
+    ]
+
+
+def bench_conformal(case, df, settings):
+    """Time of calibrating conformal prediction intervals on a holdout set of each series."""
+    first_half = df.groupby("ID").cumcount() < case["rows"] // 2
+    df_train, df_cal = df[first_half], df[~first_half]
+    m, _ = fit(case, df_train, quantiles=[0.05, 0.95])
+    calibrate = lambda: m.conformal_calibrator(df_cal, alpha=0.1, method="cqr")  # noqa: E731
+    return [("conformal_calibration", "s", False, time_repeats(calibrate, settings["repeats"]))]
+
+
+def bench_load(case, df, settings):
+    """Time of loading a model saved in the state format, and of its first forecast."""
+    m, _ = fit(case, df)
+    buffer = io.BytesIO()
+    save(m, buffer, format="state")
+    future = m.make_future_dataframe(df, periods=case["n_forecasts"], n_historic_predictions=False)
+
+    def load_and_predict():
+        buffer.seek(0)
+        load(buffer).predict(future)
+
+    def load_only():
+        buffer.seek(0)
+        load(buffer)
+
+    return [
+        ("load", "s", False, time_repeats(load_only, settings["repeats"])),
+        ("load_and_predict", "s", False, time_repeats(load_and_predict, settings["repeats"])),
+    ]
+
+
+BENCHMARKS = {
+    "fit": bench_fit,
+    "predict": bench_predict,
+    "conformal": bench_conformal,
+    "load": bench_load,
+}
+
+
+def get_environment():
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=DIR, text=True).strip()
+        dirty = bool(subprocess.check_output(["git", "status", "--porcelain", "neuralprophet"], cwd=DIR, text=True))
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "neuralprophet": neuralprophet.__version__,
+        "python": platform.python_version(),
+        "torch": torch.__version__,
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "torch_threads": torch.get_num_threads(),
+    }
+
+
+def run(preset="quick", benchmarks=None):
+    """Runs the benchmarks for all cases of the preset.
+
+    Returns
+    -------
+        dict
+            ``environment`` of the run and its ``results``, one per benchmark and case, with the ``median``, ``min``
+            and ``max`` of the measured ``values``
+    """
+    settings = PRESETS[preset]
+    results = []
+    for case in get_cases(settings["grid"]):
+        df = generate_df(case["rows"], case["series"])
+        for name in benchmarks or BENCHMARKS:
+            tic = time.perf_counter()
+            for benchmark, unit, higher_is_better, values in BENCHMARKS[name](case, df, settings):
+                results.append(
+                    {
+                        "benchmark": benchmark,
+                        "params": case,
+                        "unit": unit,
+                        "higher_is_better": higher_is_better,
+                        "median": float(np.median(values)),
+                        "min": float(np.min(values)),
+                        "max": float(np.max(values)),
+                        "values": [float(value) for value in values],
+                    }
+                )
+            print(f"{name} {case}: {time.perf_counter() - tic:.1f}s", file=sys.stderr)
+    return {"preset": preset, "environment": get_environment(), "results": results}
+
+
+def to_frame(run_results):
+    df = pd.DataFrame(run_results["results"])
+    params = pd.DataFrame(list(df["params"]))
+    return pd.concat((df[["benchmark"]], params, df[["unit", "higher_is_better", "median"]]), axis=1)
+
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """Compares the median of each benchmark and case present in both runs.
+
+    Returns
+    -------
+        pd.DataFrame
+            medians of the ``baseline`` and ``current`` run, their relative ``change`` (positive if slower), and the
+            ``status``, ``regression`` or ``improvement`` if the change exceeds the threshold
+    """
+    keys = ["benchmark", "rows", "series", "n_lags", "n_forecasts", "unit", "higher_is_better"]
+    df = pd.merge(
+        to_frame(baseline).rename(columns={"median": "baseline"}),
+        to_frame(current).rename(columns={"median": "current"}),
+        on=keys,
+    )
+    # Relative change of the time, throughputs are inverted so that a positive change is always slower
+    ratio = df["current"] / df["baseline"]
+    df["change"] = np.where(df["higher_is_better"], 1 / ratio, ratio) - 1
+    df["status"] = np.select([df["change"] > threshold, df["change"] < -threshold], ["regression", "improvement"], "")
+    return df.drop(columns="higher_is_better")
+
+
+def print_comparison(baseline, current, threshold=THRESHOLD):
+    df = compare(baseline, current, threshold)
+    print(f"baseline: {baseline['environment']['commit']}, current: {current['environment']['commit']}")
+    print(df.to_string(index=False, float_format=lambda x: f"{x:.4g}"))
+    n_regressions = int((df["status"] == "regression").sum())
+    print(f"{n_regressions} regressions of {len(df)} benchmarks above {threshold:.0%}.")
+    return n_regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="run the benchmarks and store the results as JSON")
+    run_parser.add_argument("--preset", choices=list(PRESETS), default="quick")
+    run_parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=None)
+    run_parser.add_argument("--output", default=None, help="JSON file, defaults to .benchmarks/<commit>.json")
+    run_parser.add_argument("--compare", default=None, help="JSON file of a baseline run to compare to")
+    run_parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    compare_parser = subparsers.add_parser("compare", help="compare the results of two runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        sys.exit(1 if print_comparison(baseline, current, args.threshold) > 0 else 0)
+
+    set_log_level("ERROR")
+    results = run(args.preset, args.benchmarks)
+    output = args.output
+    if output is None:
+        commit = results["environment"]["commit"] or "unknown"
+        output = os.path.join(RESULTS_DIR, f"{commit[:10]}{'-dirty' if results['environment']['dirty'] else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {output}")
+    print(to_frame(results).to_string(index=False, float_format=lambda x: f"{x:.4g}"))
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        sys.exit(1 if print_comparison(baseline, results, args.threshold) > 0 else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import logging
+import os
+import pathlib
+import time
+
+import pandas as pd
+
+from neuralprophet import NeuralProphet, set_random_seed
+
+log = logging.getLogger("NP.test")
+log.setLevel("ERROR")
+log.parent.setLevel("ERROR")
+
+DIR = pathlib.Path(__file__).parent.parent.parent.absolute()
+DATA_DIR = os.path.join(DIR, "tests", "test-data")
+PEYTON_FILE = os.path.join(DATA_DIR, "wp_log_peyton_manning.csv")
+NROWS = 2000
+NEW_ROWS = [1, 7]
+EPOCHS = 20
+UPDATE_EPOCHS = 5
+
+
+def fit(model_args, df):
+    set_random_seed(0)
+    m = NeuralProphet(epochs=EPOCHS, learning_rate=0.1, **model_args)
+    tic = time.perf_counter()
+    m.fit(df, freq="D", progress=None, metrics=False)
+    return m, time.perf_counter() - tic
+
+
+def measure_update():
+    """Time of updating a fitted model with new rows, compared to retraining it on the full history."""
+    cases = [
+        ("trend and seasonality", {}),
+        ("AR", {"n_lags": 14, "n_forecasts": 7}),
+    ]
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    rows = []
+    for name, model_args in cases:
+        for n_new in NEW_ROWS:
+            m, _ = fit(model_args, df.iloc[:-n_new])
+            tic = time.perf_counter()
+            m.update(df, epochs=UPDATE_EPOCHS, progress=None)
+            update_time = time.perf_counter() - tic
+            _, retrain_time = fit(model_args, df)
+            rows.append(
+                {
+                    "case": name,
+                    "new rows": n_new,
+                    "update [s]": round(update_time, 3),
+                    "retrain [s]": round(retrain_time, 3),
+                    "speedup": round(retrain_time / update_time, 1),
+                }
+            )
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    measure_update()